@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Step 2 로컬 매칭 / 후보 축소 평가 스크립트
+네트워크 없이 라벨 데이터로 로컬 사전 매칭 정확도와 후보 축소 재현율을 측정
+
+라벨 데이터:
+- 기본값: productions/*/llm_results 의 기존 LLM 매칭 결과 (LLM 선택을 정답으로 사용)
+- --labels: [{"user_input": ..., "candidates": [...], "expected": ...}] 형식의 JSON 파일
+- 항상 포함: scripts/matching_labels.json (시즌 표기 해석 회귀 사례)
+
+사용법:
+    python scripts/evaluate_matching.py
+    python scripts/evaluate_matching.py --labels labels.json --verbose
+"""
+import sys
+import os
+import glob
+import json
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.models import SearchCandidate
+from src.core.local_matcher import local_match, shortlist_candidates
+
+# 제목 일부인 X / 제목 끝 로마 숫자 시즌 등 회귀 사례
+REGRESSION_LABELS = project_root / "scripts" / "matching_labels.json"
+
+def load_production_labels(productions_dir: str) -> list:
+    """기존 배치 결과에서 (입력, 후보 목록, LLM 선택) 수집 (첫 번째 후보 폴백 결과 제외)"""
+    labels = {}
+    
+    for llm_file in sorted(glob.glob(os.path.join(productions_dir, "*", "llm_results", "*.json"))):
+        try:
+            with open(llm_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            if 'candidate_titles' in data:
+                if data.get('match_status') != 'match_found':
+                    continue
+                candidates = data['candidate_titles']
+            else:
+                if not data.get('success') or data.get('confidence_score') is None:
+                    continue
+                search_file = llm_file.replace(
+                    os.path.join("llm_results", "llm_"), os.path.join("search_results", "search_")
+                )
+                with open(search_file, 'r', encoding='utf-8') as f:
+                    candidates = [candidate['title'] for candidate in json.load(f)['candidates']]
+            
+            key = (data['user_input'], tuple(candidates))
+            labels[key] = {
+                "user_input": data['user_input'],
+                "candidates": candidates,
+                "expected": data['selected_title']
+            }
+        except Exception:
+            # 잘린 파일 등은 건너뜀
+            continue
+    
+    return list(labels.values())
+
+def to_candidates(titles: list) -> list:
+    return [SearchCandidate(title=title, rank=rank) for rank, title in enumerate(titles, 1)]
+
+def prompt_size(titles: list) -> int:
+    """프롬프트 후보 목록 글자 수 ("1. 제목" 형식)"""
+    return sum(len(f"{i}. {title}\n") for i, title in enumerate(titles, 1))
+
+def evaluate(labels: list, verbose: bool = False) -> dict:
+    """라벨 데이터 평가"""
+    local_decided = 0
+    local_correct = 0
+    shortlist_hits = 0
+    original_count = 0
+    shortlist_count = 0
+    original_chars = 0
+    shortlist_chars = 0
+    
+    for label in labels:
+        expected = label['expected']
+        
+        local_result = local_match(label['user_input'], to_candidates(label['candidates']))
+        if local_result:
+            local_decided += 1
+            if local_result.selected_title == expected:
+                local_correct += 1
+        
+        shortlisted = [c.title for c in shortlist_candidates(label['user_input'], to_candidates(label['candidates']))]
+        if expected in shortlisted:
+            shortlist_hits += 1
+        
+        original_count += len(label['candidates'])
+        shortlist_count += len(shortlisted)
+        original_chars += prompt_size(label['candidates'])
+        shortlist_chars += prompt_size(shortlisted)
+        
+        if verbose:
+            local_mark = "-" if not local_result else ("✅" if local_result.selected_title == expected else "❌")
+            shortlist_mark = "✅" if expected in shortlisted else "❌"
+            print(f"   로컬 {local_mark} | 축소 {shortlist_mark} {len(label['candidates'])}→{len(shortlisted)} | "
+                  f"{label['user_input']} → {expected}")
+    
+    total = len(labels)
+    return {
+        "total": total,
+        "local_decided": local_decided,
+        "local_accuracy": local_correct / local_decided if local_decided else None,
+        "llm_calls_avoided": local_decided / total if total else 0.0,
+        "shortlist_recall": shortlist_hits / total if total else 0.0,
+        "avg_candidates": original_count / total if total else 0.0,
+        "avg_shortlist": shortlist_count / total if total else 0.0,
+        "prompt_chars_saved": 1 - shortlist_chars / original_chars if original_chars else 0.0
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Step 2 로컬 매칭 / 후보 축소 평가')
+    parser.add_argument('--labels', help='라벨 JSON 파일 (생략하면 productions 결과 사용)')
+    parser.add_argument('--productions-dir', default='productions', help='배치 결과 폴더')
+    parser.add_argument('--verbose', action='store_true', help='항목별 결과 출력')
+    args = parser.parse_args()
+    
+    if args.labels:
+        with open(args.labels, 'r', encoding='utf-8') as f:
+            labels = json.load(f)
+    else:
+        labels = load_production_labels(args.productions_dir)
+    
+    with open(REGRESSION_LABELS, 'r', encoding='utf-8') as f:
+        labels += json.load(f)
+    
+    if not labels:
+        print("❌ 평가할 라벨 데이터가 없습니다.")
+        return 1
+    
+    print(f"📊 라벨 데이터: {len(labels)}개")
+    report = evaluate(labels, args.verbose)
+    
+    accuracy = report['local_accuracy']
+    print(f"\n🧮 로컬 사전 매칭")
+    print(f"   결정: {report['local_decided']}/{report['total']}개 (LLM 호출 {report['llm_calls_avoided']:.0%} 생략)")
+    print(f"   정확도: {accuracy:.1%}" if accuracy is not None else "   정확도: -")
+    print(f"\n✂️ 후보 축소")
+    print(f"   정답 포함률: {report['shortlist_recall']:.1%}")
+    print(f"   평균 후보 수: {report['avg_candidates']:.1f}개 → {report['avg_shortlist']:.1f}개")
+    print(f"   프롬프트 후보 목록 글자 수 절감: {report['prompt_chars_saved']:.0%}")
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,27 +5,11 @@ import re
 from datetime import datetime
 from typing import List, Dict, Any
 from . import config
+from ..core.search_normalizer import primary_query
 
 def optimize_search_term(user_input: str) -> str:
-    """라프텔 검색 최적화를 위한 검색어 전처리"""
-    
-    # 시즌 정보 패턴들
-    season_patterns = [
-        r'\s*1기\s*$',          # "스파이 패밀리 1기" → "스파이 패밀리"
-        r'\s*2기\s*$',          # "무직전생 2기" → "무직전생"  
-        r'\s*3기\s*$',          # "애니 3기" → "애니"
-        r'\s*4기\s*$',          # "애니 4기" → "애니"
-        r'\s*5기\s*$',          # "애니 5기" → "애니"
-        r'\s*시즌\s*\d+\s*$',   # "애니 시즌 2" → "애니"
-        r'\s*Season\s*\d+\s*$', # "애니 Season 2" → "애니"
-    ]
-    
-    # 패턴 매칭해서 시즌 정보 제거
-    for pattern in season_patterns:
-        if re.search(pattern, user_input, re.IGNORECASE):
-            return re.sub(pattern, '', user_input, flags=re.IGNORECASE).strip()
-    
-    return user_input
+    """라프텔 검색 최적화를 위한 검색어 전처리 (코어 정규화 엔진 사용)"""
+    return primary_query(user_input)
 
 def collect_search_candidates(user_input: str) -> Dict[str, Any]:
     """
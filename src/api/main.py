@@ -8,12 +8,16 @@ FastAPI 기반 애니메이션 메타데이터 자동 수집 API 서버
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+import asyncio
 import structlog
 import time
 from contextlib import asynccontextmanager
 
 from ..core.config import settings
+from ..core.async_laftel_client import close_shared_http_client
+from ..core.async_openai_client import close_shared_openai_client
 from .routers import health, anime
+from .processor import ApiAnimeProcessor
 from .middleware import setup_logging, ErrorHandlerMiddleware
 
 # 구조화된 로깅 설정
@@ -30,9 +34,15 @@ async def lifespan(app: FastAPI):
     # 헬스체크 준비
     setup_logging()
     
+    # 요청 간 공유하는 처리기 (세션/스레드풀/캐시 핸들을 요청마다 만들지 않도록, 생성은 스레드에서)
+    app.state.processor = await asyncio.to_thread(ApiAnimeProcessor)
+    
     yield
     
-    # 종료시
+    # 종료시 처리기 및 공유 라프텔 HTTP / OpenAI 커넥션 정리
+    app.state.processor.close()
+    await close_shared_http_client()
+    await close_shared_openai_client()
     logger.info("🛑 애니메이션 메타데이터 API 서버 종료")
 
 # FastAPI 앱 생성
@@ -5,21 +5,20 @@
 - 4단계 파이프라인 실행 및 결과 반환
 """
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from fastapi.responses import JSONResponse
 import time
 import structlog
 from datetime import datetime
 from typing import Dict, Any
 
-from ...core.pipeline import AnimePipeline
 from ...core.models import ProcessStatus, ProcessResult
 from ...core.config import settings
 from ..schemas import (
     AnimeProcessRequest, AnimeProcessResponse, 
     SUCCESS_EXAMPLE, FAILURE_EXAMPLE, PARTIAL_SUCCESS_EXAMPLE
 )
-from ..processor import ApiAnimeProcessor
+from ..processor import ApiAnimeProcessor, get_api_processor
 
 router = APIRouter(prefix="/api/v1", tags=["anime"])
 logger = structlog.get_logger()
@@ -31,7 +30,8 @@ SERVER_START_TIME = time.time()
             response_model=AnimeProcessResponse,
             summary="애니메이션 자동 처리",
             description="애니메이션 제목을 받아서 라프텔 검색 → AI 매칭 → 메타데이터 수집 → 노션 업로드를 자동 실행")
-def process_anime(request: AnimeProcessRequest):
+async def process_anime(request: AnimeProcessRequest,
+                        processor: ApiAnimeProcessor = Depends(get_api_processor)):
     """
     개별 애니메이션 즉시 처리 (아이폰 단축어 전용)
     """
@@ -43,11 +43,8 @@ def process_anime(request: AnimeProcessRequest):
                description=request.description)
     
     try:
-        # API 전용 프로세서 사용
-        processor = ApiAnimeProcessor()
-        
-        # 4단계 파이프라인 실행 (동기 방식)
-        result = processor.process_sync(request.title)
+        # 4단계 파이프라인 실행 (비동기 방식 - 스레드풀 점유 없이 이벤트 루프에서 처리)
+        result = await processor.process(request.title)
         
         processing_time = time.time() - start_time
         result.processing_time = processing_time
@@ -72,7 +69,7 @@ def process_anime(request: AnimeProcessRequest):
             )
             
             logger.info("성공 응답 반환", notion_url=result.notion_url)
-            
+        
         elif result.status == ProcessStatus.PARTIAL_SUCCESS:
             response = AnimeProcessResponse(
                 status=ProcessStatus.PARTIAL_SUCCESS,
@@ -84,7 +81,7 @@ def process_anime(request: AnimeProcessRequest):
             )
             
             logger.warning("부분 성공 응답", error=result.error)
-            
+        
         else:
             response = AnimeProcessResponse(
                 status=ProcessStatus.FAILED,
@@ -97,7 +94,7 @@ def process_anime(request: AnimeProcessRequest):
             logger.error("실패 응답", error=result.error)
         
         return response
-        
+    
     except Exception as e:
         processing_time = time.time() - start_time
         error_msg = f"처리 중 예상치 못한 오류: {str(e)}"
@@ -119,11 +116,11 @@ def process_anime(request: AnimeProcessRequest):
         )
 
 @router.get("/status")
-def api_status():
+def api_status(processor: ApiAnimeProcessor = Depends(get_api_processor)):
     """API 서버 상태 확인"""
     try:
         # 파이프라인 상태 확인
-        pipeline = AnimePipeline()
+        pipeline = processor.pipeline
         health = pipeline.health_check()
         stats = pipeline.get_statistics()
         
@@ -135,7 +132,7 @@ def api_status():
             "statistics": stats,
             "uptime_seconds": round(time.time() - SERVER_START_TIME, 2)
         }
-        
+    
     except Exception as e:
         logger.error("상태 확인 실패", error=str(e))
         raise HTTPException(status_code=500, detail=f"상태 확인 실패: {str(e)}")
@@ -147,8 +144,6 @@ def test_external_connections():
         raise HTTPException(status_code=404, detail="개발 모드에서만 사용 가능")
     
     try:
-        pipeline = AnimePipeline()
-        
         # 각 서비스별 기본 연결 테스트 (실제 API 호출은 하지 않음)
         test_results = {
             "openai": {
@@ -173,7 +168,7 @@ def test_external_connections():
             "timestamp": datetime.now().isoformat(),
             "note": "실제 API 호출은 하지 않고 설정만 확인함"
         }
-        
+    
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"연결 테스트 실패: {str(e)}")
 
@@ -14,6 +14,7 @@ from typing import Dict, Any
 
 from ...core.config import settings
 from ...core.pipeline import AnimePipeline
+from ..processor import ApiAnimeProcessor, get_api_processor
 from ..schemas import HealthCheckResponse, HealthCheckRequest
 
 router = APIRouter(tags=["health"])
@@ -22,7 +23,8 @@ router = APIRouter(tags=["health"])
 SERVER_START_TIME = time.time()
 
 @router.get("/health", response_model=HealthCheckResponse)
-async def health_check(detailed: bool = Query(False, description="상세 정보 포함 여부")):
+async def health_check(detailed: bool = Query(False, description="상세 정보 포함 여부"),
+                       processor: ApiAnimeProcessor = Depends(get_api_processor)):
     """
     기본 헬스체크 엔드포인트
     Render에서 서버 생존 확인용으로 사용
@@ -38,7 +40,7 @@ async def health_check(detailed: bool = Query(False, description="상세 정보
     if detailed:
         try:
             # 서비스별 상태 확인
-            services = await _check_services_health()
+            services = await _check_services_health(processor.pipeline)
             
             # 시스템 정보
             system_info = {
@@ -51,16 +53,16 @@ async def health_check(detailed: bool = Query(False, description="상세 정보
             
             health_data["services"] = services
             health_data["system_info"] = system_info
-            
+        
         except Exception as e:
             health_data["services"] = {"error": str(e)}
     
     return HealthCheckResponse(**health_data)
 
 @router.get("/health/services")
-async def services_health():
+async def services_health(processor: ApiAnimeProcessor = Depends(get_api_processor)):
     """외부 서비스 연결 상태 확인"""
-    services = await _check_services_health()
+    services = await _check_services_health(processor.pipeline)
     
     all_healthy = all(status == "healthy" for status in services.values())
     
@@ -70,13 +72,12 @@ async def services_health():
         "timestamp": datetime.now().isoformat()
     }
 
-async def _check_services_health() -> Dict[str, str]:
+async def _check_services_health(pipeline: AnimePipeline) -> Dict[str, str]:
     """외부 서비스들의 상태 확인"""
     services = {}
     
     try:
         # AnimePipeline 상태 확인
-        pipeline = AnimePipeline()
         pipeline_health = pipeline.health_check()
         
         # 각 서비스별 상태 추출
@@ -88,7 +89,7 @@ async def _check_services_health() -> Dict[str, str]:
         
         # 전체 파이프라인 상태
         services["pipeline"] = pipeline_health.get("pipeline", "unknown")
-        
+    
     except Exception as e:
         services["pipeline"] = f"error: {str(e)}"
         services["openai"] = "error"
@@ -106,11 +107,11 @@ async def quick_health():
     return {"status": "ok", "timestamp": int(time.time())}
 
 @router.get("/health/detailed")
-async def detailed_health():
+async def detailed_health(processor: ApiAnimeProcessor = Depends(get_api_processor)):
     """상세 헬스체크 (관리자용)"""
     try:
         # 파이프라인 전체 상태
-        pipeline = AnimePipeline()
+        pipeline = processor.pipeline
         pipeline_status = pipeline.health_check()
         pipeline_stats = pipeline.get_statistics()
         
@@ -141,7 +142,7 @@ async def detailed_health():
                 "max_search_candidates": settings.max_search_candidates
             }
         }
-        
+    
     except Exception as e:
         return {
             "status": "error",
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+라프텔 카탈로그 인덱스 수집/갱신 스크립트
+
+사용법:
+    python src/batch/cli/build_catalog.py --full        # 전체 작품 목록 수집
+    python src/batch/cli/build_catalog.py               # 새 작품만 증분 갱신
+    python src/batch/cli/build_catalog.py --stats       # 인덱스 상태 확인
+"""
+
+import os
+import sys
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.laftel_client import LaftelClient
+
+def format_timestamp(value) -> str:
+    """epoch 초 문자열을 읽기 쉬운 시각으로 변환"""
+    if not value:
+        return '-'
+    return datetime.fromtimestamp(float(value)).strftime('%Y-%m-%d %H:%M:%S')
+
+def print_stats(stats: dict) -> None:
+    """인덱스 상태 출력"""
+    print(f"📚 카탈로그 인덱스 상태")
+    print(f"   작품 수: {stats['size']}개")
+    print(f"   FTS5 trigram: {'사용' if stats['fts_enabled'] else '미지원 (LIKE 검색)'}")
+    print(f"   로컬 검색 사용: {'예' if stats['authoritative'] else '아니오 (전체 수집 필요 또는 만료)'}")
+    print(f"   마지막 전체 수집: {format_timestamp(stats['last_full_build'])}")
+    print(f"   마지막 증분 갱신: {format_timestamp(stats['last_refresh'])}")
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(
+        description='라프텔 카탈로그 로컬 인덱스 수집/갱신',
+        epilog='예시: python build_catalog.py --full'
+    )
+    
+    parser.add_argument(
+        '--full',
+        action='store_true',
+        help='전체 작품 목록 수집 (생략하면 새 작품만 증분 갱신)'
+    )
+    parser.add_argument(
+        '--max-pages',
+        type=int,
+        help='최대 수집 페이지 수 (테스트용)'
+    )
+    parser.add_argument(
+        '--stats',
+        action='store_true',
+        help='수집 없이 인덱스 상태만 확인'
+    )
+    
+    args = parser.parse_args()
+    
+    try:
+        with LaftelClient() as client:
+            if not client.catalog:
+                print("❌ 카탈로그 인덱스가 비활성화되어 있습니다 (LAFTEL_CATALOG_ENABLED)")
+                return 1
+            
+            if not args.stats:
+                result = client.refresh_catalog(full=args.full, max_pages=args.max_pages)
+                print(f"✅ 수집 완료: {result['pages']}페이지, {result['fetched']}개 (신규 {result['added']}개)")
+                if not result['completed']:
+                    print("⚠️ 목록 끝까지 수집하지 않아 전체 수집으로 기록되지 않았습니다")
+            
+            print_stats(client.catalog.stats())
+            return 0
+    
+    except KeyboardInterrupt:
+        print(f"\n❌ 사용자에 의해 중단됨")
+        return 1
+    except Exception as e:
+        print(f"❌ 카탈로그 수집 실패: {e}")
+        import traceback
+        if os.getenv("DEBUG"):
+            traceback.print_exc()
+        return 1
+
+if __name__ == "__main__":
+    exit(main())
@@ -16,7 +16,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.batch.processor import BatchProcessor
+from src.batch.processor import BatchProcessor, MATCHING_MODES
 
 def main():
     """메인 실행 함수"""
@@ -39,6 +39,12 @@ def main():
         '--db-id', 
         help='노션 데이터베이스 ID (기본값 사용하려면 생략)'
     )
+    parser.add_argument(
+        '--matching-mode',
+        choices=MATCHING_MODES,
+        help='Step 2 방식: single(개별), packed(묶음 호출), batch_api(OpenAI Batch API 제출, 야간 대량 처리용) '
+             '(생략하면 BATCH_MATCHING_MODE 설정 사용)'
+    )
     parser.add_argument(
         '--dry-run',
         action='store_true',
@@ -56,7 +62,7 @@ def main():
     if args.dry_run:
         print("🧪 Dry-run 모드: 설정 확인만 수행")
         try:
-            processor = BatchProcessor(args.csv, args.description, args.db_id)
+            processor = BatchProcessor(args.csv, args.description, args.db_id, args.matching_mode)
             anime_list = processor.load_anime_list()
             
             print(f"✅ 설정 확인 완료")
@@ -79,7 +85,7 @@ def main():
             
             print("\n💡 실제 실행하려면 --dry-run 옵션을 제거하세요")
             return 0
-            
+        
         except Exception as e:
             print(f"❌ 설정 확인 실패: {e}")
             return 1
@@ -90,7 +96,7 @@ def main():
     print(f"📄 설명: {args.description}")
     
     try:
-        processor = BatchProcessor(args.csv, args.description, args.db_id)
+        processor = BatchProcessor(args.csv, args.description, args.db_id, args.matching_mode)
         success = processor.run_batch()
         
         if success:
@@ -100,7 +106,7 @@ def main():
         else:
             print(f"\n❌ 배치 처리 실패")
             return 1
-            
+    
     except KeyboardInterrupt:
         print(f"\n❌ 사용자에 의해 중단됨")
         return 1
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LLM 매칭 캐시 채우기 스크립트
+
+사용법:
+    python src/batch/cli/warm_match_cache.py               # productions/*/llm_results 전체 반영
+    python src/batch/cli/warm_match_cache.py --dir other   # 다른 결과 폴더 사용
+    python src/batch/cli/warm_match_cache.py --stats       # 캐시 상태만 확인
+"""
+
+import os
+import sys
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.match_cache import LLMMatchCache
+
+def print_stats(stats: dict) -> None:
+    """캐시 상태 출력"""
+    print(f"🧠 LLM 매칭 캐시 상태")
+    print(f"   항목 수: {stats['size']}개 (최대 {stats['max_entries']}개)")
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(
+        description='기존 배치 결과로 LLM 매칭 캐시 채우기',
+        epilog='예시: python warm_match_cache.py'
+    )
+    
+    parser.add_argument(
+        '--dir',
+        help='배치 결과 폴더 (기본값: PRODUCTIONS_DIR 설정)'
+    )
+    parser.add_argument(
+        '--stats',
+        action='store_true',
+        help='채우기 없이 캐시 상태만 확인'
+    )
+    
+    args = parser.parse_args()
+    
+    try:
+        match_cache = LLMMatchCache()
+        
+        if not args.stats:
+            stored = match_cache.warm_from_productions(args.dir)
+            print(f"✅ 캐시 채우기 완료: {stored}개")
+        
+        print_stats(match_cache.stats())
+        return 0
+    
+    except KeyboardInterrupt:
+        print(f"\n❌ 사용자에 의해 중단됨")
+        return 1
+    except Exception as e:
+        print(f"❌ 캐시 채우기 실패: {e}")
+        import traceback
+        if os.getenv("DEBUG"):
+            traceback.print_exc()
+        return 1
+
+if __name__ == "__main__":
+    exit(main())
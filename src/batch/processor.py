@@ -11,17 +11,26 @@ import csv
 import json
 import time
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
 from ..core.pipeline import AnimePipeline
-from ..core.models import ProcessResult, ProcessStatus, BatchConfig, BatchSummary, create_error_result
+from ..core.models import (
+    ProcessResult, ProcessStatus, BatchConfig, BatchSummary, SearchResult, LLMMatchResult,
+    create_error_result
+)
 from ..core.config import settings
+from ..core.openai_batch import LocalFileBatchBackend
+from ..core.llm_metrics import summarize_llm_metrics
+
+# 배치 Step 2 방식 (CLI --matching-mode / BATCH_MATCHING_MODE)
+MATCHING_MODES = ("single", "packed", "batch_api")
 
 class BatchProcessor:
     """새로운 배치 처리기 (코어 모듈 기반)"""
     
-    def __init__(self, csv_file: str, description: str = "", notion_db_id: str = None):
+    def __init__(self, csv_file: str, description: str = "", notion_db_id: str = None,
+                 matching_mode: Optional[str] = None):
         """
         배치 처리기 초기화
         
@@ -29,9 +38,19 @@ class BatchProcessor:
             csv_file: 처리할 CSV 파일 경로
             description: 배치 설명
             notion_db_id: 노션 데이터베이스 ID (None이면 기본값 사용)
+            matching_mode: Step 2 방식 (None이면 설정값 사용)
+                - single: 제목마다 개별 호출
+                - packed: 여러 제목을 묶어서 한 번에 호출
+                - batch_api: 전체를 OpenAI Batch API 작업 1건으로 제출 후 완료 대기
         """
         self.csv_file = csv_file
         self.description = description
+        self.matching_mode = (matching_mode or settings.batch_matching_mode).lower()
+        if self.matching_mode not in MATCHING_MODES:
+            # 알 수 없는 값이 조용히 묶음 처리 경로로 빠지지 않도록 폴더 생성 전에 거부
+            raise ValueError(
+                f"지원하지 않는 매칭 방식입니다: {self.matching_mode} ({', '.join(MATCHING_MODES)})"
+            )
         
         # 배치 ID 생성 (기존 형식 유지)
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
@@ -75,10 +94,10 @@ class BatchProcessor:
                 for row in reader:
                     if row and row[0].strip():  # 빈 행 스킵
                         anime_list.append(row[0].strip())
-                        
+            
             print(f"📋 애니메이션 목록 로드 완료: {len(anime_list)}개")
             return anime_list
-            
+        
         except Exception as e:
             print(f"❌ CSV 파일 로드 실패: {e}")
             return []
@@ -139,9 +158,13 @@ class BatchProcessor:
             success_count = 0
             failed_count = 0
             processing_details = []
+            llm_metrics = []
             
             print(f"✅ 환경 설정 완료")
             
+            # 묶음/Batch API 매칭: 전체 검색(Step 1) 후 Step 2를 한꺼번에 먼저 처리
+            prepared = self._prepare_matches(anime_list) if self.matching_mode != "single" else {}
+            
             # 각 애니메이션 처리
             for index, anime_title in enumerate(anime_list, 1):
                 print(f"\n{'='*80}")
@@ -152,7 +175,7 @@ class BatchProcessor:
                 
                 try:
                     # 통합 파이프라인으로 처리 (동기 방식)
-                    result = self._process_single_sync(anime_title)
+                    result = self._process_single_sync(anime_title, prepared.get(index))
                     
                     # 결과별 처리
                     if result.success:
@@ -162,6 +185,8 @@ class BatchProcessor:
                         print(f"❌ 처리 실패: {result.error}")
                         failed_count += 1
                     
+                    llm_metrics.append(result.llm_metrics)
+                    
                     # 처리 상세 정보 저장
                     item_detail = {
                         "anime_title": anime_title,
@@ -177,11 +202,11 @@ class BatchProcessor:
                     # 진행률 표시
                     progress = (index / len(anime_list)) * 100
                     print(f"📊 진행률: {progress:.1f}% ({index}/{len(anime_list)})")
-                    
+                
                 except KeyboardInterrupt:
                     print(f"\n❌ 사용자에 의해 중단됨 (처리 완료: {index-1}/{len(anime_list)})")
                     break
-                    
+                
                 except Exception as e:
                     print(f"❌ 예상치 못한 오류: {e}")
                     failed_count += 1
@@ -217,7 +242,8 @@ class BatchProcessor:
                     "step4_success": success_count
                 },
                 failed_items=[item["anime_title"] for item in processing_details if item["final_status"] == "failed"],
-                processing_details=processing_details
+                processing_details=processing_details,
+                llm_statistics=summarize_llm_metrics(llm_metrics)
             )
             
             summary_file = os.path.join(self.batch_folder, "batch_summary.json")
@@ -240,91 +266,169 @@ class BatchProcessor:
             print(f"❌ 실패: {failed_count}개")
             print(f"💾 요약 파일: {summary_file}")
             
+            llm_stats = summary.llm_statistics
+            print(f"🤖 Step 2: API 호출 {llm_stats['api_calls']}회, 토큰 {llm_stats['total_tokens']}개, "
+                  f"예상 비용 ${llm_stats['estimated_cost_usd']:.4f}")
+            if llm_stats['run_seconds']['p50'] is not None:
+                print(f"   실행 p50/p95: {llm_stats['run_seconds']['p50']}초 / {llm_stats['run_seconds']['p95']}초, "
+                      f"대기 p50/p95: {llm_stats['queue_seconds']['p50']}초 / {llm_stats['queue_seconds']['p95']}초")
+            
             import datetime as dt
             duration = str(dt.timedelta(seconds=int(total_time)))
             print(f"⏱️ 총 소요시간: {duration}")
             
             return True
-            
+        
         except Exception as e:
             print(f"❌ 배치 처리 실패: {e}")
             return False
     
-    def _process_single_sync(self, title: str) -> ProcessResult:
-        """단일 애니메이션 동기 처리 (파이프라인 호출 방식 개선)"""
+    def _prepare_matches(self, anime_list: List[str]) -> Dict[int, Tuple[SearchResult, Optional[LLMMatchResult]]]:
+        """
+        묶음/Batch API 매칭 준비: 전체 제목 검색 후 후보가 있는 항목을 한꺼번에 매칭
+        
+        Returns:
+            {CSV 순번: (검색 결과, 매칭 결과 또는 None)}
+            (검색 오류 항목은 제외, 매칭 결과가 None인 항목은 Step 2부터 개별 처리)
+        """
+        searches: Dict[int, SearchResult] = {}
+        
+        print(f"\n🔍 Step 1: 전체 검색 후보 수집 ({len(anime_list)}개)")
+        for index, anime_title in enumerate(anime_list, 1):
+            try:
+                searches[index] = self._search_step(anime_title)
+            except Exception as e:
+                print(f"⚠️ 검색 실패 - 개별 처리로 진행: {anime_title} ({e})")
+        
+        matchable = [
+            index for index, search_result in searches.items()
+            if search_result.success and search_result.candidates
+        ]
+        
+        items = [(anime_list[index - 1], searches[index].candidates) for index in matchable]
+        
+        try:
+            if self.matching_mode == "batch_api":
+                print(f"\n🤖 Step 2: OpenAI Batch API 매칭 ({len(matchable)}개, 백엔드: {settings.openai_batch_backend})")
+                backend = None
+                if settings.openai_batch_backend == "local":
+                    backend = LocalFileBatchBackend(os.path.join(self.batch_folder, "llm_batch"))
+                llm_results = self.pipeline.openai.find_best_matches_via_batch(
+                    items, self.batch_folder, backend
+                )
+            else:
+                print(f"\n🤖 Step 2: 묶음 LLM 매칭 ({len(matchable)}개)")
+                llm_results = self.pipeline.openai.find_best_matches(items)
+        except Exception as e:
+            # 검색 결과는 유지하고 각 항목을 Step 2부터 개별 처리
+            print(f"⚠️ 일괄 매칭 실패 - 개별 매칭으로 진행: {e}")
+            llm_results = [None] * len(items)
+        
+        prepared = {index: (search_result, None) for index, search_result in searches.items()}
+        for index, llm_result in zip(matchable, llm_results):
+            prepared[index] = (searches[index], llm_result)
+        
+        return prepared
+    
+    def _process_single_sync(self, title: str,
+                             prepared: Optional[Tuple[SearchResult, Optional[LLMMatchResult]]] = None) -> ProcessResult:
+        """
+        단일 애니메이션 동기 처리 (파이프라인 호출 방식 개선)
+        
+        Args:
+            title: 애니메이션 제목
+            prepared: 묶음 처리에서 미리 구한 (검색 결과, 매칭 결과)
+        """
         try:
             # 단계별 직접 호출 (비동기 문제 해결)
-            
-            # Step 1: 라프텔 검색
-            print(f"\n🔍 Step 1: 검색 후보 수집")
-            search_result = self.pipeline.laftel.search_anime(title)
+            if prepared:
+                search_result, llm_result = prepared
+            else:
+                search_result, llm_result = self._search_step(title), None
             
             if not search_result.success or not search_result.candidates:
-                # 빈 노션 페이지 생성
-                notion_result = self.pipeline.notion.create_or_update_page(title, None)
-                return ProcessResult(
-                    title=title,
-                    success=notion_result.success,
-                    status=ProcessStatus.PARTIAL_SUCCESS if notion_result.success else ProcessStatus.FAILED,
-                    notion_url=notion_result.page_url if notion_result.success else None,
-                    error="검색 결과가 없어 빈 페이지만 생성됨",
-                    steps_completed=1 if notion_result.success else 0
-                )
+                return self._empty_page_result(title)
             
             print(f"✅ 1단계 완료: {len(search_result.candidates)}개 후보 수집 성공")
             
             # Step 2: AI 매칭
-            print(f"\n🤖 Step 2: LLM 매칭") 
-            llm_result = self.pipeline.openai.find_best_match(title, search_result.candidates)
-            
-            if not llm_result.success or not llm_result.selected_title:
-                # 첫 번째 후보로 폴백
-                if search_result.candidates:
-                    llm_result.selected_title = search_result.candidates[0].title
-                    llm_result.success = True
-                    print(f"⚠️ AI 매칭 실패 - 첫 번째 후보 선택: {llm_result.selected_title}")
-                else:
-                    return create_error_result(title, f"Step 2 실패: {llm_result.error_message}", 1)
-            
-            print(f"✅ 2단계 완료: 매칭 성공")
-            
-            # Step 3: 메타데이터 수집
-            print(f"\n📊 Step 3: 메타데이터 수집")
-            metadata_result = self.pipeline.laftel.get_metadata(llm_result.selected_title)
-            
-            if not metadata_result.success:
-                print("⚠️ 메타데이터 수집 실패 - 기본 정보만으로 진행")
-            else:
-                print(f"✅ 3단계 완료: 메타데이터 수집 성공")
-            
-            # Step 4: 노션 업로드
-            print(f"\n📝 Step 4: 노션 업로드")
-            metadata_obj = metadata_result.metadata if metadata_result.success else None
-            notion_result = self.pipeline.notion.create_or_update_page(title, metadata_obj)
-            
-            if not notion_result.success:
-                return create_error_result(title, f"Step 4 실패: {notion_result.error_message}", 3)
-            
-            print(f"✅ 4단계 완료: 노션 업로드 성공")
-            
-            # 최종 성공 결과
-            return ProcessResult(
-                title=title,
-                success=True,
-                status=ProcessStatus.SUCCESS,
-                notion_url=notion_result.page_url,
-                search_result=search_result,
-                llm_result=llm_result,
-                metadata_result=metadata_result,
-                notion_result=notion_result,
-                steps_completed=4
-            )
+            if llm_result is None:
+                print(f"\n🤖 Step 2: LLM 매칭") 
+                llm_result = self.pipeline.openai.find_best_match(title, search_result.candidates)
             
+            return self._complete_after_match(title, search_result, llm_result)
+        
         except Exception as e:
             error_msg = f"단일 애니메이션 처리 실패: {str(e)}"
             print(f"❌ {error_msg}")
             return create_error_result(title, error_msg, 0)
     
+    def _search_step(self, title: str) -> SearchResult:
+        """Step 1: 라프텔 검색"""
+        print(f"\n🔍 Step 1: 검색 후보 수집")
+        return self.pipeline.laftel.search_anime(title)
+    
+    def _empty_page_result(self, title: str) -> ProcessResult:
+        """검색 결과가 없을 때 빈 노션 페이지 생성"""
+        notion_result = self.pipeline.notion.create_or_update_page(title, None)
+        return ProcessResult(
+            title=title,
+            success=notion_result.success,
+            status=ProcessStatus.PARTIAL_SUCCESS if notion_result.success else ProcessStatus.FAILED,
+            notion_url=notion_result.page_url if notion_result.success else None,
+            error="검색 결과가 없어 빈 페이지만 생성됨",
+            steps_completed=1 if notion_result.success else 0
+        )
+    
+    def _complete_after_match(self, title: str, search_result: SearchResult,
+                              llm_result: LLMMatchResult) -> ProcessResult:
+        """Step 2 결과 확정(실패시 첫 번째 후보 폴백) 후 Step 3~4 처리"""
+        if not llm_result.success or not llm_result.selected_title:
+            # 첫 번째 후보로 폴백
+            if search_result.candidates:
+                llm_result.selected_title = search_result.candidates[0].title
+                llm_result.laftel_id = search_result.candidates[0].laftel_id
+                llm_result.success = True
+                print(f"⚠️ AI 매칭 실패 - 첫 번째 후보 선택: {llm_result.selected_title}")
+            else:
+                return create_error_result(title, f"Step 2 실패: {llm_result.error_message}", 1)
+        
+        print(f"✅ 2단계 완료: 매칭 성공")
+        
+        # Step 3: 메타데이터 수집
+        print(f"\n📊 Step 3: 메타데이터 수집")
+        metadata_result = self.pipeline.laftel.get_metadata_for_match(llm_result)
+        
+        if not metadata_result.success:
+            print("⚠️ 메타데이터 수집 실패 - 기본 정보만으로 진행")
+        else:
+            print(f"✅ 3단계 완료: 메타데이터 수집 성공")
+        
+        # Step 4: 노션 업로드
+        print(f"\n📝 Step 4: 노션 업로드")
+        metadata_obj = metadata_result.metadata if metadata_result.success else None
+        notion_result = self.pipeline.notion.create_or_update_page(title, metadata_obj)
+        
+        if not notion_result.success:
+            result = create_error_result(title, f"Step 4 실패: {notion_result.error_message}", 3)
+            result.llm_result = llm_result  # Step 2 계측은 실패 항목도 집계
+            return result
+        
+        print(f"✅ 4단계 완료: 노션 업로드 성공")
+        
+        # 최종 성공 결과
+        return ProcessResult(
+            title=title,
+            success=True,
+            status=ProcessStatus.SUCCESS,
+            notion_url=notion_result.page_url,
+            search_result=search_result,
+            llm_result=llm_result,
+            metadata_result=metadata_result,
+            notion_result=notion_result,
+            steps_completed=4
+        )
+    
     def _extract_step_details(self, result: ProcessResult, index: int, title: str) -> Dict[str, Any]:
         """단계별 결과 상세 정보 추출 및 파일 저장"""
         steps = {}
@@ -348,6 +452,16 @@ class BatchProcessor:
                 "file": llm_file,
                 "match_status": "match_found" if result.llm_result.selected_title else "no_match"
             }
+            
+            metrics = result.llm_metrics
+            if metrics:
+                steps["step2"]["metrics"] = {
+                    "source": metrics.source,
+                    "total_tokens": metrics.total_tokens,
+                    "queue_seconds": round(metrics.queue_seconds, 3),
+                    "run_seconds": round(metrics.run_seconds, 3),
+                    "poll_count": metrics.poll_count
+                }
         
         # Step 3: 메타데이터 결과
         if result.metadata_result:
@@ -372,6 +486,7 @@ class BatchProcessor:
 
 # === 하위 호환성을 위한 레거시 래퍼 ===
 
-def create_batch_processor(csv_file: str, description: str = "", notion_db_id: str = None):
+def create_batch_processor(csv_file: str, description: str = "", notion_db_id: str = None,
+                           matching_mode: Optional[str] = None):
     """기존 인터페이스 호환성을 위한 팩토리 함수"""
-    return BatchProcessor(csv_file, description, notion_db_id)
+    return BatchProcessor(csv_file, description, notion_db_id, matching_mode)
@@ -0,0 +1,492 @@
+# ⚡ 라프텔 비동기 API 클라이언트
+"""
+httpx.AsyncClient 기반 라프텔 비동기 클라이언트
+- LaftelClient와 동일한 search_anime / get_metadata 계약
+- 프로세스 전역 AsyncClient를 공유하여 커넥션 수 제한 및 재사용
+- API 서버에서 스레드풀 점유 없이 이벤트 루프 하나로 동시 요청 처리
+"""
+
+import asyncio
+import json
+import time
+from typing import List, Dict, Any, Optional, Tuple, Union
+
+from .models import SearchResult, MetadataResult, LLMMatchResult
+from .config import settings
+from .laftel_client import LaftelClientBase, EpisodeCountReader, EpisodePrefetch
+from .cache import normalize_cache_key
+from .singleflight import AsyncSingleFlight
+from .hedging import get_route_health
+
+# httpx는 API 서버 의존성(requirements-api.txt)에만 포함
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# 프로세스 전역 공유 HTTP 클라이언트
+_shared_http_client: Optional["httpx.AsyncClient"] = None
+
+def get_shared_http_client() -> "httpx.AsyncClient":
+    """공유 httpx.AsyncClient 반환 (없거나 닫혔으면 새로 생성)"""
+    global _shared_http_client
+    
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.laftel_async_max_connections,
+                max_keepalive_connections=settings.laftel_async_max_keepalive
+            ),
+            timeout=settings.laftel_timeout
+        )
+    
+    return _shared_http_client
+
+async def close_shared_http_client() -> None:
+    """공유 httpx.AsyncClient 종료 (서버 종료시 호출)"""
+    global _shared_http_client
+    
+    if _shared_http_client is not None and not _shared_http_client.is_closed:
+        await _shared_http_client.aclose()
+    _shared_http_client = None
+
+class AsyncLaftelClient(LaftelClientBase):
+    """라프텔 API 비동기 클라이언트"""
+    
+    # 동일 검색어/라프텔 ID 동시 요청 합치기 (모든 인스턴스가 공유)
+    search_flight = AsyncSingleFlight("라프텔 검색")
+    item_flight = AsyncSingleFlight("상세 정보")
+    episode_flight = AsyncSingleFlight("에피소드 수")
+    
+    def __init__(self, http_client: Optional["httpx.AsyncClient"] = None):
+        """
+        클라이언트 초기화
+        
+        Args:
+            http_client: 사용할 AsyncClient (None이면 프로세스 전역 공유 클라이언트)
+        """
+        if not HTTPX_AVAILABLE:
+            raise ImportError("AsyncLaftelClient에는 httpx가 필요합니다 (requirements-api.txt)")
+        
+        super().__init__()
+        self._http_client = http_client
+    
+    @property
+    def http_client(self) -> "httpx.AsyncClient":
+        return self._http_client or get_shared_http_client()
+    
+    def _is_retryable(self, error: Exception) -> bool:
+        """재시도 가능 오류 판단 (httpx 전송 오류 포함)"""
+        if isinstance(error, httpx.TransportError):
+            return True
+        return super()._is_retryable(error)
+    
+    async def _send(self, base_url: str, path: str, headers: Dict[str, str],
+                    stream: bool = False) -> "httpx.Response":
+        """
+        지정한 경로로 GET 요청 1회 실행 (경로 상태 기록)
+        
+        stream=True면 본문을 읽지 않은 응답을 반환하며, 호출측에서 aclose()해야 한다.
+        """
+        started = time.monotonic()
+        try:
+            if stream:
+                request = self.http_client.build_request('GET', self._build_url(path, base_url), headers=headers)
+                response = await self.http_client.send(request, stream=True)
+            else:
+                response = await self.http_client.get(self._build_url(path, base_url), headers=headers)
+        except Exception as e:
+            self._record_route_error(base_url, e)
+            raise
+        
+        if stream and response.status_code >= 500:
+            # 오류 메시지 생성을 위해 본문을 읽고 연결 반환
+            await response.aread()
+            await response.aclose()
+        
+        self._check_route_response(base_url, started, response)
+        return response
+    
+    async def _get(self, path: str, extra_headers: Optional[Dict[str, str]] = None,
+                   stream: bool = False) -> "httpx.Response":
+        """공유 AsyncClient로 GET 요청 실행 (경로 장애시 대체 경로로 우회)"""
+        headers = {**self._get_laftel_headers(), **(extra_headers or {})}
+        
+        if settings.laftel_hedging_enabled and not stream:
+            return await self._hedged_get(path, headers)
+        
+        routes = self._active_routes()
+        last_error = None
+        for base_url in routes:
+            if last_error is not None:
+                # 대체 경로 재요청도 엔드포인트 한도 안에서 전송
+                await self._path_limiter(path).acquire_async()
+            try:
+                return await self._send(base_url, path, headers, stream)
+            except Exception as e:
+                if not self._is_route_failure(e):
+                    raise
+                last_error = e
+                if base_url != routes[-1]:
+                    print(f"🔀 경로 장애 - 대체 경로로 재요청: {e}")
+        
+        raise last_error
+    
+    async def _hedged_get(self, path: str, headers: Dict[str, str]) -> "httpx.Response":
+        """기본 경로가 p95 이상 지연되면 헤지 요청을 보내고 먼저 성공한 응답 사용"""
+        primary, alternate = self._hedge_routes()
+        route = get_route_health(primary)
+        delay = route.hedge_delay()
+        
+        first = asyncio.ensure_future(self._send(primary, path, headers))
+        done, _ = await asyncio.wait({first}, timeout=delay)
+        
+        pending = {first}
+        if done:
+            error = first.exception()
+            if error is None or not self._is_route_failure(error) or alternate == primary:
+                return first.result()
+            print(f"🔀 경로 장애 - 대체 경로로 재요청: {error}")
+            await self._path_limiter(path).acquire_async()
+            pending = set()
+        elif not self._path_limiter(path).try_acquire():
+            # 헤지 요청은 여유 토큰이 있을 때만 (느린 시점에 한도를 넘겨 부하를 키우지 않도록)
+            route.record_hedge(sent=False)
+            print(f"⏱️ {delay:.2f}초 내 응답 없음 - 속도 제한 토큰 부족으로 헤지 생략")
+            return await first
+        else:
+            route.record_hedge(sent=True)
+            print(f"⏱️ {delay:.2f}초 내 응답 없음 - 헤지 요청 발사")
+        
+        hedge = asyncio.ensure_future(self._send(alternate, path, headers))
+        pending.add(hedge)
+        hedged = len(pending) > 1
+        
+        last_error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        if task is hedge and hedged:
+                            route.record_hedge_win()
+                        return task.result()
+                    last_error = error
+        finally:
+            # 늦게 끝난 요청은 취소
+            for task in pending:
+                task.cancel()
+        
+        raise last_error
+    
+    async def _get_json(self, path: str) -> Any:
+        """라프텔 API 비동기 GET 요청 후 JSON 반환"""
+        response = await self._get(path)
+        return self._parse_json(response)
+    
+    async def _direct_search_anime(self, query: str) -> List[Any]:
+        """비동기 HTTP 요청으로 라프텔 검색 (동일 검색어 동시 요청은 한 번만 실행)"""
+        return await self.search_flight.do(normalize_cache_key(query), self._fetch_search, query)
+    
+    async def _fetch_search(self, query: str) -> List[Any]:
+        """캐시 확인 후 라프텔 검색 API 호출 (SQLite 캐시/인덱스 접근은 워커 스레드에서 실행)"""
+        cached = await asyncio.to_thread(self._get_cached_search, query)
+        if cached is not None:
+            return cached
+        
+        indexed = await asyncio.to_thread(self._search_catalog, query)
+        if indexed is not None:
+            return indexed
+        
+        path = self._search_path(query)
+        await self.rate_limiters['search'].acquire_async()
+        print(f"{self._route_label()} 라프텔 검색 (async): {self._build_url(path)}")
+        
+        results = self._extract_search_results(await self._get_json(path))
+        await asyncio.to_thread(self._store_search_results, query, results)
+        return results
+    
+    async def _direct_get_anime_info(self, anime_id: int,
+                                     cached: Optional[Tuple[Optional[Dict[str, Any]], bool]] = None) -> Dict[str, Any]:
+        """비동기 HTTP 요청으로 라프텔 애니메이션 정보 조회 (동일 ID 동시 요청 합치기)"""
+        return await self.item_flight.do(str(anime_id), self._fetch_anime_info, anime_id, cached)
+    
+    async def _fetch_anime_info(self, anime_id: int,
+                                cached: Optional[Tuple[Optional[Dict[str, Any]], bool]] = None) -> Dict[str, Any]:
+        """캐시 확인 후 조건부 요청으로 애니메이션 정보 조회 (cached: 호출자가 이미 읽은 캐시 조회 결과)"""
+        if cached is None:
+            cached = await asyncio.to_thread(self._get_cached_item, anime_id)
+        entry, fresh = cached
+        if fresh:
+            print(f"💾 상세 정보 캐시 히트: ID {anime_id}")
+            return entry['info']
+        
+        path = self._item_path(anime_id)
+        await self.rate_limiters['item'].acquire_async()
+        print(f"{self._route_label()} 애니메이션 정보 조회 (async): {self._build_url(path)}")
+        
+        response = await self._get(path, self._conditional_headers(entry))
+        if response.status_code == 304 and entry:
+            return await asyncio.to_thread(self._revalidated_item, anime_id, entry)
+        
+        info = self._parse_json(response)
+        await asyncio.to_thread(self._store_item, anime_id, info, response.headers)
+        return info
+    
+    async def _direct_get_episode_count(self, anime_id: int) -> Optional[int]:
+        """비동기 HTTP 요청으로 라프텔 에피소드 수 조회 (동일 ID 동시 요청 합치기)"""
+        return await self.episode_flight.do(str(anime_id), self._fetch_episode_count, anime_id)
+    
+    async def _fetch_episode_count(self, anime_id: int) -> Optional[int]:
+        """에피소드 목록을 스트리밍으로 읽어 화수 계산"""
+        path = self._episodes_path(anime_id)
+        await self.rate_limiters['episodes'].acquire_async()
+        print(f"{self._route_label()} 에피소드 수 조회 (async): {self._build_url(path)}")
+        
+        response = await self._get(path, stream=True)
+        try:
+            if response.status_code != 200:
+                text = (await response.aread()).decode('utf-8', errors='replace')
+                raise self._http_error(response.status_code, text, response.headers)
+            
+            # 청크 파싱은 CPU 작업이므로 이벤트 루프를 막지 않도록 워커 스레드에서 실행
+            reader = EpisodeCountReader()
+            async for chunk in response.aiter_bytes():
+                await asyncio.to_thread(reader.feed, chunk)
+        finally:
+            await response.aclose()
+        
+        try:
+            return reader.result()
+        except (json.JSONDecodeError, UnicodeDecodeError, ValueError) as e:
+            raise Exception(f"JSON 파싱 실패: {e}")
+    
+    def _finish_prefetch(self, prefetch: Optional[EpisodePrefetch]) -> None:
+        """
+        사전 조회 결과 집계
+        
+        쓰지 않은 조회의 대기는 취소하지만, 요청은 동시 요청 합치기 공유 작업으로 이미 나갔으므로 낭비로 기록
+        """
+        if prefetch is None:
+            return
+        
+        if prefetch.used:
+            self._record_prefetch("used")
+        else:
+            prefetch.future.cancel()
+            self._record_prefetch("wasted")
+    
+    async def _extract_total_episodes(self, info: Dict[str, Any], anime_id: int, memo: Optional[int] = None,
+                                      prefetch: Optional[EpisodePrefetch] = None) -> Optional[int]:
+        """총 화수 정보 추출 (여러 방법 시도)"""
+        try:
+            total = self._episodes_from_info(info)
+            if total:
+                return total
+            
+            # 완결 작품 화수 메모
+            if memo is not None:
+                return memo
+            
+            try:
+                print(f"🎬 에피소드 API 조회 중...")
+                if prefetch is not None:
+                    prefetch.used = True
+                    total = await prefetch.future
+                else:
+                    total = await self._direct_get_episode_count(anime_id)
+                if total:
+                    print(f"📺 에피소드 API에서 총 {total}화 확인")
+                    await asyncio.to_thread(self._memoize_episode_count, anime_id, info, total)
+                    return total
+            except Exception as e:
+                print(f"⚠️ 에피소드 API 실패: {str(e)[:100]}...")
+            
+            return self._episodes_from_fallback(info)
+        
+        except Exception as e:
+            print(f"⚠️ 총 화수 추출 실패: {e}")
+            return None
+    
+    async def search_anime(self, user_input: str) -> SearchResult:
+        """
+        애니메이션 검색 (비동기)
+        
+        Args:
+            user_input: 사용자 입력 애니메이션 제목
+        
+        Returns:
+            SearchResult: 검색 결과 객체
+        """
+        search_query = self.optimize_search_term(user_input)
+        
+        try:
+            self._print_search_start(user_input, search_query)
+            
+            search_results = await self.retry_policy.acall(self._direct_search_anime, search_query)
+            
+            if not search_results:
+                variant_query, variant_results = await self._search_variants(user_input)
+                if variant_results:
+                    search_query, search_results = variant_query, variant_results
+            
+            return self._build_search_result(user_input, search_query, search_results)
+        
+        except Exception as e:
+            return self._search_failure(user_input, search_query, e)
+    
+    async def _search_variant(self, query: str) -> List[Any]:
+        """대체 검색어 1개 검색 (실패는 빈 결과로 처리)"""
+        try:
+            return await self.retry_policy.acall(self._direct_search_anime, query)
+        except Exception as e:
+            print(f"⚠️ 대체 검색 실패 '{query}': {e}")
+            return []
+    
+    async def _search_variants(self, user_input: str) -> Tuple[Optional[str], Optional[List[Any]]]:
+        """대체 검색어 병렬 검색 후 우선순위가 가장 높은 결과 반환"""
+        queries = self._fallback_queries(user_input)
+        if not queries:
+            return None, None
+        
+        print(f"🔁 검색 결과 없음 - 대체 검색어 {len(queries)}개 병렬 검색: {queries}")
+        results = await asyncio.gather(*(self._search_variant(query) for query in queries))
+        return self._pick_variant_result(queries, results)
+    
+    async def get_anime_by_name(self, anime_name: str) -> Optional[Dict[str, Any]]:
+        """애니메이션 이름으로 정확한 객체 찾기 (비동기)"""
+        try:
+            search_results = await self._direct_search_anime(anime_name)
+            return self._select_by_name(search_results, anime_name)
+        
+        except Exception as e:
+            print(f"❌ 애니메이션 검색 실패: {e}")
+            return None
+    
+    async def get_metadata(self, selected_title: str) -> MetadataResult:
+        """
+        선택된 애니메이션의 메타데이터 수집 (비동기, 제목으로 ID 재검색)
+        
+        Args:
+            selected_title: 선택된 애니메이션 제목
+        
+        Returns:
+            MetadataResult: 메타데이터 수집 결과
+        """
+        try:
+            print(f"🔍 애니메이션 ID 검색 중...")
+            print(f"   선택된 제목: {selected_title}")
+            
+            anime_obj = await self.get_anime_by_name(selected_title)
+            
+            failure = self._missing_anime_result(selected_title, anime_obj)
+            if failure:
+                return failure
+        
+        except Exception as e:
+            return self._metadata_failure(selected_title, e)
+        
+        return await self.get_metadata_by_id(anime_obj['id'], selected_title)
+    
+    async def get_metadata_by_id(self, anime_id: Any,
+                                 selected_title: Optional[str] = None) -> MetadataResult:
+        """
+        라프텔 ID로 메타데이터 직접 수집 (비동기)
+        
+        Args:
+            anime_id: Step 1 후보의 라프텔 ID
+            selected_title: 선택된 애니메이션 제목 (결과 기록용)
+        
+        Returns:
+            MetadataResult: 메타데이터 수집 결과
+        """
+        selected_title = selected_title or str(anime_id)
+        prefetch = None
+        
+        try:
+            print(f"📊 상세 정보 수집 중... (ID: {anime_id})")
+            
+            # 상세 정보 캐시는 한 번만 읽어 사전 조회 판단과 상세 정보 조회에 함께 사용 (히트 중복 집계 방지)
+            cached = await asyncio.to_thread(self._get_cached_item, anime_id)
+            memo, should_prefetch = await asyncio.to_thread(self._plan_episode_fetch, anime_id, cached[0])
+            
+            # 에피소드 조회는 anime_id에만 의존하므로 상세 정보 조회와 동시에 시작 (재시도 간 공유)
+            if should_prefetch:
+                prefetch = EpisodePrefetch(asyncio.ensure_future(self._direct_get_episode_count(anime_id)))
+            
+            return await self.retry_policy.acall(
+                self._collect_metadata, anime_id, selected_title, cached, memo, prefetch
+            )
+        
+        except Exception as e:
+            return self._metadata_failure(selected_title, e)
+        
+        finally:
+            self._finish_prefetch(prefetch)
+    
+    async def _collect_metadata(self, anime_id: Any, selected_title: str,
+                                cached: Optional[Tuple[Optional[Dict[str, Any]], bool]] = None,
+                                memo: Optional[int] = None,
+                                prefetch: Optional[EpisodePrefetch] = None) -> MetadataResult:
+        """상세 정보와 총 화수를 조회하여 메타데이터 생성 (1회 시도)"""
+        info = await self._direct_get_anime_info(anime_id, cached)
+        print(f"✅ 기본 정보 수집 완료: {info.get('name', selected_title)}")
+        
+        total_episodes = await self._extract_total_episodes(info, anime_id, memo, prefetch)
+        
+        metadata = self._build_metadata(info, anime_id, selected_title, total_episodes)
+        self._print_metadata(metadata)
+        
+        return MetadataResult(
+            selected_title=selected_title,
+            metadata=metadata,
+            success=True
+        )
+    
+    async def _get_metadata_one(self, id_or_title: Union[int, str],
+                                semaphore: asyncio.Semaphore) -> MetadataResult:
+        """라프텔 ID 또는 제목 하나의 메타데이터 수집 (예외도 실패 결과로 변환)"""
+        async with semaphore:
+            try:
+                if self._is_laftel_id(id_or_title):
+                    return await self.get_metadata_by_id(str(id_or_title).strip())
+                return await self.get_metadata(id_or_title)
+            except Exception as e:
+                return self._metadata_failure(str(id_or_title), e)
+    
+    async def get_metadata_many(self, ids_or_titles: List[Union[int, str]],
+                                concurrency: Optional[int] = None) -> List[MetadataResult]:
+        """
+        여러 작품의 메타데이터를 동시에 수집 (비동기)
+        
+        Args:
+            ids_or_titles: 라프텔 ID(숫자) 또는 애니메이션 제목 목록
+            concurrency: 동시 처리 수 (기본값: 설정값)
+        
+        Returns:
+            입력 순서와 같은 MetadataResult 목록 (항목별 실패는 success=False)
+        """
+        if not ids_or_titles:
+            return []
+        
+        concurrency = max(1, concurrency or settings.laftel_metadata_concurrency)
+        print(f"📦 메타데이터 일괄 수집 (async): {len(ids_or_titles)}개 (동시 {concurrency}개)")
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        results = await asyncio.gather(
+            *(self._get_metadata_one(item, semaphore) for item in ids_or_titles)
+        )
+        
+        succeeded = sum(1 for result in results if result.success)
+        print(f"📦 메타데이터 일괄 수집 완료: 성공 {succeeded}개 / 실패 {len(results) - succeeded}개")
+        return list(results)
+    
+    async def get_metadata_for_match(self, llm_result: LLMMatchResult) -> MetadataResult:
+        """Step 2 매칭 결과로 메타데이터 수집 (라프텔 ID 우선)"""
+        if llm_result.laftel_id:
+            print(f"🆔 Step 1 라프텔 ID 사용: {llm_result.laftel_id}")
+            return await self.get_metadata_by_id(llm_result.laftel_id, llm_result.selected_title)
+        
+        return await self.get_metadata(llm_result.selected_title)
@@ -0,0 +1,330 @@
+# ⚡ OpenAI 비동기 매칭 클라이언트
+"""
+openai.AsyncOpenAI 기반 Step 2 비동기 매칭 클라이언트
+- OpenAIClient와 동일한 find_best_match / find_best_matches 계약
+- 프로세스 전역 AsyncOpenAI 클라이언트와 동시 호출 상한(openai_async_concurrency) 공유
+- 동기 클라이언트와 같은 분당 요청 수/토큰 수 버킷을 사용하여 배치와 API 트래픽이 계정 한도를 나눠 씀
+- API 서버에서 스레드풀 점유 없이 이벤트 루프 하나로 동시 매칭 처리
+"""
+
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+from typing import List, Dict, Any, Optional, Tuple
+
+import openai
+
+from .models import LLMCallMetrics, LLMMatchResult, SearchCandidate
+from .config import settings
+from .openai_client import AssistantRunTimeout, OpenAIClientBase, estimate_request_tokens
+
+# 프로세스 전역 공유 OpenAI 클라이언트
+_shared_openai_client: Optional[openai.AsyncOpenAI] = None
+
+def get_shared_openai_client() -> openai.AsyncOpenAI:
+    """공유 openai.AsyncOpenAI 반환 (없거나 닫혔으면 새로 생성)"""
+    global _shared_openai_client
+    
+    if _shared_openai_client is None or _shared_openai_client.is_closed():
+        # SDK 내장 재시도는 끄고 공통 재시도 정책 하나로 관리 (재시도 중첩 방지)
+        _shared_openai_client = openai.AsyncOpenAI(api_key=settings.openai_api_key, max_retries=0)
+    
+    return _shared_openai_client
+
+async def close_shared_openai_client() -> None:
+    """공유 openai.AsyncOpenAI 종료 (서버 종료시 호출)"""
+    global _shared_openai_client
+    
+    if _shared_openai_client is not None and not _shared_openai_client.is_closed():
+        await _shared_openai_client.close()
+    _shared_openai_client = None
+
+class AsyncConcurrencyLimiter:
+    """이벤트 루프 내 동시 호출 상한 (초과 호출은 선착순 대기)"""
+    
+    def __init__(self, name: str, limit: int):
+        """
+        Args:
+            name: 지표 표시용 이름
+            limit: 최대 동시 호출 수
+        """
+        self.name = name
+        self.limit = max(1, limit)
+        
+        # 세마포어는 사용하는 이벤트 루프에 묶이므로 루프가 바뀌면 새로 생성
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        self.in_flight = 0
+        self.queued = 0
+        self.acquired = 0
+        self.waited = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.limit)
+            self._loop = loop
+        return self._semaphore
+    
+    @asynccontextmanager
+    async def slot(self):
+        """호출 슬롯 확보 (빈 슬롯이 없으면 대기), 대기한 시간을 전달"""
+        semaphore = self._get_semaphore()
+        
+        start = time.monotonic()
+        self.queued += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self.queued -= 1
+        
+        wait = time.monotonic() - start
+        self.acquired += 1
+        if wait > 0.001:
+            self.waited += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+        
+        self.in_flight += 1
+        try:
+            yield wait
+        finally:
+            self.in_flight -= 1
+            semaphore.release()
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "total_wait": round(self.total_wait, 3),
+            "avg_wait": round(self.total_wait / self.waited, 3) if self.waited else 0.0,
+            "max_wait": round(self.max_wait, 3)
+        }
+
+class AsyncOpenAIClient(OpenAIClientBase):
+    """OpenAI 비동기 매칭 클라이언트"""
+    
+    # 동시 호출 상한 (모든 인스턴스가 공유)
+    concurrency = AsyncConcurrencyLimiter("OpenAI 호출", settings.openai_async_concurrency)
+    log_suffix = " (async)"
+    
+    def __init__(self, client: Optional[openai.AsyncOpenAI] = None):
+        """
+        클라이언트 초기화
+        
+        Args:
+            client: 사용할 AsyncOpenAI (None이면 프로세스 전역 공유 클라이언트)
+        """
+        super().__init__()
+        self._client = client
+    
+    @property
+    def client(self) -> openai.AsyncOpenAI:
+        return self._client or get_shared_openai_client()
+    
+    async def find_best_match(self, user_input: str, candidates: List[SearchCandidate]) -> LLMMatchResult:
+        """
+        사용자 입력과 후보 목록을 기반으로 최적 매칭 찾기 (비동기)
+        
+        Args:
+            user_input: 사용자가 입력한 애니메이션 제목
+            candidates: 라프텔 검색 결과 후보 목록
+        
+        Returns:
+            LLMMatchResult: LLM 매칭 결과
+        """
+        metrics = LLMCallMetrics(backend=self.backend)
+        
+        try:
+            resolved = self._resolve_without_call(user_input, candidates)
+            if resolved:
+                return resolved
+            
+            # 프롬프트에는 유사도 상위 후보만 전달 (번호 기반 응답 파싱도 같은 목록 기준)
+            prompt_candidates = self._prompt_candidates(user_input, candidates)
+            
+            if self.backend == "chat":
+                print(f"🤖 Chat Completions 호출 중... (async, 모델: {self.model})")
+                response_text = await self.retry_policies["chat"].acall(
+                    self._run_chat_completion, user_input, prompt_candidates, metrics
+                )
+            else:
+                print(f"🤖 Assistant 호출 중... (async, ID: {self.assistant_id})")
+                user_message = self._build_user_message(user_input, prompt_candidates)
+                deadline = time.monotonic() + settings.openai_run_timeout
+                response_text = await self.retry_policies["assistant"].acall(
+                    self._run_assistant, user_message, metrics, deadline
+                )
+            
+            result = self._finish_match(response_text, user_input, candidates, prompt_candidates)
+        
+        except Exception as e:
+            result = self._call_failure(user_input, candidates, e)
+        
+        return self._attach_metrics(result, metrics)
+    
+    async def find_best_matches(self, items: List[Tuple[str, List[SearchCandidate]]]) -> List[LLMMatchResult]:
+        """
+        여러 제목을 묶어서 매칭 (비동기, 묶음 요청은 동시 호출 상한 안에서 병렬 실행)
+        
+        Args:
+            items: (사용자 입력, 후보 목록) 목록
+        
+        Returns:
+            items와 같은 순서의 LLMMatchResult 목록
+        """
+        results: List[Optional[LLMMatchResult]] = [None] * len(items)
+        
+        if not settings.openai_api_key:
+            return list(await asyncio.gather(
+                *(self.find_best_match(user_input, candidates) for user_input, candidates in items)
+            ))
+        
+        leftover: Dict[int, LLMCallMetrics] = {}
+        
+        async def run_chunk(chunk: List[int]) -> None:
+            print(f"🤖 묶음 매칭 호출 중... (async, {len(chunk)}개 제목, 모델: {self.model})")
+            metrics = LLMCallMetrics(source="packed", backend="chat")
+            try:
+                packed = await self.retry_policies["packed"].acall(
+                    self._run_packed_completion,
+                    [(items[position][0], self._prompt_candidates(*items[position])) for position in chunk],
+                    metrics
+                )
+            except Exception as e:
+                print(f"⚠️ 묶음 매칭 실패 - 개별 매칭으로 진행: {e}")
+                packed = {}
+            
+            leftover.update(self._apply_packed(chunk, packed, items, results, metrics))
+        
+        await asyncio.gather(*(run_chunk(chunk) for chunk in self._pending_for_pack(items, results)))
+        
+        # 묶음에서 해결하지 못한 항목은 단건 경로로 처리 (묶음 호출 몫은 계측에 합산)
+        remaining = [position for position in range(len(items)) if results[position] is None]
+        fallbacks = await asyncio.gather(*(self.find_best_match(*items[position]) for position in remaining))
+        for position, result in zip(remaining, fallbacks):
+            self._merge_leftover_metrics(result, leftover.get(position))
+            results[position] = result
+        
+        return results
+    
+    async def _acquire_quota(self, body: Dict[str, Any], metrics: LLMCallMetrics,
+                             slot_wait: float = 0.0) -> float:
+        """요청 전 계정 한도 확보 (분당 요청 수/토큰 수를 넘으면 429 대신 대기), 대기한 시간 반환"""
+        waited = await self.rate_limiters["requests"].acquire_async()
+        waited += await self.rate_limiters["tokens"].acquire_async(estimate_request_tokens(body))
+        if waited > 0:
+            print(f"🚦 OpenAI 한도 대기: {waited:.2f}초")
+        
+        # 동시 호출 상한 대기도 로컬 대기 시간에 포함
+        metrics.queue_seconds += slot_wait + waited
+        metrics.api_calls += 1
+        return waited
+    
+    async def _create_completion(self, body: Dict[str, Any], metrics: LLMCallMetrics) -> Optional[str]:
+        """슬롯/한도 확보 후 Chat Completions 호출, 응답 본문 반환 (실행 시간/토큰 사용량 기록)"""
+        async with self.concurrency.slot() as slot_wait:
+            await self._acquire_quota(body, metrics, slot_wait)
+            
+            started = time.monotonic()
+            try:
+                response = await self.client.chat.completions.create(**body)
+            finally:
+                metrics.run_seconds += time.monotonic() - started
+        
+        metrics.add_usage(getattr(response, 'usage', None))
+        return self._completion_content(response)
+    
+    async def _run_packed_completion(self, group: List[Tuple[str, List[SearchCandidate]]],
+                                     metrics: LLMCallMetrics) -> Dict[str, Any]:
+        """여러 항목을 한 번의 구조화 요청으로 매칭하고 {item_N: 응답} 반환 (1회 시도)"""
+        return json.loads(await self._create_completion(self.build_packed_request(group), metrics))
+    
+    async def _run_chat_completion(self, user_input: str, candidates: List[SearchCandidate],
+                                   metrics: LLMCallMetrics) -> Optional[str]:
+        """Chat Completions 구조화 출력 호출 및 응답 JSON 텍스트 반환 (1회 시도)"""
+        content = await self._create_completion(self.build_chat_request(user_input, candidates), metrics)
+        print("✅ Chat Completions 응답 수신 완료 (async)")
+        return content
+    
+    async def _run_assistant(self, user_message: str, metrics: LLMCallMetrics, deadline: float) -> Optional[str]:
+        """스레드 생성 + Assistant 실행 후 응답 텍스트 반환 (1회 시도, 사용한 스레드는 삭제)"""
+        async with self.concurrency.slot() as slot_wait:
+            await self._acquire_quota(self._assistant_request_body(user_message), metrics, slot_wait)
+            self._check_deadline(deadline)
+            
+            started = time.monotonic()
+            run = await self.client.beta.threads.create_and_run(
+                assistant_id=self.assistant_id,
+                thread={"messages": [{"role": "user", "content": user_message}]}
+            )
+            
+            try:
+                run = await self._wait_for_run(run, metrics, started, deadline)
+                
+                if run.status != 'completed':
+                    raise self._assistant_run_error(run)
+                
+                # 이번 실행이 생성한 응답 메시지만 조회
+                messages = await self.client.beta.threads.messages.list(
+                    thread_id=run.thread_id,
+                    run_id=run.id
+                )
+                
+                print("✅ Assistant 응답 수신 완료 (async)")
+                return self._assistant_reply(messages)
+            
+            finally:
+                metrics.run_seconds += time.monotonic() - started
+                await self._delete_thread(run.thread_id)
+    
+    async def _wait_for_run(self, run, metrics: LLMCallMetrics, started: float, deadline: float):
+        """실행 완료 대기 (OpenAIClient._wait_for_run과 같은 적응형 폴링, 대기 중에는 이벤트 루프에 양보)"""
+        interval = settings.openai_poll_initial_interval
+        queued_until = self._observe_run(run, metrics, started, None)
+        
+        while run.status in ['queued', 'in_progress', 'cancelling']:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                await self._cancel_run(run)
+                raise AssistantRunTimeout("Assistant 응답 시간 초과")
+            
+            await asyncio.sleep(min(interval, remaining))
+            interval = self._next_poll_interval(interval)
+            
+            run = await self.client.beta.threads.runs.retrieve(
+                thread_id=run.thread_id,
+                run_id=run.id
+            )
+            metrics.poll_count += 1
+            queued_until = self._observe_run(run, metrics, started, queued_until)
+        
+        return run
+    
+    async def _cancel_run(self, run) -> None:
+        """시간 초과된 실행 취소 (실패해도 무시)"""
+        try:
+            await self.client.beta.threads.runs.cancel(thread_id=run.thread_id, run_id=run.id)
+        except Exception as e:
+            print(f"⚠️ Assistant 실행 취소 실패: {e}")
+    
+    async def _delete_thread(self, thread_id: str) -> None:
+        """사용이 끝난 스레드 삭제 (실패해도 무시)"""
+        if not settings.openai_delete_threads:
+            return
+        
+        try:
+            await self.client.beta.threads.delete(thread_id)
+        except Exception as e:
+            print(f"⚠️ 스레드 삭제 실패: {e}")
+    
+    def concurrency_stats(self) -> Dict[str, Any]:
+        """동시 호출 상한 대기 지표"""
+        return self.concurrency.stats()
@@ -0,0 +1,224 @@
+# 💾 SQLite 기반 로컬 캐시
+"""
+디스크 기반 키-값 캐시
+- productions_dir 아래 SQLite 파일 하나에 테이블 단위로 저장
+- 항목별 TTL, 최근 사용 순(LRU) 크기 제한, 히트/미스 카운터 제공
+- 스레드 간 공유 가능 (커넥션 하나 + 락)
+- 조회는 쓰기 없이 처리 (마지막 사용 시각은 모아서 기록, 크기 정리는 저장 N회마다)
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Any, Dict, Optional, Tuple
+
+from .config import settings
+
+# 마지막 사용 시각을 메모리에 모았다가 한 번에 기록하는 단위 (조회마다 UPDATE + 커밋하지 않음)
+TOUCH_FLUSH_SIZE = 64
+# 크기 정리 주기 상한 (저장 N회마다 항목 수 확인, 최대 항목 수의 10%를 넘지 않게)
+EVICT_INTERVAL = 100
+
+def normalize_cache_key(text: str) -> str:
+    """캐시 키 정규화 (전각/반각 통일, 대소문자 무시, 공백 정리)"""
+    normalized = unicodedata.normalize('NFKC', text).casefold()
+    return re.sub(r'\s+', ' ', normalized).strip()
+
+class SqliteCache:
+    """TTL + LRU 크기 제한을 지원하는 SQLite 캐시 테이블"""
+    
+    def __init__(self, db_path: str, table: str, ttl_seconds: float, max_entries: int):
+        """
+        캐시 초기화
+        
+        Args:
+            db_path: SQLite 파일 경로
+            table: 사용할 테이블 이름
+            ttl_seconds: 기본 만료 시간 (초)
+            max_entries: 최대 항목 수 (초과시 오래 사용되지 않은 항목부터 삭제)
+        """
+        if not re.fullmatch(r'[A-Za-z_][A-Za-z0-9_]*', table):
+            raise ValueError(f"잘못된 캐시 테이블 이름: {table}")
+        
+        self.db_path = db_path
+        self.table = table
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0  # 만료됐지만 재검증용으로 남아 있던 항목 조회 수
+        
+        self._lock = threading.Lock()
+        self._touches: Dict[str, float] = {}  # 아직 기록하지 않은 마지막 사용 시각
+        self._evict_interval = max(1, min(EVICT_INTERVAL, max_entries // 10))
+        self._sets_since_evict = 0
+        
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        
+        self._conn = sqlite3.connect(db_path, timeout=10, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"""CREATE TABLE IF NOT EXISTS {table} (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_last_access ON {table} (last_access)"
+        )
+        self._conn.commit()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """만료되지 않은 값 조회 (없거나 만료되면 None)"""
+        now = time.time()
+        
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+            
+            if row is None or row[1] <= now:
+                self.misses += 1
+                return None
+            
+            self._touch(key, now)
+            self.hits += 1
+        
+        return json.loads(row[0])
+    
+    def get_entry(self, key: str) -> Optional[Tuple[Any, bool]]:
+        """
+        만료 여부와 관계없이 값 조회 (조건부 요청 재검증용)
+        
+        Returns:
+            (값, 만료 전 여부) 또는 항목이 없으면 None
+        """
+        now = time.time()
+        
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+            
+            if row is None:
+                self.misses += 1
+                return None
+            
+            self._touch(key, now)
+            
+            fresh = row[1] > now
+            if fresh:
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+        
+        return json.loads(row[0]), fresh
+    
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """값 저장 (ttl_seconds 미지정시 기본 TTL 적용)"""
+        now = time.time()
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        payload = json.dumps(value, ensure_ascii=False, default=str)
+        
+        with self._lock:
+            self._touches.pop(key, None)
+            self._conn.execute(
+                f"""INSERT OR REPLACE INTO {self.table}
+                    (key, value, created_at, expires_at, last_access)
+                    VALUES (?, ?, ?, ?, ?)""",
+                (key, payload, now, now + ttl, now)
+            )
+            
+            self._sets_since_evict += 1
+            if self._sets_since_evict >= self._evict_interval:
+                self._sets_since_evict = 0
+                self._flush_touches()
+                self._evict()
+            self._conn.commit()
+    
+    def delete(self, key: str) -> None:
+        """항목 삭제"""
+        with self._lock:
+            self._touches.pop(key, None)
+            self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+            self._conn.commit()
+    
+    def _touch(self, key: str, now: float) -> None:
+        """마지막 사용 시각 기록 예약 (TOUCH_FLUSH_SIZE개가 모이면 한 번에 기록, 락 보유 상태에서 호출)"""
+        self._touches[key] = now
+        if len(self._touches) >= TOUCH_FLUSH_SIZE:
+            self._flush_touches()
+            self._conn.commit()
+    
+    def _flush_touches(self) -> None:
+        """모아 둔 마지막 사용 시각을 한 번에 기록 (커밋은 호출자가 처리, 락 보유 상태에서 호출)"""
+        if not self._touches:
+            return
+        
+        self._conn.executemany(
+            f"UPDATE {self.table} SET last_access = ? WHERE key = ?",
+            [(accessed, key) for key, accessed in self._touches.items()]
+        )
+        self._touches.clear()
+    
+    def _evict(self) -> None:
+        """최대 항목 수 초과분을 최근 사용 순으로 정리 (락 보유 상태에서 호출)"""
+        count = self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow <= 0:
+            return
+        
+        self._conn.execute(
+            f"""DELETE FROM {self.table} WHERE key IN (
+                SELECT key FROM {self.table} ORDER BY last_access ASC LIMIT ?
+            )""",
+            (overflow,)
+        )
+    
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 (히트/미스/항목 수)"""
+        with self._lock:
+            size = self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+        
+        total = self.hits + self.misses
+        return {
+            "table": self.table,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale_hits": self.stale_hits,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "size": size,
+            "max_entries": self.max_entries
+        }
+    
+    def close(self) -> None:
+        with self._lock:
+            self._flush_touches()
+            self._conn.commit()
+            self._conn.close()
+
+# 프로세스 전역 캐시 레지스트리 (요청마다 클라이언트를 새로 만들어도 같은 캐시 공유)
+_caches: Dict[Tuple[str, str], SqliteCache] = {}
+_caches_lock = threading.Lock()
+
+def get_cache(table: str, ttl_seconds: float, max_entries: int,
+              db_path: Optional[str] = None) -> SqliteCache:
+    """테이블별 공유 캐시 인스턴스 반환"""
+    db_path = db_path or settings.get_cache_path()
+    
+    with _caches_lock:
+        cache = _caches.get((db_path, table))
+        if cache is None:
+            cache = SqliteCache(db_path, table, ttl_seconds, max_entries)
+            _caches[(db_path, table)] = cache
+        return cache
@@ -0,0 +1,312 @@
+# 📚 라프텔 카탈로그 로컬 인덱스
+"""
+라프텔 작품 목록 로컬 인덱스
+- 작품 ID, 제목, 별칭, 방영 분기를 SQLite에 저장하고 FTS5 trigram으로 부분 문자열 검색
+- 전체 수집(discover 목록 크롤링) 후에는 Step 1 검색을 네트워크 없이 로컬에서 처리
+- 최신순 증분 갱신 및 라이브 검색/상세 조회 결과 write-through로 최신 상태 유지
+- FTS5 trigram을 지원하지 않는 SQLite에서는 LIKE 검색으로 대체
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .config import settings
+
+# 응답에 포함되어 있을 경우 별칭으로 색인할 필드
+ALT_NAME_FIELDS = ('original_name', 'name_en', 'alias', 'aliases')
+
+# 증분 갱신 기준점: 마지막으로 끝까지 진행한 수집에서 목록 맨 앞에 있던 작품 ID들
+WATERMARK_KEY = 'discover_watermark'
+
+def compact_key(text: str) -> str:
+    """검색용 키 (전각/반각 통일, 대소문자 무시, 공백 제거)"""
+    normalized = unicodedata.normalize('NFKC', text).casefold()
+    return re.sub(r'\s+', '', normalized)
+
+class CatalogIndex:
+    """라프텔 작품 목록 SQLite 인덱스"""
+    
+    def __init__(self, db_path: str):
+        """
+        인덱스 초기화
+        
+        Args:
+            db_path: SQLite 파일 경로
+        """
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        
+        self._lock = threading.Lock()
+        
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        
+        self._conn = sqlite3.connect(db_path, timeout=10, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS catalog_items (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                alt_names TEXT NOT NULL DEFAULT '',
+                air_year_quarter TEXT,
+                updated_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS catalog_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        
+        # 검색어 테이블: rowid = 작품 ID, terms = 제목/별칭 압축 키
+        try:
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS catalog_fts USING fts5(terms, tokenize='trigram')"
+            )
+            self.terms_table = "catalog_fts"
+            self.fts_enabled = True
+        except sqlite3.OperationalError:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS catalog_terms (id INTEGER PRIMARY KEY, terms TEXT NOT NULL)"
+            )
+            self.terms_table = "catalog_terms"
+            self.fts_enabled = False
+        
+        self._conn.commit()
+    
+    def _alternate_names(self, item: Dict[str, Any]) -> List[str]:
+        """응답에 있는 별칭 필드 수집"""
+        names = []
+        for field in ALT_NAME_FIELDS:
+            value = item.get(field)
+            if isinstance(value, str):
+                names.append(value)
+            elif isinstance(value, list):
+                names.extend(v for v in value if isinstance(v, str))
+        return [name for name in names if name.strip()]
+    
+    def upsert_items(self, items: List[Any]) -> int:
+        """
+        검색/목록/상세 응답 항목 저장
+        
+        Returns:
+            새로 추가된 작품 수
+        """
+        rows = []
+        for item in items:
+            if isinstance(item, dict) and item.get('id') and item.get('name'):
+                rows.append(item)
+        
+        if not rows:
+            return 0
+        
+        now = time.time()
+        added = 0
+        
+        with self._lock:
+            for item in rows:
+                anime_id = int(item['id'])
+                alt_names = self._alternate_names(item)
+                
+                existing = self._conn.execute(
+                    "SELECT air_year_quarter FROM catalog_items WHERE id = ?", (anime_id,)
+                ).fetchone()
+                if existing is None:
+                    added += 1
+                
+                # 목록 응답에는 방영 분기가 없을 수 있으므로 기존 값 유지
+                air_year_quarter = item.get('air_year_quarter') or (existing[0] if existing else None)
+                
+                self._conn.execute(
+                    """INSERT OR REPLACE INTO catalog_items
+                        (id, name, alt_names, air_year_quarter, updated_at)
+                        VALUES (?, ?, ?, ?, ?)""",
+                    (anime_id, item['name'], '\n'.join(alt_names), air_year_quarter, now)
+                )
+                
+                terms = '\n'.join(compact_key(name) for name in [item['name'], *alt_names])
+                self._conn.execute(f"DELETE FROM {self.terms_table} WHERE rowid = ?", (anime_id,))
+                self._conn.execute(
+                    f"INSERT INTO {self.terms_table} (rowid, terms) VALUES (?, ?)", (anime_id, terms)
+                )
+            
+            self._conn.commit()
+        
+        return added
+    
+    def search(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        제목/별칭 부분 문자열 검색
+        
+        Returns:
+            라프텔 검색 응답과 같은 형태의 항목 목록 (id, name, air_year_quarter)
+        """
+        term = compact_key(query)
+        if not term:
+            return []
+        
+        if self.fts_enabled and len(term) >= 3:
+            # trigram 토크나이저: 3글자 이상 부분 문자열 일치
+            sql = """SELECT i.id, i.name, i.air_year_quarter
+                     FROM catalog_fts f JOIN catalog_items i ON i.id = f.rowid
+                     WHERE catalog_fts MATCH ?
+                     ORDER BY bm25(catalog_fts), length(i.name)
+                     LIMIT ?"""
+            params = ('"' + term.replace('"', '""') + '"', limit)
+        else:
+            escaped = term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            sql = f"""SELECT i.id, i.name, i.air_year_quarter
+                      FROM {self.terms_table} t JOIN catalog_items i ON i.id = t.rowid
+                      WHERE t.terms LIKE ? ESCAPE '\\'
+                      ORDER BY length(i.name)
+                      LIMIT ?"""
+            params = (f'%{escaped}%', limit)
+        
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+            if rows:
+                self.hits += 1
+            else:
+                self.misses += 1
+        
+        results = [
+            {"id": anime_id, "name": name, "air_year_quarter": air_year_quarter}
+            for anime_id, name, air_year_quarter in rows
+        ]
+        
+        # 제목이 정확히 일치하는 작품을 맨 앞으로
+        results.sort(key=lambda item: compact_key(item['name']) != term)
+        return results
+    
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM catalog_meta WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def set_meta(self, key: str, value: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO catalog_meta (key, value) VALUES (?, ?)", (key, value)
+            )
+            self._conn.commit()
+    
+    def is_authoritative(self, max_age: float) -> bool:
+        """
+        로컬 검색 결과를 라이브 검색 대신 사용할 수 있는지 여부
+        
+        전체 수집이 한 번 이상 끝났고, 마지막 수집/갱신이 max_age초 이내여야 한다.
+        """
+        full_build = self.get_meta('last_full_build')
+        if not full_build:
+            return False
+        
+        last_update = max(float(full_build), float(self.get_meta('last_refresh') or 0))
+        return time.time() - last_update < max_age
+    
+    def stats(self) -> Dict[str, Any]:
+        """인덱스 통계"""
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM catalog_items").fetchone()[0]
+        
+        return {
+            "size": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "fts_enabled": self.fts_enabled,
+            "authoritative": self.is_authoritative(settings.laftel_catalog_max_age),
+            "last_full_build": self.get_meta('last_full_build'),
+            "last_refresh": self.get_meta('last_refresh')
+        }
+    
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+def refresh_catalog(index: CatalogIndex,
+                    fetch_page: Callable[[int, int], Tuple[List[Any], Optional[int]]],
+                    full: bool = False,
+                    page_size: int = 60,
+                    max_pages: Optional[int] = None) -> Dict[str, Any]:
+    """
+    라프텔 작품 목록을 페이지 단위로 수집하여 인덱스 갱신
+    
+    Args:
+        index: 갱신할 인덱스
+        fetch_page: (offset, size) → (항목 목록, 전체 개수 또는 None)
+        full: True면 목록 끝까지 수집, False면 지난 수집의 맨 앞 작품(기준점)이 나오는 페이지에서 중단
+            (최신순 증분 갱신, 기준점이 없으면 목록 끝까지)
+        page_size: 페이지당 항목 수
+        max_pages: 최대 수집 페이지 수 (None이면 제한 없음)
+    
+    Returns:
+        수집 통계 (pages, fetched, added, completed)
+    """
+    offset = 0
+    pages = 0
+    fetched = 0
+    added = 0
+    completed = False
+    
+    # 새 작품 수(upsert 결과)로 중단하면 write-through로 먼저 저장된 작품 뒤의 미수집 작품을 놓치므로
+    # 지난 수집에서 본 목록 맨 앞 작품 ID를 기준점으로 사용
+    watermark = set() if full else set((index.get_meta(WATERMARK_KEY) or '').split(',')) - {''}
+    head: List[str] = []
+    
+    while True:
+        if max_pages is not None and pages >= max_pages:
+            break
+        
+        items, total = fetch_page(offset, page_size)
+        pages += 1
+        
+        if not items:
+            completed = True
+            break
+        
+        if not head:
+            head = [str(item['id']) for item in items if isinstance(item, dict) and item.get('id')]
+        
+        new_items = index.upsert_items(items)
+        fetched += len(items)
+        added += new_items
+        offset += len(items)
+        print(f"📚 카탈로그 수집: {fetched}개 (신규 {added}개)")
+        
+        if total is not None and offset >= total:
+            completed = True
+            break
+        
+        if watermark.intersection(str(item.get('id')) for item in items if isinstance(item, dict)):
+            # 기준점 이후 페이지는 지난 수집에서 이미 본 작품
+            completed = True
+            break
+    
+    now = str(time.time())
+    if completed:
+        index.set_meta('last_full_build' if full else 'last_refresh', now)
+        if head:
+            index.set_meta(WATERMARK_KEY, ','.join(head))
+    
+    return {"pages": pages, "fetched": fetched, "added": added, "completed": completed}
+
+# 프로세스 전역 인덱스 레지스트리
+_indexes: Dict[str, CatalogIndex] = {}
+_indexes_lock = threading.Lock()
+
+def get_catalog_index(db_path: Optional[str] = None) -> CatalogIndex:
+    """공유 카탈로그 인덱스 인스턴스 반환"""
+    db_path = db_path or settings.get_cache_path()
+    
+    with _indexes_lock:
+        index = _indexes.get(db_path)
+        if index is None:
+            index = CatalogIndex(db_path)
+            _indexes[db_path] = index
+        return index
@@ -28,7 +28,7 @@ class AppSettings(BaseSettings):
     
     # === API 키 설정 ===
     openai_api_key: str = Field(..., env="OPENAI_API_KEY")
-    openai_assistant_id: str = Field(..., env="OPENAI_ASSISTANT_ID") 
+    openai_assistant_id: str = Field(default="", env="OPENAI_ASSISTANT_ID")  # assistant 백엔드에서만 필수
     notion_token: str = Field(..., env="NOTION_TOKEN")
     notion_database_id: str = Field(..., env="NOTION_DATABASE_ID")
     laftel_api_key: Optional[str] = Field(default=None, env="LAFTEL_API_KEY")
@@ -48,13 +48,113 @@ class AppSettings(BaseSettings):
     openai_model: str = Field(default="gpt-4o-mini")
     openai_temperature: float = Field(default=0.1)
     openai_max_tokens: int = Field(default=1000)
+    openai_match_backend: str = Field(default="assistant", env="OPENAI_MATCH_BACKEND")  # "assistant" | "chat"
+    openai_system_prompt_path: str = Field(default="docs/system_prompt.md")  # chat 백엔드 시스템 프롬프트
+    openai_run_timeout: float = Field(default=60.0)             # Assistant 매칭 1건 최대 대기 (초, 재시도 포함, 초과시 실행 취소)
+    openai_poll_initial_interval: float = Field(default=0.1)    # 실행 상태 첫 폴링 간격 (초)
+    openai_poll_max_interval: float = Field(default=1.0)        # 실행 상태 최대 폴링 간격 (초)
+    openai_poll_backoff: float = Field(default=1.5)             # 폴링 간격 증가 배수
+    openai_delete_threads: bool = Field(default=True)           # 실행이 끝난 스레드 삭제 여부
+    openai_pack_size: int = Field(default=10)                   # 배치 묶음 매칭 시 요청 1회당 제목 수 (1이면 묶지 않음)
+    openai_pack_tokens_per_item: int = Field(default=200)       # 묶음 매칭 응답 토큰 예산 (제목당)
+    openai_batch_backend: str = Field(default="openai")         # Batch API 백엔드: openai | local (오프라인 검증용)
+    openai_batch_completion_window: str = Field(default="24h")  # Batch API 완료 기한
+    openai_batch_poll_interval: float = Field(default=30.0)     # Batch API 상태 확인 간격 (초)
+    openai_batch_timeout: float = Field(default=90000.0)        # Batch API 최대 대기 (초, 초과시 작업 취소)
+    
+    # === OpenAI 계정 한도 / 동시성 / 요금 설정 (한도는 0 이하이면 제한 없음) ===
+    openai_rpm_limit: float = Field(default=500.0)              # 분당 요청 수 (동기/비동기 클라이언트 공유)
+    openai_tpm_limit: float = Field(default=200000.0)           # 분당 토큰 수 (프롬프트 추정치 + max_tokens)
+    openai_burst_seconds: float = Field(default=10.0)           # 한 번에 몰아서 쓸 수 있는 한도 (초 분량)
+    openai_async_concurrency: int = Field(default=8)            # 비동기 클라이언트 최대 동시 호출 수
+    openai_input_price_per_1m: float = Field(default=0.15)      # 입력 토큰 100만 개당 요금 (USD, 비용 추정용)
+    openai_output_price_per_1m: float = Field(default=0.60)     # 출력 토큰 100만 개당 요금 (USD, 비용 추정용)
+    openai_batch_price_ratio: float = Field(default=0.5)        # Batch API 요금 비율 (일반 요청 대비)
+    
+    # === 로컬 사전 매칭 / 후보 축소 설정 ===
+    local_match_enabled: bool = Field(default=False)
+    local_match_threshold: float = Field(default=90.0)    # 채택 최소 점수 (제목 유사도 %)
+    local_match_margin: float = Field(default=10.0)       # 2위 작품과의 최소 점수 차이
+    llm_candidate_prerank_enabled: bool = Field(default=False)  # LLM에 유사도 상위 후보만 전달
+    llm_candidate_confident_score: float = Field(default=50.0)  # 1위 점수가 이 값 미만이면 후보를 줄이지 않음
+    llm_candidate_score_gap: float = Field(default=30.0)        # 1위와의 점수 차이가 이 값 이내인 후보만 전달
+    llm_candidate_min_k: int = Field(default=3)
+    llm_candidate_max_k: int = Field(default=8)
     
     # === 라프텔 설정 ===
     max_search_candidates: int = Field(default=20)
+    laftel_search_variants: int = Field(default=4)        # 검색 결과가 없을 때 병렬로 시도할 대체 검색어 수
+    laftel_timeout: float = Field(default=10.0)           # 요청 타임아웃 (초)
+    laftel_pool_connections: int = Field(default=4)       # 호스트별 커넥션 풀 개수
+    laftel_pool_maxsize: int = Field(default=10)          # 풀당 최대 커넥션 수
+    laftel_keep_alive: bool = Field(default=True)         # keep-alive 커넥션 재사용 여부
+    laftel_async_max_connections: int = Field(default=20)   # 비동기 클라이언트 최대 동시 커넥션
+    laftel_async_max_keepalive: int = Field(default=10)     # 비동기 클라이언트 keep-alive 커넥션
+    laftel_fetch_workers: int = Field(default=4)          # 상세 정보/에피소드 동시 조회 스레드 수
+    laftel_metadata_concurrency: int = Field(default=4)   # get_metadata_many 기본 동시 처리 수
+    
+    # === 캐시 설정 ===
+    cache_db_filename: str = Field(default="laftel_cache.sqlite3")  # productions_dir 아래 생성
+    laftel_search_cache_enabled: bool = Field(default=False)
+    laftel_search_cache_ttl: int = Field(default=86400)           # 검색 응답 TTL (초, 기본 1일)
+    laftel_search_cache_max_entries: int = Field(default=5000)    # 초과시 LRU 정리
+    laftel_item_cache_enabled: bool = Field(default=False)
+    laftel_item_cache_ttl: int = Field(default=21600)             # 방영 중/예정 작품 TTL (초, 기본 6시간)
+    laftel_item_cache_ttl_completed: int = Field(default=2592000) # 완결 작품 TTL (초, 기본 30일)
+    laftel_item_cache_max_entries: int = Field(default=20000)
+    llm_match_cache_enabled: bool = Field(default=False)          # 같은 입력 + 같은 후보 목록이면 Step 2 생략
+    llm_match_cache_ttl: int = Field(default=2592000)             # 매칭 결과 TTL (초, 기본 30일)
+    llm_match_cache_max_entries: int = Field(default=20000)
+    
+    # === 카탈로그 인덱스 설정 ===
+    laftel_catalog_enabled: bool = Field(default=False)           # 라이브 검색 결과 write-through 및 로컬 검색
+    laftel_catalog_max_age: int = Field(default=604800)           # 마지막 수집 후 로컬 검색을 신뢰하는 기간 (초, 기본 7일)
+    laftel_catalog_page_size: int = Field(default=60)             # 카탈로그 수집 페이지 크기
+    laftel_catalog_min_similarity: float = Field(default=0.6)     # 로컬 결과 최고 제목 유사도가 이보다 낮으면 라이브 검색
+    
+    # === 라프텔 속도 제한 (초당 요청 수, 0 이하이면 제한 없음) ===
+    laftel_search_rate: float = Field(default=3.0)
+    laftel_search_burst: int = Field(default=5)
+    laftel_item_rate: float = Field(default=5.0)
+    laftel_item_burst: int = Field(default=10)
+    laftel_episodes_rate: float = Field(default=5.0)
+    laftel_episodes_burst: int = Field(default=10)
+    
+    # === 라프텔 호출 경로 / 헤지 요청 설정 ===
+    laftel_proxy_base_url: str = Field(default="http://49.50.135.81/laftel/api")  # 렌더 환경 기본 경로 (NCP 프록시)
+    laftel_failover_enabled: bool = Field(default=True)     # 프록시 실패/차단 시 직접 호출로 우회 (렌더 환경)
+    laftel_hedging_enabled: bool = Field(default=False)     # 느린 요청에 헤지(중복) 요청 발사
+    laftel_hedge_percentile: float = Field(default=95.0)    # 헤지 지연 기준 응답 시간 백분위
+    laftel_hedge_min_samples: int = Field(default=20)       # 백분위 계산에 필요한 최소 표본 수
+    laftel_hedge_initial_delay: float = Field(default=1.0)  # 표본 부족시 헤지 지연 (초)
+    laftel_hedge_min_delay: float = Field(default=0.2)      # 헤지 지연 하한 (초)
+    laftel_hedge_window: int = Field(default=200)           # 응답 시간 표본 개수
+    laftel_breaker_failures: int = Field(default=5)         # 경로 차단까지 연속 실패 횟수
+    laftel_breaker_reset_timeout: float = Field(default=30.0)  # 경로 차단 유지 시간 (초)
+    
+    # === 노션 HTTP 설정 ===
+    notion_connect_timeout: float = Field(default=5.0)      # 연결 타임아웃 (초)
+    notion_read_timeout: float = Field(default=30.0)        # 응답 대기 타임아웃 (초)
+    notion_pool_maxsize: int = Field(default=10)            # 커넥션 풀 최대 크기 (배치 워커 수 이상 권장)
+    notion_retry_after_max: float = Field(default=60.0)     # 429 Retry-After 최대 대기 (초, 더 길게 요청하면 재시도 없이 실패)
+    notion_query_page_size: int = Field(default=100)        # 데이터베이스 조회 페이지 크기 (노션 최대 100)
+    notion_index_enabled: bool = Field(default=False)       # 제목 → 페이지 ID 로컬 인덱스로 기존 페이지 확인
+    notion_index_refresh_interval: float = Field(default=60.0)     # 증분 갱신 없이 인덱스를 신뢰하는 시간 (초)
+    notion_index_rebuild_interval: float = Field(default=21600.0)  # 전체 재구축 주기 (초, 삭제된 페이지 정리)
+    
+    # === 재시도 설정 ===
+    retry_max_attempts: int = Field(default=3)                  # 최초 요청 포함 최대 시도 횟수
+    retry_base_delay: float = Field(default=0.5)                # 백오프 최소 대기 (초)
+    retry_max_delay: float = Field(default=20.0)                # 백오프 최대 대기 (초)
+    retry_after_max: float = Field(default=120.0)               # Retry-After 최대 대기 (초, 더 길게 요청하면 재시도 없이 실패)
+    retry_budget_ratio: float = Field(default=0.2)              # 요청당 적립되는 재시도 예산
+    retry_budget_min_per_second: float = Field(default=1.0)     # 초당 최소 재시도 예산 충전량
+    retry_budget_max_tokens: float = Field(default=20.0)        # 재시도 예산 최대 적립량
     
     # === 배치 처리 설정 ===
     results_dir: str = Field(default="results")
     productions_dir: str = Field(default="productions")
+    batch_matching_mode: str = Field(default="single")    # 배치 Step 2 방식: single | packed | batch_api
     
     class Config:
         env_file = ".env"
@@ -75,6 +175,19 @@ class AppSettings(BaseSettings):
         """결과 파일 경로 생성"""
         os.makedirs(self.results_dir, exist_ok=True)
         return os.path.join(self.results_dir, filename)
+    
+    def get_cache_path(self) -> str:
+        """로컬 캐시 DB 파일 경로 생성"""
+        os.makedirs(self.productions_dir, exist_ok=True)
+        return os.path.join(self.productions_dir, self.cache_db_filename)
+    
+    def validate_match_backend(self) -> None:
+        """매칭 백엔드 필수 설정 확인 (assistant 백엔드는 Assistant ID 필수)"""
+        if self.openai_match_backend.lower() == "assistant" and not self.openai_assistant_id:
+            raise ValueError(
+                "OPENAI_ASSISTANT_ID가 설정되지 않았습니다. "
+                "Assistant ID 없이 사용하려면 OPENAI_MATCH_BACKEND=chat으로 설정하세요."
+            )
 
 # 전역 설정 인스턴스
 settings = AppSettings()
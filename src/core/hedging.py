@@ -0,0 +1,181 @@
+# 🛡️ 경로 상태 추적 (지연 시간 / 서킷 브레이커)
+"""
+외부 API 호출 경로별 상태 추적
+- LatencyTracker: 최근 응답 시간으로 백분위(p95 등) 계산 → 헤지 요청 지연 시간 결정
+- CircuitBreaker: 연속 실패가 쌓인 경로를 일정 시간 차단하고 대체 경로로 우회
+- 경로(베이스 URL)별 프로세스 전역 인스턴스 공유
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from .config import settings
+
+def percentile(samples: List[float], percent: float) -> Optional[float]:
+    """nearest-rank 백분위 (표본이 없으면 None)"""
+    if not samples:
+        return None
+    
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, math.ceil(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+class LatencyTracker:
+    """최근 N개 응답 시간 기반 백분위 계산"""
+    
+    def __init__(self, window: int = 200):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+    
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+    
+    def percentile(self, percent: float) -> Optional[float]:
+        """백분위 응답 시간 (표본이 없으면 None)"""
+        with self._lock:
+            samples = list(self._samples)
+        
+        return percentile(samples, percent)
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._samples)
+    
+    def stats(self) -> Dict[str, Any]:
+        p50 = self.percentile(50)
+        p95 = self.percentile(95)
+        return {
+            "samples": len(self),
+            "p50": round(p50, 3) if p50 is not None else None,
+            "p95": round(p95, 3) if p95 is not None else None
+        }
+
+class CircuitBreaker:
+    """
+    연속 실패 기반 서킷 브레이커
+    - closed: 정상 경로
+    - open: failure_threshold회 연속 실패 후 reset_timeout초 동안 후순위로 밀림
+    - half_open: 차단 시간이 지나면 다시 시도, 성공하면 closed / 실패하면 즉시 open
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+        
+        self.times_opened = 0
+    
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return self.CLOSED
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return self.OPEN
+            return self.HALF_OPEN
+    
+    @property
+    def is_open(self) -> bool:
+        return self.state == self.OPEN
+    
+    def record_success(self) -> None:
+        with self._lock:
+            if self._opened_at is not None:
+                print(f"✅ 경로 복구: {self.name}")
+            self._failures = 0
+            self._opened_at = None
+    
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures < self.failure_threshold:
+                return
+            
+            # half_open 상태의 실패도 failures가 임계값 이상이므로 즉시 다시 차단
+            now = time.monotonic()
+            if self._opened_at is None or now - self._opened_at >= self.reset_timeout:
+                self.times_opened += 1
+                print(f"🚫 경로 차단 ({self.reset_timeout:.0f}초): {self.name}")
+            self._opened_at = now
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "times_opened": self.times_opened
+        }
+
+class RouteHealth:
+    """경로 하나의 지연 시간 추적기 + 서킷 브레이커"""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.hedged = 0          # 이 경로가 느려서 헤지 요청을 보낸 횟수
+        self.hedge_wins = 0      # 헤지 요청이 먼저 응답한 횟수
+        self.hedges_skipped = 0  # 속도 제한 토큰이 없어 헤지 요청을 생략한 횟수
+        self._lock = threading.Lock()
+        self.latency = LatencyTracker(settings.laftel_hedge_window)
+        self.breaker = CircuitBreaker(
+            name,
+            failure_threshold=settings.laftel_breaker_failures,
+            reset_timeout=settings.laftel_breaker_reset_timeout
+        )
+    
+    def hedge_delay(self) -> float:
+        """헤지 요청 발사까지 기다릴 시간 (표본 부족시 초기값)"""
+        if len(self.latency) < settings.laftel_hedge_min_samples:
+            return settings.laftel_hedge_initial_delay
+        
+        observed = self.latency.percentile(settings.laftel_hedge_percentile)
+        return max(settings.laftel_hedge_min_delay, observed)
+    
+    def record_hedge(self, sent: bool) -> None:
+        """헤지 요청 발사/생략 기록 (여러 스레드에서 호출)"""
+        with self._lock:
+            if sent:
+                self.hedged += 1
+            else:
+                self.hedges_skipped += 1
+    
+    def record_hedge_win(self) -> None:
+        """헤지 요청이 먼저 응답한 경우 기록"""
+        with self._lock:
+            self.hedge_wins += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = {
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+                "hedges_skipped": self.hedges_skipped
+            }
+        return {
+            "latency": self.latency.stats(),
+            "breaker": self.breaker.stats(),
+            **counters
+        }
+
+# 프로세스 전역 경로 상태 레지스트리
+_routes: Dict[str, RouteHealth] = {}
+_routes_lock = threading.Lock()
+
+def get_route_health(name: str) -> RouteHealth:
+    """경로별 공유 상태 반환"""
+    with _routes_lock:
+        route = _routes.get(name)
+        if route is None:
+            route = RouteHealth(name)
+            _routes[name] = route
+        return route
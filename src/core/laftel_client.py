@@ -10,14 +10,25 @@ import laftel
 import re
 import json
 import requests
-from typing import List, Dict, Any, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 from urllib.parse import quote
 import os
 
-from .models import SearchResult, SearchCandidate, MetadataResult, AnimeMetadata
+from .models import SearchResult, SearchCandidate, MetadataResult, AnimeMetadata, LLMMatchResult
 from .config import settings
+from .cache import get_cache, normalize_cache_key
+from .singleflight import SingleFlight
+from .catalog_index import get_catalog_index, refresh_catalog
+from .rate_limit import TokenBucket, get_laftel_limiters
+from .hedging import get_route_health
+from .local_matcher import bigram_similarity, parse_title
+from .search_normalizer import primary_query, query_variants
+from .retry import RetryPolicy, HTTPStatusError, default_is_retryable, parse_retry_after
 
 # 렌더 환경에서는 CloudScraper 사용
 try:
@@ -26,44 +37,199 @@ try:
 except ImportError:
     CLOUDSCRAPER_AVAILABLE = False
 
-class LaftelClient:
-    """라프텔 API 클라이언트"""
+# 라프텔 API 베이스 URL
+LAFTEL_DIRECT_BASE_URL = 'https://laftel.net/api'
+LAFTEL_PROXY_BASE_URL = settings.laftel_proxy_base_url  # NCP 프록시 (렌더 환경)
+
+# EpisodeCountReader 청크 처리용 (이스케이프 쌍 / 공백 아닌 문자 / 구조 문자 외 전부)
+_JSON_ESCAPE = re.compile(rb'\\.', re.DOTALL)
+_JSON_NON_SPACE = re.compile(rb'\S')
+_JSON_NON_STRUCTURE = bytes(byte for byte in range(256) if byte not in b'[]{},')
+
+class EpisodeCountReader:
+    """
+    에피소드 API 응답을 스트리밍으로 읽으며 화수만 계산
+    - 최상위 배열 응답: 원소 수만 세고 본문은 보관하지 않음
+    - 페이지네이션 객체 응답: count 필드 (없으면 results 길이) 사용
+    
+    UTF-8 멀티바이트 문자에는 ASCII 구조 문자( " \\ [ ] { } , )가 나타나지 않으므로
+    디코딩 없이 바이트 그대로 처리한다. 청크마다 이스케이프 쌍을 지우고 따옴표로 나눠 문자열을
+    걸러낸 뒤 남은 구조 문자( [ ] { } , )만 순회하므로 바이트 단위 파이썬 루프가 없다.
+    원소 수 = 첫 원소 1개 + 깊이 1의 쉼표 수 (닫히지 않은 문자열 하나만 다음 청크까지 보관)
+    """
     
     def __init__(self):
-        """클라이언트 초기화"""
+        self.mode: Optional[str] = None  # 'array' | 'object'
+        self.count = 0
+        self._depth = 0
+        self._expect_first = False  # 최상위 '[' 직후 (첫 원소 또는 ']' 대기)
+        self._carry = b''           # 청크 경계에서 잘린 문자열 (여는 따옴표부터)
+        self._buffer = bytearray()
+    
+    def feed(self, chunk: bytes) -> None:
+        """응답 청크 입력"""
+        if self.mode is None:
+            stripped = chunk.lstrip()
+            if not stripped:
+                return
+            self.mode = 'array' if stripped[:1] == b'[' else 'object'
+            
+            if self.mode == 'array':
+                # 최상위 '['는 여기서 처리하고 나머지부터 구조 추적
+                self._depth = 1
+                self._expect_first = True
+                chunk = stripped[1:]
+        
+        if self.mode == 'object':
+            self._buffer.extend(chunk)
+            return
+        
+        self._scan(chunk)
+    
+    def _scan(self, chunk: bytes) -> None:
+        """최상위 배열 응답 청크에서 구조 문자만 골라 원소 수 계산"""
+        data = self._carry + chunk if self._carry else bytes(chunk)
+        self._carry = b''
+        
+        # 이스케이프 쌍(\" 등)을 지우면 남은 따옴표는 문자열 시작/끝이 번갈아 나타남
+        if b'\\' in data:
+            data = _JSON_ESCAPE.sub(b'', data)
+        
+        if self._expect_first:
+            match = _JSON_NON_SPACE.search(data)
+            if match is None:
+                return
+            self._expect_first = False
+            if data[match.start():match.end()] != b']':
+                self.count += 1
+        
+        parts = data.split(b'"')
+        if len(parts) % 2 == 0:
+            # 따옴표가 홀수개면 마지막 문자열이 다음 청크로 이어짐
+            self._carry = b'"' + parts.pop()
+        
+        # 짝수 번째 조각이 문자열 바깥
+        structure = b''.join(parts[0::2]).translate(None, _JSON_NON_STRUCTURE)
+        
+        depth = self._depth
+        count = self.count
+        for byte in structure:
+            if byte == 0x2C:  # ','
+                if depth == 1:
+                    count += 1
+            elif byte in b'[{':
+                depth += 1
+            else:
+                depth -= 1
+        
+        self._depth = depth
+        self.count = count
+    
+    def result(self) -> Optional[int]:
+        """최종 화수 (판단 불가시 None)"""
+        if self.mode == 'array':
+            return self.count
+        
+        if self.mode == 'object':
+            data = json.loads(self._buffer.decode('utf-8'))
+            if isinstance(data, dict):
+                if data.get('count') is not None:
+                    return int(data['count'])
+                if isinstance(data.get('results'), list):
+                    return len(data['results'])
+        
+        return None
+
+class EpisodePrefetch:
+    """상세 정보 조회와 동시에 미리 시작한 에피소드 수 조회 (결과 사용 여부 기록)"""
+    
+    def __init__(self, future: Any):
+        self.future = future
+        self.used = False
+
+class LaftelClientBase:
+    """
+    라프텔 클라이언트 공통 로직
+    - 동기/비동기 클라이언트가 공유하는 URL 생성, 응답 파싱, 결과 변환
+    - 네트워크 호출은 하위 클래스에서 구현
+    """
+    
+    def __init__(self):
+        """공통 설정 초기화"""
         self.max_candidates = settings.max_search_candidates
-        self.retry_count = 3
-        self.retry_delay = 1.0  # 초
+        self.retry_policy = RetryPolicy("라프텔", is_retryable=self._is_retryable)
+        self.timeout = settings.laftel_timeout
         
-        # 렌더 환경 감지 및 HTTP 클라이언트 설정
+        # 엔드포인트별 속도 제한 (프로세스 전역 공유: search / item / episodes)
+        self.rate_limiters = get_laftel_limiters()
+        
+        # 렌더 환경 감지
         self.is_render_env = os.getenv('RENDER', '').lower() == 'true'
-        if self.is_render_env and CLOUDSCRAPER_AVAILABLE:
-            self.http_client = create_scraper()
-            print("🌐 렌더 환경 감지: CloudScraper 사용")
-        else:
-            self.http_client = requests
-            print("🏠 로컬 환경: requests 사용")
+        
+        # 검색 응답 캐시 (반복 검색은 로컬 조회로 처리)
+        self.search_cache = None
+        if settings.laftel_search_cache_enabled:
+            try:
+                self.search_cache = get_cache(
+                    "laftel_search",
+                    ttl_seconds=settings.laftel_search_cache_ttl,
+                    max_entries=settings.laftel_search_cache_max_entries
+                )
+            except Exception as e:
+                print(f"⚠️ 검색 캐시 초기화 실패 - 캐시 없이 진행: {e}")
+        
+        # 애니메이션 상세 정보 캐시 (ETag/Last-Modified 재검증 지원)
+        self.item_cache = None
+        if settings.laftel_item_cache_enabled:
+            try:
+                self.item_cache = get_cache(
+                    "laftel_items",
+                    ttl_seconds=settings.laftel_item_cache_ttl,
+                    max_entries=settings.laftel_item_cache_max_entries
+                )
+            except Exception as e:
+                print(f"⚠️ 상세 정보 캐시 초기화 실패 - 캐시 없이 진행: {e}")
+        
+        # 완결 작품 총 화수 메모 (완결 후에는 화수가 바뀌지 않음)
+        self.episode_count_cache = None
+        if settings.laftel_item_cache_enabled:
+            try:
+                self.episode_count_cache = get_cache(
+                    "laftel_episode_counts",
+                    ttl_seconds=settings.laftel_item_cache_ttl_completed,
+                    max_entries=settings.laftel_item_cache_max_entries
+                )
+            except Exception as e:
+                print(f"⚠️ 화수 메모 초기화 실패 - 메모 없이 진행: {e}")
+        
+        # 라프텔 카탈로그 로컬 인덱스 (전체 수집 후에는 Step 1을 로컬에서 처리)
+        self.catalog = None
+        if settings.laftel_catalog_enabled:
+            try:
+                self.catalog = get_catalog_index()
+            except Exception as e:
+                print(f"⚠️ 카탈로그 인덱스 초기화 실패 - 인덱스 없이 진행: {e}")
+        
+        # 에피소드 수 사전 조회 결과 (사용/취소/낭비/생략 횟수)
+        self.episode_prefetch = {"started": 0, "used": 0, "cancelled": 0, "wasted": 0, "skipped": 0}
+        self._prefetch_lock = threading.Lock()
     
     def optimize_search_term(self, user_input: str) -> str:
-        """라프텔 검색 최적화를 위한 검색어 전처리"""
-        
-        # 시즌 정보 패턴들
-        season_patterns = [
-            r'\s*1기\s*$',          # "스파이 패밀리 1기" → "스파이 패밀리"
-            r'\s*2기\s*$',          # "무직전생 2기" → "무직전생"  
-            r'\s*3기\s*$',          # "애니 3기" → "애니"
-            r'\s*4기\s*$',          # "애니 4기" → "애니"
-            r'\s*5기\s*$',          # "애니 5기" → "애니"
-            r'\s*시즌\s*\d+\s*$',   # "애니 시즌 2" → "애니"
-            r'\s*Season\s*\d+\s*$', # "애니 Season 2" → "애니"
-        ]
-        
-        # 패턴 매칭해서 시즌 정보 제거
-        for pattern in season_patterns:
-            if re.search(pattern, user_input, re.IGNORECASE):
-                return re.sub(pattern, '', user_input, flags=re.IGNORECASE).strip()
-        
-        return user_input
+        """라프텔 검색 최적화를 위한 검색어 전처리 (시즌/파트 표기 제거, 전각 문자 정리)"""
+        return primary_query(user_input)
+    
+    def _fallback_queries(self, user_input: str) -> List[str]:
+        """기본 검색어 결과가 없을 때 시도할 대체 검색어 (우선순위 순)"""
+        return list(query_variants(user_input)[1:1 + settings.laftel_search_variants])
+    
+    def _pick_variant_result(self, queries: List[str],
+                             results: List[Optional[List[Any]]]) -> Tuple[Optional[str], Optional[List[Any]]]:
+        """대체 검색 결과 중 우선순위가 가장 높은 비어 있지 않은 결과 선택"""
+        for query, result in zip(queries, results):
+            if result:
+                print(f"✅ 대체 검색어로 결과 발견: '{query}'")
+                return query, result
+        return None, None
     
     def _get_laftel_headers(self) -> Dict[str, str]:
         """라프텔 API 호출용 헤더"""
@@ -75,74 +241,247 @@ class LaftelClient:
             'Accept-Encoding': 'gzip, deflate'
         }
     
-    def _direct_search_anime(self, query: str) -> List[Any]:
-        """직접 HTTP 요청으로 라프텔 검색 (이벤트 루프 충돌 방지)"""
-        encoded_query = quote(query)
+    def _route_bases(self) -> List[str]:
+        """환경별 호출 경로 후보 (렌더 환경: NCP 프록시 우선, 직접 호출로 우회 가능)"""
+        if not self.is_render_env:
+            return [LAFTEL_DIRECT_BASE_URL]
         
-        # 렌더 환경에서는 NCP 프록시 사용
-        if self.is_render_env:
-            # NCP 프록시를 통한 라프텔 API 호출
-            proxy_url = f'http://49.50.135.81/laftel/api/search/v3/keyword/?keyword={encoded_query}'
-            print(f"🌐 NCP 프록시를 통한 라프텔 검색: {proxy_url}")
-        else:
-            # 로컬에서는 직접 호출
-            proxy_url = f'https://laftel.net/api/search/v3/keyword/?keyword={encoded_query}'
-            print(f"🏠 직접 라프텔 검색: {proxy_url}")
-        
-        response = requests.get(proxy_url, headers=self._get_laftel_headers(), timeout=10)
+        if settings.laftel_failover_enabled:
+            return [LAFTEL_PROXY_BASE_URL, LAFTEL_DIRECT_BASE_URL]
+        return [LAFTEL_PROXY_BASE_URL]
+    
+    def _active_routes(self) -> List[str]:
+        """차단(서킷 open)된 경로를 뒤로 보낸 호출 경로 목록"""
+        bases = self._route_bases()
+        available = [base for base in bases if not get_route_health(base).breaker.is_open]
+        blocked = [base for base in bases if base not in available]
+        return available + blocked
+    
+    def _build_url(self, path: str, base_url: Optional[str] = None) -> str:
+        """라프텔 API URL 생성 (기본값: 현재 우선 경로)"""
+        base_url = base_url or self._active_routes()[0]
+        return f'{base_url}/{path}'
+    
+    def _route_label(self) -> str:
+        """로그 출력용 호출 경로 표시"""
+        if self._active_routes()[0] == LAFTEL_PROXY_BASE_URL:
+            return "🌐 NCP 프록시를 통한"
+        return "🏠 직접"
+    
+    def _is_route_failure(self, error: Exception) -> bool:
+        """경로 장애로 볼 오류인지 판단 (연결 오류, 타임아웃, 5xx - 429/4xx 제외)"""
+        if isinstance(error, HTTPStatusError):
+            return error.status_code >= 500
+        return self._is_retryable(error)
+    
+    def _check_route_response(self, base_url: str, started: float, response: Any) -> None:
+        """응답 결과를 경로 상태에 반영 (5xx는 경로 장애로 예외 발생)"""
+        route = get_route_health(base_url)
+        if response.status_code >= 500:
+            route.breaker.record_failure()
+            raise self._http_error(response.status_code, response.text, response.headers)
         
+        route.breaker.record_success()
+        route.latency.record(time.monotonic() - started)
+    
+    def _record_route_error(self, base_url: str, error: Exception) -> None:
+        """요청 예외를 경로 상태에 반영"""
+        if self._is_route_failure(error):
+            get_route_health(base_url).breaker.record_failure()
+    
+    def _hedge_routes(self) -> Tuple[str, str]:
+        """헤지 요청의 (기본 경로, 헤지 경로) - 대체 경로가 없으면 같은 경로로 중복 요청"""
+        routes = self._active_routes()
+        return routes[0], routes[1] if len(routes) > 1 else routes[0]
+    
+    def route_stats(self) -> Dict[str, Any]:
+        """호출 경로별 응답 시간/서킷 상태/헤지 통계"""
+        return {base: get_route_health(base).stats() for base in self._route_bases()}
+    
+    def _search_path(self, query: str) -> str:
+        return f'search/v3/keyword/?keyword={quote(query)}'
+    
+    def _item_path(self, anime_id: Any) -> str:
+        return f'items/v3/{anime_id}/'
+    
+    def _episodes_path(self, anime_id: Any) -> str:
+        return f'episodes/v2/?item={anime_id}'
+    
+    def _discover_path(self, offset: int, size: int) -> str:
+        return f'search/v1/discover/?sort=recent&viewable=true&offset={offset}&size={size}'
+    
+    def _path_limiter(self, path: str) -> TokenBucket:
+        """요청 경로에 해당하는 엔드포인트 속도 제한 버킷 (헤지/우회 요청도 같은 한도 적용)"""
+        if path.startswith('items/'):
+            return self.rate_limiters['item']
+        if path.startswith('episodes/'):
+            return self.rate_limiters['episodes']
+        return self.rate_limiters['search']
+    
+    def _is_retryable(self, error: Exception) -> bool:
+        """재시도 가능 오류 판단 (연결 오류, 타임아웃, 429, 5xx)"""
+        if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+            return True
+        return default_is_retryable(error)
+    
+    def _http_error(self, status_code: int, text: str, headers: Any) -> HTTPStatusError:
+        """오류 응답을 상태 코드/Retry-After를 담은 예외로 변환"""
+        return HTTPStatusError(
+            status_code,
+            f"HTTP {status_code}: {text[:200]}",
+            retry_after=parse_retry_after(headers.get('Retry-After'))
+        )
+    
+    def _parse_json(self, response: Any) -> Any:
+        """HTTP 응답 상태 확인 후 JSON 파싱 (requests/httpx 응답 공용)"""
         if response.status_code != 200:
-            raise Exception(f"HTTP {response.status_code}: {response.text[:200]}")
+            raise self._http_error(response.status_code, response.text, response.headers)
         
         try:
-            data = response.json()
-            # 라프텔 API 응답에서 실제 검색 결과 배열 추출
-            if isinstance(data, dict) and 'results' in data:
-                return data['results']
-            else:
-                return data
+            return response.json()
         except json.JSONDecodeError as e:
             raise Exception(f"JSON 파싱 실패: {e}")
     
-    def _direct_get_anime_info(self, anime_id: int) -> Dict[str, Any]:
-        """직접 HTTP 요청으로 라프텔 애니메이션 정보 조회"""
-        # 렌더 환경에서는 NCP 프록시 사용
-        if self.is_render_env:
-            url = f'http://49.50.135.81/laftel/api/items/v3/{anime_id}/'
-            print(f"🌐 NCP 프록시를 통한 애니메이션 정보 조회: {url}")
-        else:
-            url = f'https://laftel.net/api/items/v3/{anime_id}/'
-            print(f"🏠 직접 애니메이션 정보 조회: {url}")
+    def _get_cached_search(self, query: str) -> Optional[List[Any]]:
+        """검색 캐시 조회 (정규화된 검색어 기준)"""
+        if not self.search_cache:
+            return None
         
-        response = requests.get(url, headers=self._get_laftel_headers(), timeout=10)
+        results = self.search_cache.get(normalize_cache_key(query))
+        if results is not None:
+            print(f"💾 검색 캐시 히트: {query}")
+        return results
+    
+    def _store_search(self, query: str, results: List[Any]) -> None:
+        """검색 결과 캐시 저장"""
+        # 빈 결과는 저장하지 않음 (신작 등록 대기 등으로 곧 바뀔 수 있음)
+        if self.search_cache and results and all(isinstance(item, dict) for item in results):
+            self.search_cache.set(normalize_cache_key(query), results)
+    
+    def _search_catalog(self, query: str) -> Optional[List[Any]]:
+        """전체 수집이 끝난 카탈로그 인덱스에서 검색 (미수집/결과 없음이면 None)"""
+        if not self.catalog or not self.catalog.is_authoritative(settings.laftel_catalog_max_age):
+            return None
         
-        if response.status_code != 200:
-            raise Exception(f"HTTP {response.status_code}: {response.text[:200]}")
+        results = self.catalog.search(query, self.max_candidates)
+        if not results:
+            return None
+        
+        # 부분 문자열만 겹치는 결과뿐이면 라이브 검색으로 확인 (별칭/번역 제목 등 로컬에 없는 작품 대비)
+        base = parse_title(query)[0]
+        best = max(bigram_similarity(base, parse_title(item['name'])[0]) for item in results)
+        if best < settings.laftel_catalog_min_similarity:
+            print(f"📚 카탈로그 인덱스 결과 유사도 부족 ({best:.2f}) - 라이브 검색: {query}")
+            return None
+        
+        print(f"📚 카탈로그 인덱스 히트: {query} ({len(results)}개)")
+        return results
+    
+    def _store_search_results(self, query: str, results: List[Any]) -> None:
+        """라이브 검색 결과를 검색 캐시와 카탈로그 인덱스에 함께 반영"""
+        self._store_search(query, results)
+        self._store_catalog(results)
+    
+    def _store_catalog(self, items: List[Any]) -> None:
+        """라이브 응답을 카탈로그 인덱스에 반영 (write-through)"""
+        if not self.catalog:
+            return
         
         try:
-            return response.json()
-        except json.JSONDecodeError as e:
-            raise Exception(f"JSON 파싱 실패: {e}")
+            self.catalog.upsert_items(items)
+        except Exception as e:
+            print(f"⚠️ 카탈로그 인덱스 갱신 실패: {e}")
     
-    def _direct_get_episodes(self, anime_id: int) -> List[Dict[str, Any]]:
-        """직접 HTTP 요청으로 라프텔 에피소드 정보 조회"""
-        # 렌더 환경에서는 NCP 프록시 사용
-        if self.is_render_env:
-            url = f'http://49.50.135.81/laftel/api/episodes/v2/?item={anime_id}'
-            print(f"🌐 NCP 프록시를 통한 에피소드 정보 조회: {url}")
-        else:
-            url = f'https://laftel.net/api/episodes/v2/?item={anime_id}'
-            print(f"🏠 직접 에피소드 정보 조회: {url}")
+    def _get_cached_item(self, anime_id: Any) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        상세 정보 캐시 조회
         
-        response = requests.get(url, headers=self._get_laftel_headers(), timeout=10)
+        Returns:
+            (캐시 항목, 만료 전 여부) - 만료된 항목도 재검증용으로 반환
+        """
+        if not self.item_cache:
+            return None, False
         
-        if response.status_code != 200:
-            raise Exception(f"HTTP {response.status_code}: {response.text[:200]}")
+        entry = self.item_cache.get_entry(str(anime_id))
+        if entry is None:
+            return None, False
+        return entry
+    
+    def _conditional_headers(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """캐시 항목의 검증자로 조건부 요청 헤더 생성"""
+        headers = {}
+        if entry and entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def _item_cache_ttl(self, info: Dict[str, Any]) -> int:
+        """완결 작품은 정보가 거의 바뀌지 않으므로 긴 TTL 적용"""
+        if self._extract_status(info) == "완결":
+            return settings.laftel_item_cache_ttl_completed
+        return settings.laftel_item_cache_ttl
+    
+    def _store_item(self, anime_id: Any, info: Dict[str, Any], response_headers: Any) -> None:
+        """상세 정보와 검증자(ETag/Last-Modified) 캐시 저장"""
+        self._store_catalog([info])
         
-        try:
-            return response.json()
-        except json.JSONDecodeError as e:
-            raise Exception(f"JSON 파싱 실패: {e}")
+        if not self.item_cache:
+            return
+        
+        entry = {
+            "info": info,
+            "etag": response_headers.get('ETag'),
+            "last_modified": response_headers.get('Last-Modified')
+        }
+        self.item_cache.set(str(anime_id), entry, ttl_seconds=self._item_cache_ttl(info))
+    
+    def _revalidated_item(self, anime_id: Any, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """304 응답 후 캐시 만료 시간 연장 및 캐시된 정보 반환"""
+        print(f"💾 변경 없음(304) - 캐시된 상세 정보 사용: ID {anime_id}")
+        self.item_cache.set(str(anime_id), entry, ttl_seconds=self._item_cache_ttl(entry['info']))
+        return entry['info']
+    
+    def _get_memoized_episode_count(self, anime_id: Any) -> Optional[int]:
+        """완결 작품 화수 메모 조회"""
+        if not self.episode_count_cache:
+            return None
+        
+        count = self.episode_count_cache.get(str(anime_id))
+        if count is not None:
+            print(f"💾 완결 작품 화수 메모 사용: ID {anime_id} → {count}화")
+        return count
+    
+    def _memoize_episode_count(self, anime_id: Any, info: Dict[str, Any], count: int) -> None:
+        """완결 작품인 경우에만 화수 메모 저장"""
+        if self.episode_count_cache and self._extract_status(info) == "완결":
+            self.episode_count_cache.set(str(anime_id), count)
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """캐시 히트/미스 및 동시 요청 합치기 통계"""
+        return {
+            "search": self.search_cache.stats() if self.search_cache else None,
+            "item": self.item_cache.stats() if self.item_cache else None,
+            "episode_count": self.episode_count_cache.stats() if self.episode_count_cache else None,
+            "catalog": self.catalog.stats() if self.catalog else None,
+            "episode_prefetch": self.episode_prefetch_stats(),
+            "coalesced": {
+                "search": self.search_flight.stats(),
+                "item": self.item_flight.stats(),
+                "episode_count": self.episode_flight.stats()
+            }
+        }
+    
+    def rate_limit_stats(self) -> Dict[str, Any]:
+        """엔드포인트별 속도 제한 대기 지표"""
+        return {name: bucket.stats() for name, bucket in self.rate_limiters.items()}
+    
+    def _extract_search_results(self, data: Any) -> List[Any]:
+        """라프텔 API 응답에서 실제 검색 결과 배열 추출"""
+        if isinstance(data, dict) and 'results' in data:
+            return data['results']
+        else:
+            return data
     
     def _extract_status(self, info: Dict[str, Any]) -> str:
         """라프텔 API 응답에서 방영 상태 추출"""
@@ -158,7 +497,7 @@ class LaftelClient:
             # is_new_release: 신작
             if info.get('is_new_release', False):
                 return "방영 중"
-                
+            
             # latest_episode_release_datetime이 최근이면 방영 중
             latest_episode = info.get('latest_episode_release_datetime')
             if latest_episode:
@@ -173,7 +512,7 @@ class LaftelClient:
             
             # 기본값
             return "완결"
-            
+        
         except Exception as e:
             print(f"⚠️ 상태 추출 실패: {e}")
             return "알 수 없음"
@@ -199,58 +538,531 @@ class LaftelClient:
             # 3순위: image 필드 (혹시 있다면)
             if info.get('image'):
                 return info['image']
-                
-            return None
             
+            return None
+        
         except Exception as e:
             print(f"⚠️ 표지 이미지 추출 실패: {e}")
             return None
     
-    def _extract_total_episodes(self, info: Dict[str, Any], anime_id: int) -> Optional[int]:
+    def _episodes_from_info(self, info: Dict[str, Any]) -> Optional[int]:
+        """총 화수 1순위: API 응답에 직접 포함된 화수 정보"""
+        if info.get('total_episodes'):
+            print(f"📺 API에서 총 화수 발견: {info['total_episodes']}화")
+            return info['total_episodes']
+        
+        if info.get('episode_count'):
+            print(f"📺 API에서 화수 정보 발견: {info['episode_count']}화")
+            return info['episode_count']
+        
+        return None
+    
+    def _plan_episode_fetch(self, anime_id: Any,
+                            entry: Optional[Dict[str, Any]]) -> Tuple[Optional[int], bool]:
+        """
+        에피소드 API 사전 조회 여부 결정
+        
+        완결 작품 화수 메모가 있거나 캐시된 상세 정보(만료 포함)에 총 화수가 있으면 미리 보내지 않는다.
+        캐시에 상세 정보가 없으면 총 화수 포함 여부는 응답을 받아야 알 수 있으므로, 상세 정보 조회와
+        동시에 의도적으로 미리 보내 지연 시간을 줄인다. 상세 정보에 총 화수가 있어 쓰지 않은 조회는
+        episode_prefetch 통계에 cancelled(요청 전 취소) 또는 wasted(이미 보낸 요청)로 집계한다.
+        
+        Args:
+            anime_id: 라프텔 ID
+            entry: 호출자가 한 번 읽어 둔 상세 정보 캐시 항목 (없으면 None)
+        
+        Returns:
+            (완결 작품 메모 화수, 사전 조회 여부)
+        """
+        memo = self._get_memoized_episode_count(anime_id)
+        info = entry.get('info') if entry else None
+        if memo is not None or (info and (info.get('total_episodes') or info.get('episode_count'))):
+            self._record_prefetch("skipped")
+            return memo, False
+        
+        self._record_prefetch("started")
+        return None, True
+    
+    def _record_prefetch(self, outcome: str) -> None:
+        with self._prefetch_lock:
+            self.episode_prefetch[outcome] += 1
+    
+    def episode_prefetch_stats(self) -> Dict[str, int]:
+        """에피소드 수 사전 조회 통계"""
+        with self._prefetch_lock:
+            return dict(self.episode_prefetch)
+    
+    def _episodes_from_fallback(self, info: Dict[str, Any]) -> Optional[int]:
+        """총 화수 3~4순위: 태그 또는 매체 정보 기반 추정"""
+        # 3순위: 태그나 설명에서 화수 정보 추출
+        tags = info.get('tags', [])
+        for tag in tags:
+            if isinstance(tag, str) and ('화' in tag or '편' in tag):
+                numbers = re.findall(r'(\d+)(?:화|편)', tag)
+                if numbers:
+                    episode_count = int(numbers[0])
+                    print(f"📺 태그에서 화수 추출: {episode_count}화 (태그: {tag})")
+                    return episode_count
+        
+        # 4순위: 기본값 또는 추정
+        medium = info.get('medium', '')
+        if medium == 'TVA':  # TV 애니메이션
+            # is_ending이 true이고 recent하면 12화 정도로 추정
+            if info.get('is_ending', False):
+                print(f"📺 TV 애니메이션 완결작 추정: 12화")
+                return 12
+        
+        print(f"⚠️ 총 화수 정보를 찾을 수 없음")
+        return None
+    
+    def _build_candidates(self, search_results: List[Any]) -> List[SearchCandidate]:
+        """검색 결과에서 상위 N개 후보 수집"""
+        max_collect = min(self.max_candidates, len(search_results))
+        print(f"📊 상위 {max_collect}개 후보 수집 중...")
+        
+        candidates = []
+        for i, item in enumerate(search_results[:max_collect]):
+            try:
+                # 직접 HTTP 응답 데이터 처리
+                if isinstance(item, dict):
+                    title = item.get('name', '')
+                    laftel_id = str(item.get('id', ''))
+                else:
+                    # 기존 laftel 객체 형태 (폴백)
+                    title = item.name if hasattr(item, 'name') else str(item)
+                    laftel_id = str(item.id) if hasattr(item, 'id') else None
+                
+                candidate = SearchCandidate(
+                    title=title,
+                    laftel_id=laftel_id,
+                    rank=i + 1
+                )
+                candidates.append(candidate)
+                print(f"📺 후보 #{i + 1}: {title}")
+            
+            except Exception as e:
+                print(f"⚠️ 후보 #{i + 1} 처리 실패: {e}")
+                continue
+        
+        return candidates
+    
+    def _build_search_result(self, user_input: str, search_query: str,
+                             search_results: Optional[List[Any]]) -> SearchResult:
+        """검색 응답을 SearchResult로 변환"""
+        if not search_results:
+            return SearchResult(
+                user_input=user_input,
+                search_query=search_query,
+                candidates=[],
+                total_found=0,
+                success=False,
+                error_message="검색 결과가 없습니다."
+            )
+        
+        total_found = len(search_results)
+        print(f"✅ 총 {total_found}개 검색 결과 발견")
+        
+        return SearchResult(
+            user_input=user_input,
+            search_query=search_query,
+            candidates=self._build_candidates(search_results),
+            total_found=total_found,
+            success=True
+        )
+    
+    def _search_failure(self, user_input: str, search_query: str, error: Exception) -> SearchResult:
+        """검색 실패 결과 생성"""
+        error_msg = f"라프텔 검색 실패: {str(error)}"
+        print(f"❌ {error_msg}")
+        
+        return SearchResult(
+            user_input=user_input,
+            search_query=search_query,
+            candidates=[],
+            total_found=0,
+            success=False,
+            error_message=error_msg
+        )
+    
+    def _print_search_start(self, user_input: str, search_query: str) -> None:
+        print(f"🔧 검색어 전처리 적용:")
+        print(f"   원본: {user_input}")
+        print(f"   검색어: {search_query}")
+        
+        print(f"🔍 1단계: '{search_query}' 라프텔 검색 시작")
+        print("=" * 60)
+    
+    def _select_by_name(self, search_results: List[Any], anime_name: str) -> Optional[Dict[str, Any]]:
+        """검색 결과에서 이름이 정확히 일치하는 항목 선택"""
+        # 정확한 매칭 찾기
+        for item in search_results:
+            if isinstance(item, dict) and item.get('name') == anime_name:
+                return item
+        
+        # 정확한 매칭이 없으면 첫 번째 결과 반환
+        if search_results and len(search_results) > 0:
+            return search_results[0] if isinstance(search_results[0], dict) else None
+        
+        return None
+    
+    def _build_metadata(self, info: Dict[str, Any], anime_id: Any, selected_title: str,
+                        total_episodes: Optional[int]) -> AnimeMetadata:
+        """라프텔 상세 정보를 AnimeMetadata로 변환"""
+        avg_rating = info.get('avg_rating')
+        
+        return AnimeMetadata(
+            laftel_id=str(anime_id),
+            name=info.get('name', selected_title),
+            air_year_quarter=info.get('air_year_quarter'),
+            avg_rating=float(avg_rating) if avg_rating else None,
+            # 방영 상태 추출 (is_ending, is_upcoming_release 등을 기반으로)
+            status=self._extract_status(info),
+            laftel_url=f"https://laftel.net/item/{anime_id}",
+            # 표지 이미지 추출 (여러 소스에서 시도)
+            cover_url=self._extract_cover_image(info),
+            production=info.get('production'),
+            total_episodes=total_episodes
+        )
+    
+    def _print_metadata(self, metadata: AnimeMetadata) -> None:
+        print(f"✅ 메타데이터 수집 완료!")
+        print(f"   제목: {metadata.name}")
+        print(f"   방영분기: {metadata.air_year_quarter}")
+        print(f"   평점: {metadata.avg_rating}")
+        print(f"   상태: {metadata.status}")
+        print(f"   제작사: {metadata.production}")
+        print(f"   총 화수: {metadata.total_episodes}화")
+    
+    def _metadata_failure(self, selected_title: str, error: Exception) -> MetadataResult:
+        """메타데이터 수집 실패 결과 생성"""
+        error_msg = f"메타데이터 수집 실패: {str(error)}"
+        print(f"❌ {error_msg}")
+        
+        return MetadataResult(
+            selected_title=selected_title,
+            success=False,
+            error_message=error_msg
+        )
+    
+    def _is_laftel_id(self, id_or_title: Union[int, str]) -> bool:
+        """라프텔 ID(숫자)인지 제목인지 판별"""
+        return isinstance(id_or_title, int) or str(id_or_title).strip().isdigit()
+    
+    def _missing_anime_result(self, selected_title: str,
+                              anime_obj: Optional[Dict[str, Any]]) -> Optional[MetadataResult]:
+        """이름 검색 결과에 ID가 없을 때의 실패 결과 (정상이면 None)"""
+        if not anime_obj:
+            return MetadataResult(
+                selected_title=selected_title,
+                success=False,
+                error_message="애니메이션을 찾을 수 없습니다."
+            )
+        
+        if not anime_obj.get('id'):
+            return MetadataResult(
+                selected_title=selected_title,
+                success=False,
+                error_message="애니메이션 ID를 찾을 수 없습니다."
+            )
+        
+        print(f"✅ 정확한 매칭 발견: ID {anime_obj['id']}")
+        return None
+
+class LaftelClient(LaftelClientBase):
+    """라프텔 API 클라이언트"""
+    
+    # 동일 검색어/라프텔 ID 동시 요청 합치기 (모든 인스턴스가 공유)
+    search_flight = SingleFlight("라프텔 검색")
+    item_flight = SingleFlight("상세 정보")
+    episode_flight = SingleFlight("에피소드 수")
+    
+    def __init__(self):
+        """클라이언트 초기화"""
+        super().__init__()
+        
+        # HTTP 클라이언트 설정
+        # 모든 라프텔 호출은 클라이언트별 세션을 통해 커넥션(TCP+TLS)을 재사용
+        if self.is_render_env and CLOUDSCRAPER_AVAILABLE:
+            self.http_client = create_scraper()
+            print("🌐 렌더 환경 감지: CloudScraper 세션 사용")
+        else:
+            self.http_client = requests.Session()
+            print("🏠 로컬 환경: requests 세션 사용")
+        self._configure_session(self.http_client)
+        
+        # 상세 정보/에피소드 동시 조회용 스레드풀
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.laftel_fetch_workers,
+            thread_name_prefix="laftel-fetch"
+        )
+        
+        # 헤지 요청용 스레드풀 (조회 스레드풀 안에서 호출되어도 교착되지 않도록 분리)
+        self._hedge_executor = ThreadPoolExecutor(
+            max_workers=settings.laftel_fetch_workers * 2,
+            thread_name_prefix="laftel-hedge"
+        )
+    
+    def _configure_session(self, session: requests.Session) -> None:
+        """커넥션 풀 크기 및 keep-alive 설정"""
+        adapter = HTTPAdapter(
+            pool_connections=settings.laftel_pool_connections,
+            pool_maxsize=settings.laftel_pool_maxsize,
+            max_retries=0  # 재시도는 클라이언트 로직에서 처리
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        
+        if not settings.laftel_keep_alive:
+            session.headers['Connection'] = 'close'
+    
+    def close(self) -> None:
+        """세션, 풀링된 커넥션 및 스레드풀 정리"""
+        self._executor.shutdown(wait=False)
+        self._hedge_executor.shutdown(wait=False)
+        self.http_client.close()
+    
+    def __enter__(self) -> "LaftelClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def _send(self, base_url: str, path: str, headers: Dict[str, str],
+              stream: bool = False) -> requests.Response:
+        """지정한 경로로 GET 요청 1회 실행 (경로 상태 기록)"""
+        started = time.monotonic()
+        try:
+            response = self.http_client.get(
+                self._build_url(path, base_url), headers=headers, timeout=self.timeout, stream=stream
+            )
+        except Exception as e:
+            self._record_route_error(base_url, e)
+            raise
+        
+        try:
+            self._check_route_response(base_url, started, response)
+        except Exception:
+            response.close()
+            raise
+        return response
+    
+    def _get(self, path: str, extra_headers: Optional[Dict[str, str]] = None,
+             stream: bool = False) -> requests.Response:
+        """풀링된 세션으로 GET 요청 실행 (경로 장애시 대체 경로로 우회)"""
+        headers = {**self._get_laftel_headers(), **(extra_headers or {})}
+        
+        if settings.laftel_hedging_enabled and not stream:
+            return self._hedged_get(path, headers)
+        
+        routes = self._active_routes()
+        last_error = None
+        for base_url in routes:
+            if last_error is not None:
+                # 대체 경로 재요청도 엔드포인트 한도 안에서 전송
+                self._path_limiter(path).acquire()
+            try:
+                return self._send(base_url, path, headers, stream)
+            except Exception as e:
+                if not self._is_route_failure(e):
+                    raise
+                last_error = e
+                if base_url != routes[-1]:
+                    print(f"🔀 경로 장애 - 대체 경로로 재요청: {e}")
+        
+        raise last_error
+    
+    def _hedged_get(self, path: str, headers: Dict[str, str]) -> requests.Response:
+        """기본 경로가 p95 이상 지연되면 헤지 요청을 보내고 먼저 성공한 응답 사용"""
+        primary, alternate = self._hedge_routes()
+        route = get_route_health(primary)
+        delay = route.hedge_delay()
+        
+        first = self._hedge_executor.submit(self._send, primary, path, headers)
+        done, _ = wait([first], timeout=delay)
+        
+        futures = [first]
+        if done:
+            error = first.exception()
+            if error is None or not self._is_route_failure(error) or alternate == primary:
+                return first.result()
+            print(f"🔀 경로 장애 - 대체 경로로 재요청: {error}")
+            self._path_limiter(path).acquire()
+            futures = []
+        elif not self._path_limiter(path).try_acquire():
+            # 헤지 요청은 여유 토큰이 있을 때만 (느린 시점에 한도를 넘겨 부하를 키우지 않도록)
+            route.record_hedge(sent=False)
+            print(f"⏱️ {delay:.2f}초 내 응답 없음 - 속도 제한 토큰 부족으로 헤지 생략")
+            return first.result()
+        else:
+            route.record_hedge(sent=True)
+            print(f"⏱️ {delay:.2f}초 내 응답 없음 - 헤지 요청 발사")
+        
+        hedge = self._hedge_executor.submit(self._send, alternate, path, headers)
+        futures.append(hedge)
+        
+        last_error = None
+        for future in as_completed(futures):
+            error = future.exception()
+            if error is None:
+                if future is hedge and len(futures) > 1:
+                    route.record_hedge_win()
+                return future.result()
+            last_error = error
+        
+        raise last_error
+    
+    def _get_json(self, path: str) -> Any:
+        """라프텔 API GET 요청 후 JSON 반환"""
+        response = self._get(path)
+        return self._parse_json(response)
+    
+    def _direct_search_anime(self, query: str) -> List[Any]:
+        """직접 HTTP 요청으로 라프텔 검색 (동일 검색어 동시 요청은 한 번만 실행)"""
+        return self.search_flight.do(normalize_cache_key(query), self._fetch_search, query)
+    
+    def _fetch_search(self, query: str) -> List[Any]:
+        """직접 HTTP 요청으로 라프텔 검색 (이벤트 루프 충돌 방지)"""
+        cached = self._get_cached_search(query)
+        if cached is not None:
+            return cached
+        
+        indexed = self._search_catalog(query)
+        if indexed is not None:
+            return indexed
+        
+        path = self._search_path(query)
+        self.rate_limiters['search'].acquire()
+        print(f"{self._route_label()} 라프텔 검색: {self._build_url(path)}")
+        
+        results = self._extract_search_results(self._get_json(path))
+        self._store_search_results(query, results)
+        return results
+    
+    def _direct_get_anime_info(self, anime_id: int,
+                               cached: Optional[Tuple[Optional[Dict[str, Any]], bool]] = None) -> Dict[str, Any]:
+        """직접 HTTP 요청으로 라프텔 애니메이션 정보 조회 (동일 ID 동시 요청 합치기)"""
+        return self.item_flight.do(str(anime_id), self._fetch_anime_info, anime_id, cached)
+    
+    def _fetch_anime_info(self, anime_id: int,
+                          cached: Optional[Tuple[Optional[Dict[str, Any]], bool]] = None) -> Dict[str, Any]:
+        """캐시 확인 후 조건부 요청으로 애니메이션 정보 조회 (cached: 호출자가 이미 읽은 캐시 조회 결과)"""
+        entry, fresh = cached if cached is not None else self._get_cached_item(anime_id)
+        if fresh:
+            print(f"💾 상세 정보 캐시 히트: ID {anime_id}")
+            return entry['info']
+        
+        path = self._item_path(anime_id)
+        self.rate_limiters['item'].acquire()
+        print(f"{self._route_label()} 애니메이션 정보 조회: {self._build_url(path)}")
+        
+        response = self._get(path, self._conditional_headers(entry))
+        if response.status_code == 304 and entry:
+            return self._revalidated_item(anime_id, entry)
+        
+        info = self._parse_json(response)
+        self._store_item(anime_id, info, response.headers)
+        return info
+    
+    def _direct_get_episode_count(self, anime_id: int) -> Optional[int]:
+        """직접 HTTP 요청으로 라프텔 에피소드 수 조회 (동일 ID 동시 요청 합치기)"""
+        return self.episode_flight.do(str(anime_id), self._fetch_episode_count, anime_id)
+    
+    def _fetch_episode_count(self, anime_id: int) -> Optional[int]:
+        """에피소드 목록을 스트리밍으로 읽어 화수 계산 (목록 전체를 메모리에 올리지 않음)"""
+        path = self._episodes_path(anime_id)
+        self.rate_limiters['episodes'].acquire()
+        print(f"{self._route_label()} 에피소드 수 조회: {self._build_url(path)}")
+        
+        response = self._get(path, stream=True)
+        try:
+            if response.status_code != 200:
+                raise self._http_error(response.status_code, response.text, response.headers)
+            
+            reader = EpisodeCountReader()
+            for chunk in response.iter_content(chunk_size=16384):
+                reader.feed(chunk)
+            
+            try:
+                return reader.result()
+            except (json.JSONDecodeError, UnicodeDecodeError, ValueError) as e:
+                raise Exception(f"JSON 파싱 실패: {e}")
+        finally:
+            response.close()
+    
+    def _fetch_discover_page(self, offset: int, size: int) -> Tuple[List[Any], Optional[int]]:
+        """라프텔 작품 목록 한 페이지 조회 (최신순)"""
+        self.rate_limiters['search'].acquire()
+        data = self._get_json(self._discover_path(offset, size))
+        total = data.get('count') if isinstance(data, dict) else None
+        return self._extract_search_results(data) or [], total
+    
+    def refresh_catalog(self, full: bool = False, max_pages: Optional[int] = None) -> Dict[str, Any]:
+        """
+        카탈로그 인덱스 수집/갱신
+        
+        Args:
+            full: True면 전체 목록 수집, False면 새 작품만 증분 갱신
+            max_pages: 최대 수집 페이지 수
+        
+        Returns:
+            수집 통계
+        """
+        if not self.catalog:
+            raise RuntimeError("카탈로그 인덱스가 비활성화되어 있습니다 (laftel_catalog_enabled)")
+        
+        print(f"📚 카탈로그 {'전체 수집' if full else '증분 갱신'} 시작")
+        return refresh_catalog(
+            self.catalog,
+            lambda offset, size: self.retry_policy.call(self._fetch_discover_page, offset, size),
+            full=full,
+            page_size=settings.laftel_catalog_page_size,
+            max_pages=max_pages
+        )
+    
+    def _finish_prefetch(self, prefetch: Optional[EpisodePrefetch]) -> None:
+        """사전 조회 결과 집계 (쓰지 않은 조회는 취소, 이미 시작했으면 낭비로 기록)"""
+        if prefetch is None:
+            return
+        
+        if prefetch.used:
+            self._record_prefetch("used")
+        elif prefetch.future.cancel():
+            # 스레드풀에서 아직 시작 전이라 요청을 보내지 않음
+            self._record_prefetch("cancelled")
+        else:
+            self._record_prefetch("wasted")
+    
+    def _extract_total_episodes(self, info: Dict[str, Any], anime_id: int, memo: Optional[int] = None,
+                                prefetch: Optional[EpisodePrefetch] = None) -> Optional[int]:
         """총 화수 정보 추출 (여러 방법 시도)"""
         try:
             # 1순위: API 응답에 직접 총 화수 정보가 있는지 확인
-            if info.get('total_episodes'):
-                print(f"📺 API에서 총 화수 발견: {info['total_episodes']}화")
-                return info['total_episodes']
+            total = self._episodes_from_info(info)
+            if total:
+                return total
             
-            if info.get('episode_count'):
-                print(f"📺 API에서 화수 정보 발견: {info['episode_count']}화")
-                return info['episode_count']
+            # 완결 작품 화수 메모
+            if memo is not None:
+                return memo
             
-            # 2순위: 에피소드 API 시도
+            # 2순위: 에피소드 API 시도 (미리 시작한 동시 요청이 있으면 그 결과 사용)
             try:
                 print(f"🎬 에피소드 API 조회 중...")
-                episodes = self._direct_get_episodes(anime_id)
-                if episodes:
-                    total = len(episodes)
+                if prefetch is not None:
+                    prefetch.used = True
+                    total = prefetch.future.result()
+                else:
+                    total = self._direct_get_episode_count(anime_id)
+                if total:
                     print(f"📺 에피소드 API에서 총 {total}화 확인")
+                    self._memoize_episode_count(anime_id, info, total)
                     return total
             except Exception as e:
                 print(f"⚠️ 에피소드 API 실패: {str(e)[:100]}...")
             
-            # 3순위: 태그나 설명에서 화수 정보 추출
-            tags = info.get('tags', [])
-            for tag in tags:
-                if isinstance(tag, str) and ('화' in tag or '편' in tag):
-                    import re
-                    numbers = re.findall(r'(\d+)(?:화|편)', tag)
-                    if numbers:
-                        episode_count = int(numbers[0])
-                        print(f"📺 태그에서 화수 추출: {episode_count}화 (태그: {tag})")
-                        return episode_count
-            
-            # 4순위: 기본값 또는 추정
-            medium = info.get('medium', '')
-            if medium == 'TVA':  # TV 애니메이션
-                # is_ending이 true이고 recent하면 12화 정도로 추정
-                if info.get('is_ending', False):
-                    print(f"📺 TV 애니메이션 완결작 추정: 12화")
-                    return 12
-                    
-            print(f"⚠️ 총 화수 정보를 찾을 수 없음")
-            return None
-            
+            # 3~4순위: 태그 또는 매체 정보 기반 추정
+            return self._episodes_from_fallback(info)
+        
         except Exception as e:
             print(f"⚠️ 총 화수 추출 실패: {e}")
             return None
@@ -261,7 +1073,7 @@ class LaftelClient:
         
         Args:
             user_input: 사용자 입력 애니메이션 제목
-            
+        
         Returns:
             SearchResult: 검색 결과 객체
         """
@@ -269,116 +1081,57 @@ class LaftelClient:
         search_query = self.optimize_search_term(user_input)
         
         try:
-            print(f"🔧 검색어 전처리 적용:")
-            print(f"   원본: {user_input}")
-            print(f"   검색어: {search_query}")
-            
-            # 라프텔 검색 실행
-            print(f"🔍 1단계: '{search_query}' 라프텔 검색 시작")
-            print("=" * 60)
+            self._print_search_start(user_input, search_query)
             
             # 직접 HTTP 요청으로 라프텔 API 호출 (이벤트 루프 충돌 방지)
-            search_results = None
-            for attempt in range(self.retry_count):
-                try:
-                    search_results = self._direct_search_anime(search_query)
-                    break
-                except Exception as e:
-                    print(f"⚠️ 검색 시도 {attempt + 1} 실패: {e}")
-                    if attempt < self.retry_count - 1:
-                        time.sleep(self.retry_delay)
-                        continue
-                    raise
+            search_results = self.retry_policy.call(self._direct_search_anime, search_query)
             
+            # 결과가 없으면 대체 검색어를 병렬로 시도
             if not search_results:
-                return SearchResult(
-                    user_input=user_input,
-                    search_query=search_query,
-                    candidates=[],
-                    total_found=0,
-                    success=False,
-                    error_message="검색 결과가 없습니다."
-                )
-            
-            total_found = len(search_results)
-            print(f"✅ 총 {total_found}개 검색 결과 발견")
-            
-            # 상위 N개 후보 수집
-            max_collect = min(self.max_candidates, total_found)
-            print(f"📊 상위 {max_collect}개 후보 수집 중...")
-            
-            candidates = []
-            for i, item in enumerate(search_results[:max_collect]):
-                try:
-                    # 직접 HTTP 응답 데이터 처리
-                    if isinstance(item, dict):
-                        title = item.get('name', '')
-                        laftel_id = str(item.get('id', ''))
-                    else:
-                        # 기존 laftel 객체 형태 (폴백)
-                        title = item.name if hasattr(item, 'name') else str(item)
-                        laftel_id = str(item.id) if hasattr(item, 'id') else None
-                    
-                    candidate = SearchCandidate(
-                        title=title,
-                        laftel_id=laftel_id,
-                        rank=i + 1
-                    )
-                    candidates.append(candidate)
-                    print(f"📺 후보 #{i + 1}: {title}")
-                    
-                except Exception as e:
-                    print(f"⚠️ 후보 #{i + 1} 처리 실패: {e}")
-                    continue
-            
-            return SearchResult(
-                user_input=user_input,
-                search_query=search_query,
-                candidates=candidates,
-                total_found=total_found,
-                success=True
-            )
+                variant_query, variant_results = self._search_variants(user_input)
+                if variant_results:
+                    search_query, search_results = variant_query, variant_results
             
+            return self._build_search_result(user_input, search_query, search_results)
+        
         except Exception as e:
-            error_msg = f"라프텔 검색 실패: {str(e)}"
-            print(f"❌ {error_msg}")
-            
-            return SearchResult(
-                user_input=user_input,
-                search_query=search_query,
-                candidates=[],
-                total_found=0,
-                success=False,
-                error_message=error_msg
-            )
+            return self._search_failure(user_input, search_query, e)
+    
+    def _search_variant(self, query: str) -> List[Any]:
+        """대체 검색어 1개 검색 (실패는 빈 결과로 처리)"""
+        try:
+            return self.retry_policy.call(self._direct_search_anime, query)
+        except Exception as e:
+            print(f"⚠️ 대체 검색 실패 '{query}': {e}")
+            return []
+    
+    def _search_variants(self, user_input: str) -> Tuple[Optional[str], Optional[List[Any]]]:
+        """대체 검색어 병렬 검색 후 우선순위가 가장 높은 결과 반환"""
+        queries = self._fallback_queries(user_input)
+        if not queries:
+            return None, None
+        
+        print(f"🔁 검색 결과 없음 - 대체 검색어 {len(queries)}개 병렬 검색: {queries}")
+        results = list(self._executor.map(self._search_variant, queries))
+        return self._pick_variant_result(queries, results)
     
     def get_anime_by_name(self, anime_name: str) -> Optional[Dict[str, Any]]:
         """애니메이션 이름으로 정확한 객체 찾기 (직접 HTTP 요청 사용)"""
         try:
             search_results = self._direct_search_anime(anime_name)
-            
-            # 정확한 매칭 찾기
-            for item in search_results:
-                if isinstance(item, dict) and item.get('name') == anime_name:
-                    return item
-            
-            # 정확한 매칭이 없으면 첫 번째 결과 반환
-            if search_results and len(search_results) > 0:
-                return search_results[0] if isinstance(search_results[0], dict) else None
-                
-            return None
-            
+            return self._select_by_name(search_results, anime_name)
+        
         except Exception as e:
             print(f"❌ 애니메이션 검색 실패: {e}")
             return None
     
     def get_metadata(self, selected_title: str) -> MetadataResult:
         """
-        선택된 애니메이션의 메타데이터 수집
+        선택된 애니메이션의 메타데이터 수집 (제목으로 ID 재검색)
         
         Args:
             selected_title: 선택된 애니메이션 제목
-            
+        
         Returns:
             MetadataResult: 메타데이터 수집 결과
         """
@@ -389,91 +1142,116 @@ class LaftelClient:
             # 애니메이션 객체 검색
             anime_obj = self.get_anime_by_name(selected_title)
             
-            if not anime_obj:
-                return MetadataResult(
-                    selected_title=selected_title,
-                    success=False,
-                    error_message="애니메이션을 찾을 수 없습니다."
-                )
-            
-            anime_id = anime_obj.get('id')
-            if not anime_id:
-                return MetadataResult(
-                    selected_title=selected_title,
-                    success=False,
-                    error_message="애니메이션 ID를 찾을 수 없습니다."
-                )
-            
-            print(f"✅ 정확한 매칭 발견: ID {anime_id}")
-            
+            failure = self._missing_anime_result(selected_title, anime_obj)
+            if failure:
+                return failure
+        
+        except Exception as e:
+            return self._metadata_failure(selected_title, e)
+        
+        return self.get_metadata_by_id(anime_obj['id'], selected_title)
+    
+    def get_metadata_by_id(self, anime_id: Any,
+                           selected_title: Optional[str] = None) -> MetadataResult:
+        """
+        라프텔 ID로 메타데이터 직접 수집 (검색 과정 생략)
+        
+        Args:
+            anime_id: Step 1 후보의 라프텔 ID
+            selected_title: 선택된 애니메이션 제목 (결과 기록용)
+        
+        Returns:
+            MetadataResult: 메타데이터 수집 결과
+        """
+        selected_title = selected_title or str(anime_id)
+        prefetch = None
+        
+        try:
             # 상세 정보 수집
             print(f"📊 상세 정보 수집 중... (ID: {anime_id})")
             
-            # 재시도 로직 포함 메타데이터 수집
-            for attempt in range(self.retry_count):
-                try:
-                    # 상세 정보 재조회 (직접 HTTP 요청 사용)
-                    info = self._direct_get_anime_info(anime_id)
-                    
-                    name = info.get('name', selected_title)
-                    air_year_quarter = info.get('air_year_quarter')
-                    avg_rating = info.get('avg_rating')
-                    
-                    # 방영 상태 추출 (is_ending, is_upcoming_release 등을 기반으로)
-                    status = self._extract_status(info)
-                    
-                    laftel_url = f"https://laftel.net/item/{anime_id}"
-                    
-                    # 표지 이미지 추출 (여러 소스에서 시도)
-                    cover_url = self._extract_cover_image(info)
-                    
-                    production = info.get('production')
-                    
-                    print(f"✅ 기본 정보 수집 완료: {name}")
-                    
-                    # 에피소드 정보 (여러 방법으로 시도)
-                    total_episodes = self._extract_total_episodes(info, anime_id)
-                    
-                    # 메타데이터 객체 생성
-                    metadata = AnimeMetadata(
-                        laftel_id=str(anime_id),
-                        name=name,
-                        air_year_quarter=air_year_quarter,
-                        avg_rating=float(avg_rating) if avg_rating else None,
-                        status=status,
-                        laftel_url=laftel_url,
-                        cover_url=cover_url,
-                        production=production,
-                        total_episodes=total_episodes
-                    )
-                    
-                    print(f"✅ 메타데이터 수집 완료!")
-                    print(f"   제목: {metadata.name}")
-                    print(f"   방영분기: {metadata.air_year_quarter}")
-                    print(f"   평점: {metadata.avg_rating}")
-                    print(f"   상태: {metadata.status}")
-                    print(f"   제작사: {metadata.production}")
-                    print(f"   총 화수: {metadata.total_episodes}화")
-                    
-                    return MetadataResult(
-                        selected_title=selected_title,
-                        metadata=metadata,
-                        success=True
-                    )
-                    
-                except Exception as e:
-                    print(f"⚠️ 메타데이터 수집 시도 {attempt + 1} 실패: {e}")
-                    if attempt < self.retry_count - 1:
-                        time.sleep(self.retry_delay)
-                        continue
-                    raise
-                    
-        except Exception as e:
-            error_msg = f"메타데이터 수집 실패: {str(e)}"
-            print(f"❌ {error_msg}")
+            # 상세 정보 캐시는 한 번만 읽어 사전 조회 판단과 상세 정보 조회에 함께 사용 (히트 중복 집계 방지)
+            cached = self._get_cached_item(anime_id)
+            memo, should_prefetch = self._plan_episode_fetch(anime_id, cached[0])
             
-            return MetadataResult(
-                selected_title=selected_title,
-                success=False,
-                error_message=error_msg
-            )
+            # 에피소드 조회는 anime_id에만 의존하므로 상세 정보 조회와 동시에 시작 (재시도 간 공유)
+            if should_prefetch:
+                prefetch = EpisodePrefetch(self._executor.submit(self._direct_get_episode_count, anime_id))
+            
+            # 재시도 정책 적용 메타데이터 수집
+            return self.retry_policy.call(self._collect_metadata, anime_id, selected_title, cached, memo, prefetch)
+        
+        except Exception as e:
+            return self._metadata_failure(selected_title, e)
+        
+        finally:
+            self._finish_prefetch(prefetch)
+    
+    def _collect_metadata(self, anime_id: Any, selected_title: str,
+                          cached: Optional[Tuple[Optional[Dict[str, Any]], bool]] = None,
+                          memo: Optional[int] = None,
+                          prefetch: Optional[EpisodePrefetch] = None) -> MetadataResult:
+        """상세 정보와 총 화수를 조회하여 메타데이터 생성 (1회 시도)"""
+        # 상세 정보 조회 (직접 HTTP 요청 사용)
+        info = self._direct_get_anime_info(anime_id, cached)
+        print(f"✅ 기본 정보 수집 완료: {info.get('name', selected_title)}")
+        
+        # 에피소드 정보 (여러 방법으로 시도)
+        total_episodes = self._extract_total_episodes(info, anime_id, memo, prefetch)
+        
+        # 메타데이터 객체 생성
+        metadata = self._build_metadata(info, anime_id, selected_title, total_episodes)
+        self._print_metadata(metadata)
+        
+        return MetadataResult(
+            selected_title=selected_title,
+            metadata=metadata,
+            success=True
+        )
+    
+    def _get_metadata_one(self, id_or_title: Union[int, str]) -> MetadataResult:
+        """라프텔 ID 또는 제목 하나의 메타데이터 수집 (예외도 실패 결과로 변환)"""
+        try:
+            if self._is_laftel_id(id_or_title):
+                return self.get_metadata_by_id(str(id_or_title).strip())
+            return self.get_metadata(id_or_title)
+        except Exception as e:
+            return self._metadata_failure(str(id_or_title), e)
+    
+    def get_metadata_many(self, ids_or_titles: List[Union[int, str]],
+                          concurrency: Optional[int] = None) -> List[MetadataResult]:
+        """
+        여러 작품의 메타데이터를 동시에 수집
+        
+        Args:
+            ids_or_titles: 라프텔 ID(숫자) 또는 애니메이션 제목 목록
+            concurrency: 동시 처리 수 (기본값: 설정값)
+        
+        Returns:
+            입력 순서와 같은 MetadataResult 목록 (항목별 실패는 success=False)
+        """
+        if not ids_or_titles:
+            return []
+        
+        concurrency = max(1, concurrency or settings.laftel_metadata_concurrency)
+        print(f"📦 메타데이터 일괄 수집: {len(ids_or_titles)}개 (동시 {concurrency}개)")
+        
+        # 항목 내부에서 조회 스레드풀을 사용하므로 별도 스레드풀로 실행 (교착 방지)
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="laftel-many") as executor:
+            results = list(executor.map(self._get_metadata_one, ids_or_titles))
+        
+        succeeded = sum(1 for result in results if result.success)
+        print(f"📦 메타데이터 일괄 수집 완료: 성공 {succeeded}개 / 실패 {len(results) - succeeded}개")
+        return results
+    
+    def get_metadata_for_match(self, llm_result: LLMMatchResult) -> MetadataResult:
+        """
+        Step 2 매칭 결과로 메타데이터 수집
+        
+        라프텔 ID가 있으면 items/v3로 바로 조회하고, 없을 때만 제목 재검색
+        """
+        if llm_result.laftel_id:
+            print(f"🆔 Step 1 라프텔 ID 사용: {llm_result.laftel_id}")
+            return self.get_metadata_by_id(llm_result.laftel_id, llm_result.selected_title)
+        
+        return self.get_metadata(llm_result.selected_title)
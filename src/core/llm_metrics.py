@@ -0,0 +1,66 @@
+# 📈 Step 2 호출 계측 집계
+"""
+Step 2(LLM 매칭) 호출 계측 집계
+- 호출별 토큰 사용량으로 예상 요금 계산 (Batch API는 할인 요금 비율 적용)
+- 배치 단위 합계와 대기/실행 시간 p50/p95 분포 계산 (batch_summary.json의 llm_statistics)
+- 매칭 출처별(llm / packed / batch_api / cache / local) 건수로 LLM 호출 절감 효과 확인
+"""
+
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from .config import settings
+from .hedging import percentile
+from .models import LLMCallMetrics
+
+def estimate_cost(metrics: LLMCallMetrics) -> float:
+    """토큰 사용량 기준 예상 요금 (USD)"""
+    cost = (
+        metrics.prompt_tokens * settings.openai_input_price_per_1m
+        + metrics.completion_tokens * settings.openai_output_price_per_1m
+    ) / 1_000_000
+    if metrics.source == "batch_api":
+        cost *= settings.openai_batch_price_ratio
+    return cost
+
+def _distribution(values: List[float]) -> Dict[str, Optional[float]]:
+    """p50 / p95 / 최대 / 평균 (표본이 없으면 None)"""
+    if not values:
+        return {"p50": None, "p95": None, "max": None, "mean": None}
+    return {
+        "p50": round(percentile(values, 50), 3),
+        "p95": round(percentile(values, 95), 3),
+        "max": round(max(values), 3),
+        "mean": round(sum(values) / len(values), 3)
+    }
+
+def summarize_llm_metrics(metrics_list: List[Optional[LLMCallMetrics]]) -> Dict[str, Any]:
+    """
+    배치 단위 Step 2 계측 집계
+
+    Args:
+        metrics_list: 항목별 계측 (매칭을 시도하지 않은 항목은 None)
+
+    Returns:
+        합계(호출/토큰/요금)와 API를 호출한 항목의 대기/실행 시간·토큰 분포
+    """
+    metrics_list = [metrics for metrics in metrics_list if metrics is not None]
+    # 분포는 실제로 매칭 요청을 보낸 항목만 (Batch API 항목은 작업 단위로 처리되므로 합계에만 포함)
+    called = [metrics for metrics in metrics_list if metrics.source in ("llm", "packed")]
+    polled = [metrics for metrics in called if metrics.backend == "assistant"]
+
+    return {
+        "items": len(metrics_list),
+        "by_source": dict(Counter(metrics.source for metrics in metrics_list)),
+        "api_calls": sum(metrics.api_calls for metrics in metrics_list),
+        "poll_count": sum(metrics.poll_count for metrics in metrics_list),
+        "prompt_tokens": sum(metrics.prompt_tokens for metrics in metrics_list),
+        "completion_tokens": sum(metrics.completion_tokens for metrics in metrics_list),
+        "total_tokens": sum(metrics.total_tokens for metrics in metrics_list),
+        "estimated_cost_usd": round(sum(metrics.estimated_cost_usd or 0.0 for metrics in metrics_list), 6),
+        "queue_seconds": _distribution([metrics.queue_seconds for metrics in called]),
+        "server_queue_seconds": _distribution([metrics.server_queue_seconds for metrics in polled]),
+        "run_seconds": _distribution([metrics.run_seconds for metrics in called]),
+        "poll_count_per_item": _distribution([float(metrics.poll_count) for metrics in polled]),
+        "total_tokens_per_item": _distribution([float(metrics.total_tokens) for metrics in called])
+    }
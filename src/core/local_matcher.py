@@ -0,0 +1,239 @@
+# 🧮 로컬 사전 매칭
+"""
+Step 2 로컬 사전 매칭 (LLM 호출 전 단계)
+- 제목 정규화 후 완전 일치 / 문자 bigram 유사도로 점수 계산
+- 시즌(기/시즌/제목 끝 로마 숫자)·파트 번호가 다르면 후보에서 제외
+- 같은 작품의 자막/더빙판은 한 그룹으로 묶고 자막판 우선 (시스템 프롬프트와 동일한 기준)
+- 1위 점수가 임계값 이상이고 2위 작품과의 차이가 충분할 때만 결과 반환, 애매하면 None → LLM으로 위임
+- LLM으로 넘길 때는 후보를 유사도 순으로 정렬하고 점수 차이에 따라 상위 k개만 전달
+"""
+
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .config import settings
+from .models import LLMMatchResult, SearchCandidate
+from .search_normalizer import FULLWIDTH_TABLE
+
+# 자막/더빙 등 같은 작품의 판본 표시 (제목 비교에서 제외)
+EDITION_MARK = re.compile(r'[\(\[]\s*(자막|더빙|무삭제|우리말|한국어)\s*[\)\]]')
+DUB_MARK = re.compile(r'[\(\[]\s*(더빙|우리말|한국어)\s*[\)\]]')
+SUB_MARK = re.compile(r'[\(\[]\s*자막\s*[\)\]]')
+
+# 시즌 번호 표기
+SEASON_PATTERNS = [
+    re.compile(r'제?\s*(\d+)\s*기(?![가-힣])'),
+    re.compile(r'시즌\s*(\d+)'),
+    re.compile(r'season\s*(\d+)', re.IGNORECASE),
+    re.compile(r'(\d+)(?:st|nd|rd|th)\s*season', re.IGNORECASE),
+]
+# 제목 끝의 로마 숫자만 시즌으로 인식 ("HUNTER X HUNTER", "록맨 X"처럼 제목의 일부인 X/V는 제외)
+ROMAN_SEASON = re.compile(r'(?<=\s)(II|III|IV|VI|VII|VIII|IX)$')
+ROMAN_VALUES = {"II": 2, "III": 3, "IV": 4, "VI": 6, "VII": 7, "VIII": 8, "IX": 9}
+
+# 파트 번호 표기
+PART_PATTERNS = [
+    re.compile(r'(?:part|파트)\s*(\d+)', re.IGNORECASE),
+    re.compile(r'(\d+)\s*쿨'),
+]
+
+NON_WORD = re.compile(r'[\W_]+')
+
+def _first_number(patterns: List[re.Pattern], text: str) -> Optional[int]:
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            return int(match.group(1))
+    return None
+
+def parse_title(title: str) -> Tuple[str, Optional[int], Optional[int]]:
+    """
+    제목을 (비교용 본제목, 시즌 번호, 파트 번호)로 분해
+    
+    본제목은 판본 표시/시즌/파트 표기를 제거하고 대소문자·공백·문장 부호를 무시한 문자열이다.
+    """
+    text = title.translate(FULLWIDTH_TABLE)
+    text = EDITION_MARK.sub(' ', text)
+    
+    season = _first_number(SEASON_PATTERNS, text)
+    part = _first_number(PART_PATTERNS, text)
+    
+    base = text
+    for pattern in SEASON_PATTERNS + PART_PATTERNS:
+        base = pattern.sub(' ', base)
+    base = base.strip()
+    
+    roman = ROMAN_SEASON.search(base)
+    if roman:
+        if season is None:
+            season = ROMAN_VALUES[roman.group(1)]
+        base = base[:roman.start()]
+    base = NON_WORD.sub('', base.casefold())
+    
+    return base, season, part
+
+def _bigrams(text: str) -> Dict[str, int]:
+    grams: Dict[str, int] = {}
+    if len(text) < 2:
+        if text:
+            grams[text] = 1
+        return grams
+    for i in range(len(text) - 1):
+        gram = text[i:i + 2]
+        grams[gram] = grams.get(gram, 0) + 1
+    return grams
+
+def bigram_similarity(a: str, b: str) -> float:
+    """문자 bigram Dice 계수 (0.0 ~ 1.0)"""
+    if a == b:
+        return 1.0
+    grams_a, grams_b = _bigrams(a), _bigrams(b)
+    total = sum(grams_a.values()) + sum(grams_b.values())
+    if not total:
+        return 0.0
+    overlap = sum(min(count, grams_b.get(gram, 0)) for gram, count in grams_a.items())
+    return 2 * overlap / total
+
+def _scripts(text: str) -> set:
+    """문자 체계 집합 (한글 / 라틴 / 기타, 숫자 제외)"""
+    scripts = set()
+    for char in text:
+        if char.isdigit():
+            continue
+        if '\uac00' <= char <= '\ud7a3' or '\u3131' <= char <= '\u318e':
+            scripts.add('hangul')
+        elif char.isascii():
+            scripts.add('latin')
+        else:
+            scripts.add('other')
+    return scripts
+
+def _numbers_agree(wanted: Optional[int], found: Optional[int]) -> bool:
+    """시즌/파트 번호 일치 여부 (표기가 없으면 1로 간주)"""
+    return (wanted or 1) == (found or 1)
+
+def _edition_rank(title: str) -> int:
+    """같은 작품 내 우선순위 (자막 > 표시 없음 > 더빙)"""
+    if SUB_MARK.search(title):
+        return 0
+    if DUB_MARK.search(title):
+        return 2
+    return 1
+
+class ScoredCandidate(NamedTuple):
+    """후보별 로컬 유사도 (0~100, 후보 객체의 similarity_score는 건드리지 않음)"""
+    candidate: SearchCandidate
+    score: float      # 시즌/파트 불일치 감점 반영
+    raw_score: float  # 본제목 유사도만
+
+def score_candidates(user_input: str, candidates: List[SearchCandidate]) -> List[ScoredCandidate]:
+    """
+    후보별 유사도 점수를 계산하여 점수 내림차순으로 정렬
+    
+    시즌/파트 번호가 다른 후보는 점수를 절반으로 낮춘다 (매칭 거부 판단을 위해 목록에는 유지).
+    입력과 문자 체계가 전혀 겹치지 않는 후보(예: "스파이 패밀리" ↔ "SPY×FAMILY")는
+    비교할 수 없으므로 결과에서 제외한다.
+    """
+    input_base, input_season, input_part = parse_title(user_input)
+    input_scripts = _scripts(input_base)
+    
+    scored = []
+    for candidate in candidates:
+        base, season, part = parse_title(candidate.title)
+        if input_scripts and not (input_scripts & _scripts(base)):
+            continue
+        
+        raw_score = bigram_similarity(input_base, base) * 100 if input_base else 0.0
+        score = raw_score
+        if not (_numbers_agree(input_season, season) and _numbers_agree(input_part, part)):
+            score *= 0.5
+        scored.append(ScoredCandidate(candidate, round(score, 1), round(raw_score, 1)))
+    
+    return sorted(scored, key=lambda item: (-item.score, item.candidate.rank))
+
+def shortlist_candidates(user_input: str, candidates: List[SearchCandidate],
+                         min_k: Optional[int] = None,
+                         max_k: Optional[int] = None,
+                         gap: Optional[float] = None) -> List[SearchCandidate]:
+    """
+    LLM 프롬프트에 보낼 후보 축소 (점수 차이에 따른 가변 top-k)
+    
+    1위 점수가 llm_candidate_confident_score 미만이면 판단 근거가 없으므로 원래 목록을 그대로
+    반환한다. 그 외에는 1위와의 점수 차이가 gap 이내인 후보를 min_k개 이상 max_k개 이하로 고르고,
+    시즌 감점 전 유사도가 가장 높은 후보와 점수를 매길 수 없는 다른 문자 체계의 후보는 항상 포함한다.
+    """
+    min_k = settings.llm_candidate_min_k if min_k is None else min_k
+    max_k = settings.llm_candidate_max_k if max_k is None else max_k
+    gap = settings.llm_candidate_score_gap if gap is None else gap
+    
+    ranked = score_candidates(user_input, candidates)
+    if not ranked or ranked[0].score < settings.llm_candidate_confident_score:
+        return candidates
+    
+    scored_ids = {id(item.candidate) for item in ranked}
+    unscored = [candidate for candidate in candidates if id(candidate) not in scored_ids]
+    
+    cutoff = ranked[0].score - gap
+    close = sum(1 for item in ranked if item.score >= cutoff)
+    shortlisted = [item.candidate for item in ranked[:max(min_k, min(close, max_k))]]
+    
+    # 시즌 표기 해석이 틀려도 제목이 가장 비슷한 후보는 LLM이 볼 수 있도록 유지
+    best_raw = min(ranked, key=lambda item: (-item.raw_score, item.candidate.rank)).candidate
+    if all(candidate is not best_raw for candidate in shortlisted):
+        shortlisted.append(best_raw)
+    
+    return shortlisted + unscored
+
+def local_match(user_input: str, candidates: List[SearchCandidate],
+                threshold: Optional[float] = None,
+                margin: Optional[float] = None) -> Optional[LLMMatchResult]:
+    """
+    LLM 없이 확실한 매칭 찾기
+    
+    Args:
+        user_input: 사용자 입력 제목
+        candidates: 라프텔 검색 후보 목록
+        threshold: 채택 최소 점수 (기본값: settings.local_match_threshold)
+        margin: 1위와 2위 작품의 최소 점수 차이 (기본값: settings.local_match_margin)
+    
+    Returns:
+        확신할 수 있으면 LLMMatchResult, 애매하면 None
+    """
+    threshold = settings.local_match_threshold if threshold is None else threshold
+    margin = settings.local_match_margin if margin is None else margin
+    
+    input_base, input_season, input_part = parse_title(user_input)
+    if not input_base or not candidates:
+        return None
+    
+    # (본제목, 시즌, 파트)가 같은 후보 = 같은 작품의 다른 판본
+    groups: Dict[Tuple[str, Optional[int], Optional[int]], List[SearchCandidate]] = {}
+    for candidate in candidates:
+        groups.setdefault(parse_title(candidate.title), []).append(candidate)
+    
+    scored = []
+    for (base, season, part), members in groups.items():
+        score = bigram_similarity(input_base, base) * 100
+        if not (_numbers_agree(input_season, season) and _numbers_agree(input_part, part)):
+            score = 0.0
+        scored.append((score, members, base == input_base))
+    
+    scored.sort(key=lambda item: item[0], reverse=True)
+    best_score, best_members, exact = scored[0]
+    runner_up = scored[1][0] if len(scored) > 1 else 0.0
+    
+    if best_score < threshold or best_score - runner_up < margin:
+        return None
+    
+    selected = min(best_members, key=lambda candidate: (_edition_rank(candidate.title), candidate.rank))
+    reason = "정규화 제목 완전 일치" if exact else f"제목 유사도 {best_score:.0f}%"
+    
+    return LLMMatchResult(
+        user_input=user_input,
+        candidates_count=len(candidates),
+        selected_title=selected.title,
+        laftel_id=selected.laftel_id,
+        confidence_score=round(best_score, 1),
+        reasoning=f"로컬 매칭: {reason}, 시즌/파트 일치",
+        success=True
+    )
@@ -0,0 +1,142 @@
+# 🧠 LLM 매칭 결과 캐시
+"""
+Step 2 LLM 매칭 결과 디스크 캐시
+- 키: 정규화한 사용자 입력 + 순서를 유지한 후보 제목 목록 해시
+  (같은 제목에 같은 후보 목록이면 프롬프트가 같으므로 응답을 재사용)
+- SqliteCache 테이블에 TTL/LRU 정리와 함께 저장
+- 기존 productions/*/llm_results 결과 파일로 미리 채우기 지원
+"""
+
+import glob
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .cache import get_cache, normalize_cache_key
+from .config import settings
+from .models import LLMMatchResult, SearchCandidate
+
+def candidates_digest(candidate_titles: Sequence[str]) -> str:
+    """후보 제목 목록 해시 (순서 유지)"""
+    payload = "\n".join(candidate_titles).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+def match_cache_key(user_input: str, candidate_titles: Sequence[str]) -> str:
+    """매칭 캐시 키 (정규화 입력 + 후보 목록 해시)"""
+    return f"{normalize_cache_key(user_input)}|{candidates_digest(candidate_titles)}"
+
+class LLMMatchCache:
+    """LLMMatchResult 캐시 (성공한 매칭만 저장)"""
+    
+    def __init__(self, db_path: Optional[str] = None):
+        self.cache = get_cache(
+            "llm_matches",
+            ttl_seconds=settings.llm_match_cache_ttl,
+            max_entries=settings.llm_match_cache_max_entries,
+            db_path=db_path
+        )
+    
+    def get(self, user_input: str, candidates: List[SearchCandidate]) -> Optional[LLMMatchResult]:
+        """캐시된 매칭 결과 조회 (라프텔 ID는 현재 후보 목록 기준으로 다시 연결)"""
+        titles = [candidate.title for candidate in candidates]
+        data = self.cache.get(match_cache_key(user_input, titles))
+        if data is None:
+            return None
+        
+        result = LLMMatchResult(**data)
+        result.user_input = user_input
+        for candidate in candidates:
+            if candidate.title == result.selected_title:
+                result.laftel_id = candidate.laftel_id
+                break
+        return result
+    
+    def set(self, result: LLMMatchResult, candidate_titles: Sequence[str]) -> None:
+        """성공한 매칭 결과 저장"""
+        if not result.success or not result.selected_title:
+            return
+        # 호출 계측은 원래 호출 기준이므로 저장하지 않음 (캐시 적중시 source="cache"로 새로 기록)
+        self.cache.set(match_cache_key(result.user_input, candidate_titles), result.dict(exclude={'metrics'}))
+    
+    def warm_from_productions(self, productions_dir: Optional[str] = None) -> int:
+        """
+        기존 배치 결과 파일로 캐시 채우기
+        
+        - 레거시 step2 형식: candidate_titles/match_status/selected_title/confidence/reason 포함
+        - 배치 처리기 형식: LLMMatchResult 필드 (후보 목록은 같은 번호의 search_results 파일에서 조회)
+        - AI 매칭 실패 후 첫 번째 후보로 대체한 결과(신뢰도 없음)는 제외
+        
+        Returns:
+            저장한 항목 수
+        """
+        productions_dir = productions_dir or settings.productions_dir
+        pattern = os.path.join(productions_dir, "*", "llm_results", "*.json")
+        stored = 0
+        
+        for llm_file in sorted(glob.glob(pattern)):
+            try:
+                with open(llm_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                
+                entry = self._entry_from_file(llm_file, data)
+                if entry is None:
+                    continue
+                
+                result, candidate_titles = entry
+                self.set(result, candidate_titles)
+                stored += 1
+            
+            except Exception as e:
+                print(f"⚠️ 매칭 캐시 채우기 실패 ({os.path.basename(llm_file)}): {e}")
+        
+        return stored
+    
+    def _entry_from_file(self, llm_file: str,
+                         data: Dict[str, Any]) -> Optional[Tuple[LLMMatchResult, List[str]]]:
+        """결과 파일 하나를 (LLMMatchResult, 후보 제목 목록)으로 변환 (사용할 수 없으면 None)"""
+        user_input = data.get('user_input')
+        selected_title = data.get('selected_title')
+        if not user_input or not selected_title:
+            return None
+        
+        if 'match_status' in data and 'candidate_titles' in data:
+            if data['match_status'] != 'match_found' or data.get('confidence') is None:
+                return None
+            
+            candidate_titles = data['candidate_titles']
+            result = LLMMatchResult(
+                user_input=user_input,
+                candidates_count=len(candidate_titles),
+                selected_title=selected_title,
+                confidence_score=float(data['confidence']),
+                reasoning=data.get('reason'),
+                success=True
+            )
+            return result, candidate_titles
+        
+        if not data.get('success') or data.get('confidence_score') is None:
+            return None
+        
+        # llm_results/llm_01_제목.json → search_results/search_01_제목.json
+        batch_dir = os.path.dirname(os.path.dirname(llm_file))
+        search_name = "search_" + os.path.basename(llm_file)[len("llm_"):]
+        search_file = os.path.join(batch_dir, "search_results", search_name)
+        if not os.path.exists(search_file):
+            return None
+        
+        with open(search_file, 'r', encoding='utf-8') as f:
+            search_data = json.load(f)
+        
+        if 'candidates' in search_data:
+            candidate_titles = [candidate['title'] for candidate in search_data['candidates']]
+        else:
+            candidate_titles = search_data.get('candidate_titles', [])
+        
+        if not candidate_titles:
+            return None
+        
+        return LLMMatchResult(**data), candidate_titles
+    
+    def stats(self) -> Dict[str, Any]:
+        return self.cache.stats()
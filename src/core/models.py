@@ -65,15 +65,72 @@ class SearchResult(BaseModel):
     error_message: Optional[str] = None
     timestamp: datetime = Field(default_factory=datetime.now)
 
+# LLMCallMetrics 누적 항목 (횟수/토큰, 시간)
+LLM_METRIC_COUNTS = ("api_calls", "prompt_tokens", "completion_tokens", "total_tokens", "poll_count")
+LLM_METRIC_SECONDS = ("queue_seconds", "server_queue_seconds", "run_seconds")
+
+class LLMCallMetrics(BaseModel):
+    """Step 2 호출 계측 (토큰 사용량, 대기/실행 시간, 폴링 횟수)"""
+    source: str = "llm"                     # llm | packed | batch_api | cache | local
+    backend: Optional[str] = None           # assistant | chat
+    api_calls: int = 0                      # 재시도 포함 매칭 요청 수
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+    queue_seconds: float = 0.0              # 요청 전 로컬 대기 (계정 한도 / 동시 호출 상한)
+    server_queue_seconds: float = 0.0       # Assistant 실행이 queued 상태로 머문 시간 (폴링 관측값)
+    run_seconds: float = 0.0                # 요청 전송부터 응답 수신까지 (폴링 포함)
+    poll_count: int = 0                     # Assistant 실행 상태 조회 횟수
+    estimated_cost_usd: Optional[float] = None
+    
+    def add_usage(self, usage: Any) -> None:
+        """API 응답의 usage(prompt/completion/total 토큰) 누적 (SDK 객체 또는 dict)"""
+        if usage is None:
+            return
+        
+        def read(key: str) -> int:
+            value = usage.get(key) if isinstance(usage, dict) else getattr(usage, key, None)
+            return int(value or 0)
+        
+        self.prompt_tokens += read('prompt_tokens')
+        self.completion_tokens += read('completion_tokens')
+        self.total_tokens += read('total_tokens')
+    
+    def merge(self, other: "LLMCallMetrics") -> None:
+        """다른 계측값 누적 (묶음 매칭 몫을 개별 재시도 결과에 합칠 때 사용)"""
+        for field in LLM_METRIC_COUNTS + LLM_METRIC_SECONDS:
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+        if other.estimated_cost_usd is not None:
+            self.estimated_cost_usd = (self.estimated_cost_usd or 0.0) + other.estimated_cost_usd
+    
+    def split(self, count: int) -> List["LLMCallMetrics"]:
+        """
+        묶음 호출 계측을 항목 수만큼 나누기
+        
+        횟수/토큰은 합계가 유지되도록 균등 분배(나머지는 앞 항목)하고,
+        대기/실행 시간은 모든 항목이 함께 기다렸으므로 같은 값을 갖는다.
+        """
+        shares = [self.copy() for _ in range(count)]
+        for field in LLM_METRIC_COUNTS:
+            quotient, remainder = divmod(getattr(self, field), count)
+            for i, share in enumerate(shares):
+                setattr(share, field, quotient + (1 if i < remainder else 0))
+        if self.estimated_cost_usd is not None:
+            for share in shares:
+                share.estimated_cost_usd = self.estimated_cost_usd / count
+        return shares
+
 class LLMMatchResult(BaseModel):
     """Step 2: LLM 매칭 결과"""
     user_input: str
     candidates_count: int
     selected_title: Optional[str] = None
+    laftel_id: Optional[str] = None  # 선택된 후보의 라프텔 ID (Step 3 재검색 생략용)
     confidence_score: Optional[float] = None
     reasoning: Optional[str] = None
     success: bool
     error_message: Optional[str] = None
+    metrics: Optional[LLMCallMetrics] = None  # 호출 계측 (설정 오류 등으로 매칭을 시도하지 않으면 None)
     timestamp: datetime = Field(default_factory=datetime.now)
 
 class AnimeMetadata(BaseModel):
@@ -145,6 +202,11 @@ class ProcessResult(BaseModel):
         self.step_results.append(step_result)
         if success:
             self.steps_completed += 1
+    
+    @property
+    def llm_metrics(self) -> Optional[LLMCallMetrics]:
+        """Step 2 호출 계측 (매칭 결과에 기록된 값)"""
+        return self.llm_result.metrics if self.llm_result else None
 
 # === 배치 처리용 모델 ===
 
@@ -163,6 +225,7 @@ class BatchSummary(BaseModel):
     step_statistics: Dict[str, int]
     failed_items: List[str]
     processing_details: List[Dict[str, Any]]
+    llm_statistics: Optional[Dict[str, Any]] = None  # Step 2 토큰/비용/지연 시간 집계 (p50/p95)
     execution_time: datetime = Field(default_factory=datetime.now)
 
 # === 헬스체크 모델 ===
@@ -3,10 +3,13 @@
 노션 API 래퍼 클래스
 - 페이지 생성 및 업데이트 기능
 - 에러 핸들링 및 재시도 로직 포함
+- keep-alive 세션으로 api.notion.com 커넥션(TCP+TLS) 재사용, 연결/응답 타임아웃 적용
+- 제목 → 페이지 ID 로컬 인덱스로 기존 페이지 확인 (쓰기마다 데이터베이스 쿼리하지 않음)
 - 기존 step4 로직을 클래스로 래핑
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 from typing import Dict, Any, Optional, List
@@ -14,6 +17,8 @@ from datetime import datetime
 
 from .models import NotionResult, AnimeMetadata
 from .config import settings, NOTION_FIELD_MAPPING, NOTION_DEFAULT_VALUES
+from .retry import RetryPolicy, HTTPStatusError, default_is_retryable, parse_retry_after
+from .notion_index import TITLE_PROPERTY_ID, get_notion_index
 
 class NotionClient:
     """노션 API 클라이언트"""
@@ -28,60 +33,118 @@ class NotionClient:
             "Notion-Version": "2022-06-28",
             "Content-Type": "application/json"
         }
-        self.retry_count = 3
-        self.retry_delay = 2.0  # 초
+        # 429는 노션이 요청한 Retry-After만큼 그대로 대기 (일반 백오프 상한과 별도)
+        # notion_retry_after_max보다 긴 대기를 요청하면 재시도하지 않고 실패 처리
+        self.retry_policy = RetryPolicy(
+            "노션 API",
+            is_retryable=self._is_retryable,
+            max_retry_after=settings.notion_retry_after_max
+        )
+        
+        # (연결, 응답) 타임아웃: 응답 없는 노션 호출이 배치 워커를 무한정 붙잡지 않도록
+        self.timeout = (settings.notion_connect_timeout, settings.notion_read_timeout)
+        self.session = self._create_session()
+        
+        # 제목 → 페이지 ID 인덱스 (프로세스 전역 공유, 첫 조회시 구축)
+        self.index = get_notion_index(self.database_id) if settings.notion_index_enabled else None
+    
+    def _create_session(self) -> requests.Session:
+        """커넥션 풀 및 공통 헤더가 설정된 세션 생성 (스레드 간 공유)"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,  # api.notion.com 단일 호스트
+            pool_maxsize=settings.notion_pool_maxsize,
+            max_retries=0  # 재시도는 재시도 정책에서 처리
+        )
+        session.mount('https://', adapter)
+        session.headers.update(self.headers)
+        return session
+    
+    def close(self) -> None:
+        """세션 및 풀링된 커넥션 정리"""
+        self.session.close()
+    
+    def __enter__(self) -> "NotionClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
     
     def _validate_setup(self) -> bool:
         """설정 유효성 검사"""
         if not settings.notion_token:
             print("❌ 노션 API 토큰이 설정되지 않았습니다.")
             return False
-            
+        
         if not settings.notion_database_id:
             print("❌ 노션 데이터베이스 ID가 설정되지 않았습니다.")
             return False
-            
+        
         return True
     
-    def _make_request(self, method: str, endpoint: str, data: Dict[str, Any] = None) -> Dict[str, Any]:
-        """노션 API 요청 실행 (재시도 로직 포함)"""
+    def _is_retryable(self, error: Exception) -> bool:
+        """재시도 가능 오류 판단 (네트워크 오류, 409 충돌, 429, 5xx)"""
+        if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+            return True
+        if isinstance(error, HTTPStatusError) and error.status_code == 409:
+            return True  # conflict_error: 노션 문서상 재시도 권장
+        return default_is_retryable(error)
+    
+    def _make_request(self, method: str, endpoint: str, data: Dict[str, Any] = None,
+                      idempotent: bool = True) -> Dict[str, Any]:
+        """
+        노션 API 요청 실행 (재시도 정책 적용)
+        
+        idempotent=False인 요청(페이지 생성)은 응답 대기 시간 초과나 5xx 응답이면 재시도하지 않는다.
+        노션에서는 이미 처리되었을 수 있어 재시도하면 중복 페이지가 생기기 때문이다.
+        (429/409는 처리 전에 거절된 요청이므로 재시도)
+        """
+        return self.retry_policy.call(self._send_request, method, endpoint, data, idempotent)
+    
+    def _send_request(self, method: str, endpoint: str, data: Dict[str, Any] = None,
+                      idempotent: bool = True) -> Dict[str, Any]:
+        """노션 API 요청 1회 실행"""
         url = f"{self.base_url}/{endpoint}"
+        method = method.upper()
         
-        for attempt in range(self.retry_count):
-            try:
-                if method.upper() == "GET":
-                    response = requests.get(url, headers=self.headers)
-                elif method.upper() == "POST":
-                    response = requests.post(url, headers=self.headers, json=data)
-                elif method.upper() == "PATCH":
-                    response = requests.patch(url, headers=self.headers, json=data)
-                else:
-                    raise ValueError(f"지원하지 않는 HTTP 메서드: {method}")
-                
-                # 응답 확인
-                if response.status_code in [200, 201]:
-                    return response.json()
-                elif response.status_code == 429:  # Rate limit
-                    print(f"⚠️ 요청 한도 초과, {self.retry_delay}초 대기...")
-                    time.sleep(self.retry_delay)
-                    continue
-                else:
-                    error_msg = f"API 요청 실패 (상태코드: {response.status_code})"
-                    try:
-                        error_detail = response.json()
-                        error_msg += f": {error_detail.get('message', '알 수 없는 오류')}"
-                    except:
-                        error_msg += f": {response.text}"
-                    raise Exception(error_msg)
-                    
-            except requests.exceptions.RequestException as e:
-                print(f"⚠️ 네트워크 오류 시도 {attempt + 1}: {e}")
-                if attempt < self.retry_count - 1:
-                    time.sleep(self.retry_delay)
-                    continue
+        if method not in ("GET", "POST", "PATCH"):
+            raise ValueError(f"지원하지 않는 HTTP 메서드: {method}")
+        
+        try:
+            response = self.session.request(
+                method,
+                url,
+                json=data if method != "GET" else None,
+                timeout=self.timeout
+            )
+        except requests.ReadTimeout as e:
+            if idempotent:
                 raise
+            raise RuntimeError(f"응답 시간 초과 (중복 방지를 위해 재시도하지 않음): {e}") from e
+        
+        # 응답 확인
+        if response.status_code in [200, 201]:
+            return response.json()
+        
+        if response.status_code == 429:  # Rate limit
+            print(f"⚠️ 요청 한도 초과 (Retry-After: {response.headers.get('Retry-After', '없음')})")
+        
+        error_msg = f"API 요청 실패 (상태코드: {response.status_code})"
+        try:
+            error_detail = response.json()
+            error_msg += f": {error_detail.get('message', '알 수 없는 오류')}"
+        except:
+            error_msg += f": {response.text}"
+        error = HTTPStatusError(
+            response.status_code,
+            error_msg,
+            retry_after=parse_retry_after(response.headers.get('Retry-After'))
+        )
         
-        raise Exception(f"API 요청 {self.retry_count}회 실패")
+        if response.status_code >= 500 and not idempotent:
+            # 게이트웨이 오류/서버 오류여도 노션에서 이미 처리되었을 수 있음
+            raise RuntimeError(f"{error_msg} (중복 방지를 위해 재시도하지 않음)") from error
+        raise error
     
     def _create_page_properties(self, metadata: Optional[AnimeMetadata], 
                               user_input: str, is_new_page: bool = False) -> Dict[str, Any]:
@@ -177,8 +240,29 @@ class NotionClient:
         
         return properties
     
+    def _query_index_page(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """인덱스 구축/갱신용 데이터베이스 조회 1페이지 (제목 속성만 요청)"""
+        return self._make_request(
+            "POST",
+            f"databases/{self.database_id}/query?filter_properties={TITLE_PROPERTY_ID}",
+            body
+        )
+    
     def find_existing_page(self, user_input: str) -> Optional[str]:
-        """제목으로 기존 페이지 검색"""
+        """
+        제목으로 기존 페이지 검색
+        
+        인덱스가 최신이면 메모리에서 조회하고, 인덱스를 갱신할 수 없을 때만 제목 필터 쿼리로 확인한다.
+        """
+        if self.index and self.index.ensure_fresh(self._query_index_page):
+            return self.index.lookup(user_input)
+        
+        if self.index:
+            self.index.fallbacks += 1
+        return self._query_existing_page(user_input)
+    
+    def _query_existing_page(self, user_input: str) -> Optional[str]:
+        """제목 필터 쿼리로 기존 페이지 검색"""
         try:
             query_data = {
                 "filter": {
@@ -200,7 +284,7 @@ class NotionClient:
                 return results[0]["id"]
             
             return None
-            
+        
         except Exception as e:
             print(f"⚠️ 기존 페이지 검색 실패: {e}")
             return None
@@ -213,7 +297,7 @@ class NotionClient:
         Args:
             user_input: 사용자가 입력한 애니메이션 제목
             metadata: 수집된 메타데이터 (없으면 기본 페이지만 생성)
-            
+        
         Returns:
             NotionResult: 노션 작업 결과
         """
@@ -231,11 +315,20 @@ class NotionClient:
             
             if existing_page_id:
                 print(f"🔍 기존 페이지 발견: {user_input}")
-                return self._update_existing_page(existing_page_id, user_input, metadata)
+                try:
+                    return self._update_existing_page(existing_page_id, user_input, metadata)
+                except Exception as e:
+                    if not self._is_stale_page_error(e):
+                        raise
+                    
+                    # 인덱스에 남아 있던 삭제/보관 페이지: 인덱스에서 제거 후 새로 생성
+                    print(f"⚠️ 기존 페이지를 수정할 수 없음 (삭제/보관됨) - 새로 생성: {user_input}")
+                    self.index.discard(existing_page_id)
+                    return self._create_new_page(user_input, metadata)
             else:
                 print(f"📄 새 페이지 생성: {user_input}")
                 return self._create_new_page(user_input, metadata)
-                
+        
         except Exception as e:
             error_msg = f"노션 작업 실패: {str(e)}"
             print(f"❌ {error_msg}")
@@ -245,6 +338,15 @@ class NotionClient:
                 error_message=error_msg
             )
     
+    def _is_stale_page_error(self, error: Exception) -> bool:
+        """인덱스의 페이지가 삭제/보관되어 수정할 수 없다는 오류인지 (404, 보관된 페이지 수정 400)"""
+        cause = error.__cause__
+        return (
+            self.index is not None
+            and isinstance(cause, HTTPStatusError)
+            and (cause.status_code == 404 or (cause.status_code == 400 and "archived" in str(cause)))
+        )
+    
     def _create_new_page(self, user_input: str, 
                         metadata: Optional[AnimeMetadata]) -> NotionResult:
         """새 노션 페이지 생성"""
@@ -261,11 +363,14 @@ class NotionClient:
             if metadata and metadata.name:
                 print(f"📝 제목: {metadata.name}")
             
-            response = self._make_request("POST", "pages", page_data)
+            response = self._make_request("POST", "pages", page_data, idempotent=False)
             
             page_id = response["id"]
             page_url = response["url"]
             
+            if self.index:
+                self.index.add(user_input, page_id)
+            
             print("✅ 노션 페이지 생성 성공!")
             print(f"📄 페이지 ID: {page_id}")
             print(f"🔗 페이지 URL: {page_url}")
@@ -277,7 +382,7 @@ class NotionClient:
                 updated_properties=properties,
                 success=True
             )
-            
+        
         except Exception as e:
             raise Exception(f"페이지 생성 실패: {str(e)}")
     
@@ -311,9 +416,9 @@ class NotionClient:
                 updated_properties=properties,
                 success=True
             )
-            
+        
         except Exception as e:
-            raise Exception(f"페이지 업데이트 실패: {str(e)}")
+            raise Exception(f"페이지 업데이트 실패: {str(e)}") from e
     
     def get_page(self, page_id: str) -> Optional[Dict[str, Any]]:
         """페이지 정보 조회"""
@@ -338,7 +443,11 @@ class NotionClient:
             )
             
             return response.get("results", [])
-            
+        
         except Exception as e:
             print(f"⚠️ 데이터베이스 쿼리 실패: {e}")
             return []
+    
+    def index_stats(self) -> Optional[Dict[str, Any]]:
+        """제목 인덱스 통계 (비활성화시 None)"""
+        return self.index.stats() if self.index else None
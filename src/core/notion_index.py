@@ -0,0 +1,207 @@
+# 🗂️ 노션 데이터베이스 제목 인덱스
+"""
+노션 데이터베이스 제목 → 페이지 ID 로컬 인덱스
+- 최초 1회 페이지 단위 전체 조회(title 속성만)로 구축
+- 이후 last_edited_time 기준 증분 조회로 외부 변경(추가/제목 변경) 반영
+- 직접 생성한 페이지는 즉시 반영하여 기존 페이지 확인을 메모리 조회로 처리
+- 삭제(보관)된 페이지는 증분 조회에 나타나지 않으므로 주기적 전체 재구축으로 정리
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .config import settings
+
+# 제목(title) 속성 ID (노션 데이터베이스 공통), 전체/증분 조회시 이 속성만 받아 응답 크기 축소
+TITLE_PROPERTY_ID = "title"
+
+def page_title(page: Dict[str, Any]) -> Optional[str]:
+    """페이지 응답에서 제목 텍스트 추출 (제목 속성이 없으면 None)"""
+    for prop in page.get("properties", {}).values():
+        if prop.get("type") == "title":
+            return "".join(part.get("plain_text", "") for part in prop.get("title", []))
+    return None
+
+class NotionTitleIndex:
+    """노션 데이터베이스 제목 → 페이지 ID 인메모리 인덱스"""
+    
+    def __init__(self, database_id: str):
+        """
+        인덱스 초기화 (구축은 첫 조회시)
+        
+        Args:
+            database_id: 노션 데이터베이스 ID
+        """
+        self.database_id = database_id
+        self.hits = 0
+        self.misses = 0
+        self.scans = 0
+        self.fallbacks = 0
+        
+        self._titles: Dict[str, str] = {}       # 제목 → 페이지 ID
+        self._page_titles: Dict[str, str] = {}  # 페이지 ID → 제목 (제목 변경 반영용)
+        self._added: Dict[str, str] = {}        # 마지막 전체 조회 이후 직접 생성한 페이지 ID → 제목
+        self._cursor: Optional[str] = None      # 지금까지 본 가장 최근 last_edited_time
+        self._built_at: Optional[float] = None
+        self._synced_at: Optional[float] = None
+        
+        self._lock = threading.Lock()
+        # 전체/증분 조회는 한 스레드만 실행 (나머지는 끝날 때까지 대기 후 갱신된 인덱스 사용)
+        self._sync_lock = threading.Lock()
+    
+    def _apply(self, titles: Dict[str, str], page_titles: Dict[str, str], page: Dict[str, Any]) -> None:
+        """페이지 1개를 인덱스 사전에 반영"""
+        page_id = page["id"]
+        title = page_title(page)
+        
+        # 제목이 바뀐 페이지는 이전 제목 항목 제거
+        previous = page_titles.pop(page_id, None)
+        if previous is not None and titles.get(previous) == page_id:
+            del titles[previous]
+        
+        if title is None or page.get("archived") or page.get("in_trash"):
+            return
+        
+        page_titles[page_id] = title
+        # 같은 제목 페이지가 여럿이면 먼저 색인된 페이지 유지
+        titles.setdefault(title, page_id)
+    
+    def _title_page(self, page_id: str, title: str) -> Dict[str, Any]:
+        """제목만 있는 페이지 응답 형태 (직접 생성한 페이지 반영용)"""
+        return {"id": page_id, "properties": {"이름": {"type": "title", "title": [{"plain_text": title}]}}}
+    
+    def _scan(self, query: Callable[[Dict[str, Any]], Dict[str, Any]],
+              since: Optional[str]) -> int:
+        """
+        데이터베이스 조회 결과로 인덱스 갱신
+        
+        Args:
+            query: 쿼리 본문 → 응답 (databases/{id}/query 1회 호출)
+            since: 증분 조회 기준 last_edited_time (None이면 전체 조회 후 교체)
+        
+        Returns:
+            조회한 페이지 수
+        """
+        body: Dict[str, Any] = {"page_size": settings.notion_query_page_size}
+        if since:
+            # last_edited_time은 분 단위로 기록되므로 같은 분의 변경도 포함 (on_or_after)
+            body["filter"] = {"timestamp": "last_edited_time", "last_edited_time": {"on_or_after": since}}
+        
+        pages: List[Dict[str, Any]] = []
+        while True:
+            response = query(body)
+            pages.extend(response.get("results", []))
+            
+            if not response.get("has_more") or not response.get("next_cursor"):
+                break
+            body["start_cursor"] = response["next_cursor"]
+        
+        cursor = max((page.get("last_edited_time") or "" for page in pages), default="")
+        
+        with self._lock:
+            if since:
+                titles, page_titles = self._titles, self._page_titles
+            else:
+                # 전체 조회는 새 사전으로 구축 후 교체 (중간 실패시 기존 인덱스 유지, 삭제된 페이지 정리)
+                titles, page_titles = {}, {}
+            
+            for page in pages:
+                self._apply(titles, page_titles, page)
+            
+            if not since:
+                # 조회 도중 생성되어 결과에 빠졌을 수 있는 페이지 재반영
+                for page_id, title in self._added.items():
+                    if page_id not in page_titles:
+                        self._apply(titles, page_titles, self._title_page(page_id, title))
+                self._added = {}
+            
+            self._titles, self._page_titles = titles, page_titles
+            if since is None or cursor > (self._cursor or ""):
+                self._cursor = cursor or self._cursor
+            
+            now = time.monotonic()
+            if since is None:
+                self._built_at = now
+            self._synced_at = now
+            self.scans += 1
+        
+        return len(pages)
+    
+    def ensure_fresh(self, query: Callable[[Dict[str, Any]], Dict[str, Any]]) -> bool:
+        """
+        필요하면 인덱스 구축/갱신
+        
+        - 구축 전이거나 notion_index_rebuild_interval초가 지나면 전체 조회
+        - 마지막 동기화 후 notion_index_refresh_interval초가 지나면 증분 조회
+        
+        Returns:
+            인덱스를 신뢰할 수 있으면 True (조회 실패시 False)
+        """
+        with self._sync_lock:
+            now = time.monotonic()
+            try:
+                if self._built_at is None or now - self._built_at >= settings.notion_index_rebuild_interval:
+                    count = self._scan(query, None)
+                    print(f"🗂️ 노션 제목 인덱스 구축: 페이지 {count}개, 제목 {len(self._titles)}개")
+                elif now - self._synced_at >= settings.notion_index_refresh_interval:
+                    count = self._scan(query, self._cursor)
+                    if count:
+                        print(f"🗂️ 노션 제목 인덱스 증분 갱신: 페이지 {count}개")
+                return True
+            
+            except Exception as e:
+                print(f"⚠️ 노션 제목 인덱스 갱신 실패: {e}")
+                return self._built_at is not None and now - self._synced_at < settings.notion_index_refresh_interval
+    
+    def lookup(self, title: str) -> Optional[str]:
+        """제목으로 페이지 ID 조회 (인덱스에 없으면 None)"""
+        with self._lock:
+            page_id = self._titles.get(title)
+            if page_id:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return page_id
+    
+    def add(self, title: str, page_id: str) -> None:
+        """생성/업데이트한 페이지 반영"""
+        with self._lock:
+            self._added[page_id] = title
+            self._apply(self._titles, self._page_titles, self._title_page(page_id, title))
+    
+    def discard(self, page_id: str) -> None:
+        """더 이상 수정할 수 없는 페이지(삭제/보관) 제거"""
+        with self._lock:
+            self._added.pop(page_id, None)
+            self._apply(self._titles, self._page_titles, {"id": page_id, "archived": True})
+    
+    def stats(self) -> Dict[str, Any]:
+        """인덱스 통계"""
+        with self._lock:
+            now = time.monotonic()
+            return {
+                "size": len(self._titles),
+                "hits": self.hits,
+                "misses": self.misses,
+                "scans": self.scans,
+                "fallbacks": self.fallbacks,
+                "built_seconds_ago": None if self._built_at is None else round(now - self._built_at, 1),
+                "synced_seconds_ago": None if self._synced_at is None else round(now - self._synced_at, 1),
+                "last_edited_cursor": self._cursor
+            }
+
+# 프로세스 전역 인덱스 레지스트리 (데이터베이스별 1개)
+_indexes: Dict[str, NotionTitleIndex] = {}
+_indexes_lock = threading.Lock()
+
+def get_notion_index(database_id: Optional[str] = None) -> NotionTitleIndex:
+    """공유 노션 제목 인덱스 인스턴스 반환"""
+    database_id = database_id or settings.notion_database_id
+    
+    with _indexes_lock:
+        index = _indexes.get(database_id)
+        if index is None:
+            index = NotionTitleIndex(database_id)
+            _indexes[database_id] = index
+        return index
@@ -0,0 +1,291 @@
+# 📦 OpenAI Batch API 제출 모드
+"""
+대량 CSV 야간 처리를 위한 OpenAI Batch API 연동
+- Step 2 요청을 JSONL 파일 하나로 작성 → 배치 작업 1건으로 제출 → 완료까지 폴링 → 결과 JSONL 수집
+- OpenAIBatchBackend: 실제 OpenAI Files/Batches API 사용
+- LocalFileBatchBackend: 네트워크 없이 같은 흐름을 검증하는 로컬 파일 기반 대체 백엔드
+"""
+
+import json
+import os
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .config import settings
+
+CHAT_COMPLETIONS_ENDPOINT = "/v1/chat/completions"
+
+# 배치 작업 종료 상태
+TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+class BatchJobError(Exception):
+    """배치 작업 제출/대기/결과 수집 실패 (제출된 작업이면 batch_id 포함)"""
+    
+    def __init__(self, message: str, batch_id: Optional[str] = None):
+        super().__init__(message)
+        self.batch_id = batch_id
+
+def write_batch_requests(path: str, requests: List[Tuple[str, Dict[str, Any]]]) -> int:
+    """
+    (custom_id, Chat Completions 요청 본문) 목록을 Batch API 입력 JSONL로 저장
+    
+    Returns:
+        작성한 요청 수
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        for custom_id, body in requests:
+            line = {
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": CHAT_COMPLETIONS_ENDPOINT,
+                "body": body
+            }
+            f.write(json.dumps(line, ensure_ascii=False) + "\n")
+    return len(requests)
+
+def parse_batch_output(text: str) -> Dict[str, Optional[str]]:
+    """
+    Batch API 출력 JSONL 파싱
+    
+    Returns:
+        {custom_id: 응답 메시지 내용} (오류/거부/잘린 응답은 None)
+    """
+    contents: Dict[str, Optional[str]] = {}
+    
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        
+        record = json.loads(line)
+        custom_id = record.get('custom_id')
+        response = record.get('response') or {}
+        
+        content = None
+        if not record.get('error') and response.get('status_code') == 200:
+            choice = response['body']['choices'][0]
+            message = choice.get('message', {})
+            if choice.get('finish_reason') != 'length' and not message.get('refusal'):
+                content = message.get('content')
+        
+        contents[custom_id] = content
+    
+    return contents
+
+def parse_batch_usage(text: str) -> Dict[str, Dict[str, int]]:
+    """
+    Batch API 출력 JSONL에서 요청별 토큰 사용량 추출
+    
+    Returns:
+        {custom_id: usage(prompt_tokens/completion_tokens/total_tokens)} (usage가 없는 응답은 제외)
+    """
+    usage: Dict[str, Dict[str, int]] = {}
+    
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        
+        record = json.loads(line)
+        body = (record.get('response') or {}).get('body') or {}
+        if body.get('usage'):
+            usage[record.get('custom_id')] = body['usage']
+    
+    return usage
+
+class OpenAIBatchBackend:
+    """OpenAI Files + Batches API 백엔드"""
+    
+    name = "openai"
+    
+    def __init__(self, client):
+        """
+        Args:
+            client: openai.OpenAI 인스턴스
+        """
+        self.client = client
+    
+    def submit(self, input_path: str) -> str:
+        """입력 JSONL 업로드 후 배치 작업 생성, 작업 ID 반환"""
+        with open(input_path, 'rb') as f:
+            input_file = self.client.files.create(file=f, purpose="batch")
+        
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=CHAT_COMPLETIONS_ENDPOINT,
+            completion_window=settings.openai_batch_completion_window
+        )
+        return batch.id
+    
+    def status(self, batch_id: str) -> Dict[str, Any]:
+        """작업 상태 조회 (status, completed, failed, total)"""
+        batch = self.client.batches.retrieve(batch_id)
+        counts = batch.request_counts
+        return {
+            "status": batch.status,
+            "completed": counts.completed if counts else 0,
+            "failed": counts.failed if counts else 0,
+            "total": counts.total if counts else 0,
+            "output_file_id": batch.output_file_id
+        }
+    
+    def fetch_output(self, batch_id: str) -> str:
+        """완료된 작업의 출력 JSONL 텍스트"""
+        output_file_id = self.status(batch_id)["output_file_id"]
+        if not output_file_id:
+            return ""
+        return self.client.files.content(output_file_id).text
+    
+    def cancel(self, batch_id: str) -> None:
+        self.client.batches.cancel(batch_id)
+
+def first_candidate_responder(body: Dict[str, Any]) -> Dict[str, Any]:
+    """로컬 백엔드 기본 응답: 스키마의 첫 번째 후보를 선택 (오프라인 흐름 검증용)"""
+    schema = body["response_format"]["json_schema"]["schema"]
+    titles = [title for title in schema["properties"]["selected_title"]["enum"] if title]
+    if not titles:
+        return {"status": "no_match", "selected_title": None, "confidence": 0, "reason": "후보 없음"}
+    return {
+        "status": "match_found",
+        "selected_title": titles[0],
+        "confidence": 50,
+        "reason": "로컬 대체 백엔드 응답 (첫 번째 후보)"
+    }
+
+class LocalFileBatchBackend:
+    """
+    로컬 파일 기반 대체 백엔드
+    
+    입력 JSONL을 읽어 responder로 응답을 만들고 OpenAI 배치 출력과 같은 형식의
+    JSONL을 작업 폴더에 기록한다. 제출 즉시 완료 상태가 된다.
+    """
+    
+    name = "local"
+    
+    def __init__(self, work_dir: str,
+                 responder: Callable[[Dict[str, Any]], Dict[str, Any]] = first_candidate_responder):
+        """
+        Args:
+            work_dir: 출력 JSONL을 저장할 폴더
+            responder: 요청 본문 → 구조화 응답 객체
+        """
+        self.work_dir = work_dir
+        self.responder = responder
+        os.makedirs(work_dir, exist_ok=True)
+    
+    def _output_path(self, batch_id: str) -> str:
+        return os.path.join(self.work_dir, f"{batch_id}_output.jsonl")
+    
+    def submit(self, input_path: str) -> str:
+        batch_id = f"batch_local_{uuid.uuid4().hex[:12]}"
+        
+        with open(input_path, 'r', encoding='utf-8') as f:
+            lines = [json.loads(line) for line in f if line.strip()]
+        
+        with open(self._output_path(batch_id), 'w', encoding='utf-8') as out:
+            for line in lines:
+                content = json.dumps(self.responder(line["body"]), ensure_ascii=False)
+                record = {
+                    "id": f"batch_req_{uuid.uuid4().hex[:12]}",
+                    "custom_id": line["custom_id"],
+                    "response": {
+                        "status_code": 200,
+                        "body": {
+                            "choices": [{
+                                "index": 0,
+                                "message": {"role": "assistant", "content": content, "refusal": None},
+                                "finish_reason": "stop"
+                            }]
+                        }
+                    },
+                    "error": None
+                }
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        
+        return batch_id
+    
+    def status(self, batch_id: str) -> Dict[str, Any]:
+        with open(self._output_path(batch_id), 'r', encoding='utf-8') as f:
+            total = sum(1 for line in f if line.strip())
+        return {"status": "completed", "completed": total, "failed": 0, "total": total,
+                "output_file_id": batch_id}
+    
+    def fetch_output(self, batch_id: str) -> str:
+        with open(self._output_path(batch_id), 'r', encoding='utf-8') as f:
+            return f.read()
+    
+    def cancel(self, batch_id: str) -> None:
+        pass
+
+def run_batch_job(backend, input_path: str,
+                  poll_interval: Optional[float] = None,
+                  timeout: Optional[float] = None) -> Tuple[Dict[str, Optional[str]], Dict[str, Dict[str, int]]]:
+    """
+    배치 작업 제출 후 완료까지 폴링하고 결과 수집
+    
+    Args:
+        backend: OpenAIBatchBackend 또는 LocalFileBatchBackend
+        input_path: 입력 JSONL 경로
+        poll_interval: 상태 확인 간격 (초, 기본값: settings.openai_batch_poll_interval)
+        timeout: 최대 대기 시간 (초, 초과시 작업 취소 후 BatchJobError)
+    
+    Returns:
+        ({custom_id: 응답 메시지 내용 또는 None}, {custom_id: 토큰 사용량})
+    
+    Raises:
+        BatchJobError: 제출/상태 조회/결과 수집 실패 또는 대기 시간 초과
+            (제출 이후 실패면 batch_id 포함, 작업 ID는 입력 파일 옆 *_job.json에도 기록)
+    """
+    poll_interval = settings.openai_batch_poll_interval if poll_interval is None else poll_interval
+    timeout = settings.openai_batch_timeout if timeout is None else timeout
+    
+    try:
+        batch_id = backend.submit(input_path)
+    except Exception as e:
+        raise BatchJobError(f"배치 작업 제출 실패: {e}") from e
+    
+    print(f"📦 배치 작업 제출 완료: {batch_id} ({backend.name})")
+    _record_job(input_path, batch_id, backend.name)
+    
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            state = backend.status(batch_id)
+            print(f"⏳ 배치 작업 상태: {state['status']} ({state['completed']}/{state['total']}, 실패 {state['failed']})")
+            
+            if state['status'] in TERMINAL_STATUSES:
+                break
+            
+            if time.monotonic() >= deadline:
+                _cancel_job(backend, batch_id)
+                raise BatchJobError(f"배치 작업 대기 시간 초과: {batch_id}", batch_id)
+            
+            time.sleep(poll_interval)
+        
+        if state['status'] != 'completed':
+            # 만료/취소된 작업도 일부 결과가 있을 수 있으므로 가능한 만큼 수집
+            print(f"⚠️ 배치 작업 종료 상태: {state['status']}")
+        
+        output = backend.fetch_output(batch_id)
+        return parse_batch_output(output), parse_batch_usage(output)
+    
+    except BatchJobError:
+        raise
+    except Exception as e:
+        raise BatchJobError(f"배치 작업 처리 실패 ({batch_id}): {e}", batch_id) from e
+
+def _record_job(input_path: str, batch_id: str, backend_name: str) -> None:
+    """제출한 작업 ID를 입력 파일 옆에 기록 (실패시 같은 작업의 결과를 나중에 수집할 수 있도록)"""
+    job_path = os.path.splitext(input_path)[0] + "_job.json"
+    try:
+        with open(job_path, 'w', encoding='utf-8') as f:
+            json.dump({"batch_id": batch_id, "backend": backend_name,
+                       "input_path": input_path, "submitted_at": time.time()}, f, ensure_ascii=False)
+    except OSError as e:
+        print(f"⚠️ 배치 작업 ID 기록 실패: {e}")
+
+def _cancel_job(backend, batch_id: str) -> None:
+    """시간 초과된 작업 취소 (실패해도 무시)"""
+    try:
+        backend.cancel(batch_id)
+    except Exception as e:
+        print(f"⚠️ 배치 작업 취소 실패 ({batch_id}): {e}")
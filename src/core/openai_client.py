@@ -2,44 +2,147 @@
 """
 OpenAI Assistant API 래퍼 클래스
 - 애니메이션 매칭을 위한 Assistant 호출
+- chat 백엔드: Chat Completions 1회 호출 + JSON 스키마 구조화 출력 (스레드/폴링 없음)
+- 배치용 묶음 매칭: 여러 (제목, 후보 목록)을 한 번의 구조화 요청으로 처리
+- Batch API 모드: 전체 요청을 JSONL 배치 작업 1건으로 제출 (야간 대량 처리)
+- 호출 전 계정 한도(분당 요청 수/토큰 수) 확보: 한도를 넘는 요청은 429 대신 대기
+- 매칭마다 토큰 사용량/대기·실행 시간/폴링 횟수 계측 (LLMMatchResult.metrics)
 - 에러 핸들링 및 재시도 로직 포함
 - 기존 step2 로직을 클래스로 래핑
 """
 
 import openai
 import json
+import os
+import re
 import time
-from typing import List, Dict, Any, Optional
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
-from .models import LLMMatchResult, SearchCandidate
+from .models import LLMCallMetrics, LLMMatchResult, SearchCandidate
 from .config import settings
+from .retry import RetryPolicy, RetryableError, default_is_retryable
+from .rate_limit import get_openai_limiters
+from .llm_metrics import estimate_cost
+from .match_cache import LLMMatchCache
+from .local_matcher import local_match, shortlist_candidates
+from .catalog_index import compact_key
+from .openai_batch import BatchJobError, OpenAIBatchBackend, run_batch_job, write_batch_requests
 
-class OpenAIClient:
-    """OpenAI Assistant 클라이언트"""
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+MATCH_BACKENDS = ("assistant", "chat")
+
+# 분당 토큰 수 한도 계산용 추정치 (글자 2개 ≈ 토큰 1개, 토크나이저 없이 여유 있게 계산)
+CHARS_PER_TOKEN = 2
+
+class AssistantRunTimeout(TimeoutError):
+    """매칭 1건의 Assistant 대기 시간(openai_run_timeout) 소진 - 남은 시간이 없으므로 재시도하지 않음"""
+
+@lru_cache(maxsize=4)
+def load_system_prompt(path: str) -> str:
+    """시스템 프롬프트 파일 로드 (상대 경로는 프로젝트 루트 기준)"""
+    prompt_path = Path(path)
+    if not prompt_path.is_absolute():
+        prompt_path = PROJECT_ROOT / prompt_path
+    return prompt_path.read_text(encoding="utf-8")
+
+def schema_title(title: str) -> str:
+    """스키마 enum용 제목 (유니코드 NFC 정규화, 연속 공백 정리)"""
+    return re.sub(r'\s+', ' ', unicodedata.normalize('NFC', title)).strip()
+
+def build_match_schema(candidates: List[SearchCandidate]) -> Dict[str, Any]:
+    """
+    매칭 응답 JSON 스키마 (시스템 프롬프트의 응답 형식과 동일)
+    
+    selected_title은 후보 제목 또는 null로 제한하여 후보에 없는 제목을 반환하지 못하게 한다.
+    enum 값은 정규화한 제목이므로 응답 제목은 _find_candidate로 후보와 연결한다.
+    """
+    titles = list(dict.fromkeys(schema_title(candidate.title) for candidate in candidates))
+    return {
+        "type": "object",
+        "properties": {
+            "status": {"type": "string", "enum": ["match_found", "no_match"]},
+            "selected_title": {"type": ["string", "null"], "enum": [*titles, None]},
+            "confidence": {"type": "number"},
+            "reason": {"type": "string"}
+        },
+        "required": ["status", "selected_title", "confidence", "reason"],
+        "additionalProperties": False
+    }
+
+def estimate_request_tokens(body: Dict[str, Any]) -> int:
+    """요청 토큰 추정치 (메시지/응답 스키마 글자 수 기반, OpenAI 한도 계산처럼 max_tokens 포함)"""
+    prompt = json.dumps([body.get("messages"), body.get("response_format")], ensure_ascii=False)
+    return len(prompt) // CHARS_PER_TOKEN + int(body.get("max_tokens") or 0)
+
+class OpenAIClientBase:
+    """
+    OpenAI 클라이언트 공통 로직
+    - 동기/비동기 클라이언트가 공유하는 설정 검증, 프롬프트/스키마 구성, 응답 파싱, 매칭 캐시
+    - 네트워크 호출은 하위 클래스에서 구현
+    """
+    
+    # 로그 표시용 호출 방식 (비동기 클라이언트는 " (async)")
+    log_suffix = ""
     
     def __init__(self):
-        """클라이언트 초기화"""
-        self.client = openai.OpenAI(api_key=settings.openai_api_key)
+        """공통 설정 초기화"""
+        # assistant 백엔드인데 Assistant ID가 없으면 첫 매칭 전에 바로 실패
+        settings.validate_match_backend()
         self.assistant_id = settings.openai_assistant_id
         self.model = settings.openai_model
         self.temperature = settings.openai_temperature
         self.max_tokens = settings.openai_max_tokens
-        self.retry_count = 3
-        self.retry_delay = 2.0  # 초
+        self.backend = settings.openai_match_backend.lower()
+        # 호출 방식별 재시도 정책 (로그에서 어느 경로의 재시도인지 구분, 재시도 예산은 전역 공유)
+        self.retry_policies = {
+            "chat": RetryPolicy(f"Chat Completions 호출{self.log_suffix}", is_retryable=self._is_retryable),
+            "assistant": RetryPolicy(f"Assistant 호출{self.log_suffix}", is_retryable=self._is_retryable),
+            "packed": RetryPolicy(f"묶음 매칭{self.log_suffix}", is_retryable=self._is_retryable)
+        }
+        
+        # 계정 한도 버킷 (프로세스 전역 공유: requests / tokens)
+        self.rate_limiters = get_openai_limiters()
+        
+        # 매칭 결과 캐시 (같은 입력 + 같은 후보 목록이면 LLM 호출 생략)
+        self.match_cache = None
+        if settings.llm_match_cache_enabled:
+            try:
+                self.match_cache = LLMMatchCache()
+            except Exception as e:
+                print(f"⚠️ 매칭 캐시 초기화 실패 - 캐시 없이 진행: {e}")
     
     def _validate_setup(self) -> bool:
         """설정 유효성 검사"""
         if not settings.openai_api_key:
             print("❌ OpenAI API 키가 설정되지 않았습니다.")
             return False
-            
-        if not settings.openai_assistant_id:
+        
+        if self.backend not in MATCH_BACKENDS:
+            print(f"❌ 지원하지 않는 매칭 백엔드입니다: {self.backend} (assistant 또는 chat)")
+            return False
+        
+        if self.backend == "assistant" and not settings.openai_assistant_id:
             print("❌ OpenAI Assistant ID가 설정되지 않았습니다.")
             return False
-            
+        
         return True
     
+    def _is_retryable(self, error: Exception) -> bool:
+        """재시도 가능 오류 판단 (한도 초과, 연결 오류, 서버 오류)"""
+        if isinstance(error, AssistantRunTimeout):
+            return False
+        if isinstance(error, openai.RateLimitError):
+            # 크레딧 소진은 기다려도 해결되지 않음
+            return getattr(error, 'code', None) != 'insufficient_quota'
+        if isinstance(error, (openai.APIConnectionError, openai.InternalServerError)):
+            return True
+        return default_is_retryable(error)
+    
     def _format_candidates_for_prompt(self, candidates: List[SearchCandidate]) -> str:
         """후보 목록을 프롬프트용 텍스트로 포맷"""
         if not candidates:
@@ -51,17 +154,32 @@ class OpenAIClient:
         
         return "\n".join(formatted)
     
-    def find_best_match(self, user_input: str, candidates: List[SearchCandidate]) -> LLMMatchResult:
-        """
-        사용자 입력과 후보 목록을 기반으로 최적 매칭 찾기
+    def _find_candidate(self, selected_title: str,
+                        candidates: List[SearchCandidate]) -> Optional[SearchCandidate]:
+        """선택된 제목의 후보 반환 (정확히 일치하는 후보 우선, 없으면 정규화한 제목으로 비교)"""
+        for candidate in candidates:
+            if candidate.title == selected_title:
+                return candidate
         
-        Args:
-            user_input: 사용자가 입력한 애니메이션 제목
-            candidates: 라프텔 검색 결과 후보 목록
-            
-        Returns:
-            LLMMatchResult: LLM 매칭 결과
-        """
+        key = compact_key(selected_title)
+        for candidate in candidates:
+            if compact_key(candidate.title) == key:
+                return candidate
+        return None
+    
+    def _link_candidate(self, result: LLMMatchResult, candidates: List[SearchCandidate]) -> bool:
+        """선택된 후보의 원래 제목/라프텔 ID를 결과에 연결 (후보에 없는 제목이면 False)"""
+        candidate = self._find_candidate(result.selected_title, candidates)
+        if candidate is None:
+            return False
+        
+        result.selected_title = candidate.title
+        result.laftel_id = candidate.laftel_id
+        return True
+    
+    def _resolve_without_call(self, user_input: str,
+                              candidates: List[SearchCandidate]) -> Optional[LLMMatchResult]:
+        """API 호출 전 처리 (설정 오류/후보 없음/캐시·로컬 매칭으로 끝나면 결과 반환, 호출이 필요하면 None)"""
         if not self._validate_setup():
             return LLMMatchResult(
                 user_input=user_input,
@@ -70,124 +188,361 @@ class OpenAIClient:
                 error_message="OpenAI 설정이 올바르지 않습니다."
             )
         
-        try:
-            print(f"🎯 2단계: '{user_input}' LLM 매칭 시작")
-            print(f"📊 후보 제목 수: {len(candidates)}")
-            print("✅ OpenAI 클라이언트 설정 완료")
-            
-            if not candidates:
-                return LLMMatchResult(
-                    user_input=user_input,
-                    candidates_count=0,
-                    success=False,
-                    error_message="매칭할 후보가 없습니다."
-                )
-            
-            # 후보 목록 포맷
-            candidates_text = self._format_candidates_for_prompt(candidates)
-            
-            # Assistant 호출 메시지 구성
-            user_message = f"""사용자 입력: "{user_input}"
-
-후보 목록:
-{candidates_text}
-
-위 후보 목록에서 사용자 입력과 가장 유사한 애니메이션을 선택해주세요."""
-            
-            print(f"🤖 Assistant 호출 중... (ID: {self.assistant_id})")
-            print("⏳ Assistant 처리 중...")
-            
-            # 재시도 로직 포함 Assistant 호출
-            response_text = None
-            for attempt in range(self.retry_count):
-                try:
-                    # 스레드 생성
-                    thread = self.client.beta.threads.create()
-                    
-                    # 메시지 추가
-                    self.client.beta.threads.messages.create(
-                        thread_id=thread.id,
-                        role="user",
-                        content=user_message
-                    )
-                    
-                    # Assistant 실행
-                    run = self.client.beta.threads.runs.create(
-                        thread_id=thread.id,
-                        assistant_id=self.assistant_id
-                    )
-                    
-                    # 실행 완료 대기
-                    max_wait_time = 60  # 최대 60초 대기
-                    wait_time = 0
-                    while run.status in ['queued', 'in_progress', 'cancelling']:
-                        time.sleep(2)
-                        wait_time += 2
-                        run = self.client.beta.threads.runs.retrieve(
-                            thread_id=thread.id,
-                            run_id=run.id
-                        )
-                        
-                        if wait_time >= max_wait_time:
-                            raise TimeoutError("Assistant 응답 시간 초과")
-                    
-                    if run.status == 'completed':
-                        # 응답 메시지 가져오기
-                        messages = self.client.beta.threads.messages.list(
-                            thread_id=thread.id
-                        )
-                        
-                        # Assistant의 마지막 응답 추출
-                        for message in messages.data:
-                            if message.role == "assistant":
-                                response_text = message.content[0].text.value
-                                break
-                        
-                        print("✅ Assistant 응답 수신 완료")
-                        break
-                    else:
-                        error_msg = f"Assistant 실행 실패: {run.status}"
-                        if hasattr(run, 'last_error') and run.last_error:
-                            error_msg += f" - {run.last_error}"
-                        raise Exception(error_msg)
-                    
-                except Exception as e:
-                    print(f"⚠️ Assistant 호출 시도 {attempt + 1} 실패: {e}")
-                    if attempt < self.retry_count - 1:
-                        time.sleep(self.retry_delay)
-                        continue
-                    raise
-            
-            if not response_text:
-                return LLMMatchResult(
-                    user_input=user_input,
-                    candidates_count=len(candidates),
-                    success=False,
-                    error_message="Assistant 응답을 받지 못했습니다."
-                )
-            
-            # 응답 파싱
+        print(f"🎯 2단계: '{user_input}' LLM 매칭 시작")
+        print(f"📊 후보 제목 수: {len(candidates)}")
+        print("✅ OpenAI 클라이언트 설정 완료")
+        
+        if not candidates:
+            return LLMMatchResult(
+                user_input=user_input,
+                candidates_count=0,
+                success=False,
+                error_message="매칭할 후보가 없습니다."
+            )
+        
+        return self._match_without_llm(user_input, candidates)
+    
+    def _finish_match(self, response_text: Optional[str], user_input: str,
+                      candidates: List[SearchCandidate],
+                      prompt_candidates: List[SearchCandidate]) -> LLMMatchResult:
+        """응답 파싱 → 라프텔 ID 연결 → 캐시 저장"""
+        if not response_text:
+            return LLMMatchResult(
+                user_input=user_input,
+                candidates_count=len(candidates),
+                success=False,
+                error_message="Assistant 응답을 받지 못했습니다."
+            )
+        
+        # 응답 파싱 (번호 기반 응답 파싱은 프롬프트에 보낸 목록 기준)
+        if self.backend == "chat":
+            result = self._parse_structured_response(response_text, user_input, prompt_candidates)
+        else:
             result = self._parse_assistant_response(
-                response_text, user_input, candidates
+                response_text, user_input, prompt_candidates
             )
-            
-            if result.success and result.selected_title:
-                print(f"✅ 매칭 성공: {result.selected_title} (신뢰도: {result.confidence_score}%)")
+        
+        # 선택된 후보의 라프텔 ID 연결 (Step 3에서 재검색 없이 사용)
+        if result.success and result.selected_title:
+            self._link_candidate(result, candidates)
+        
+        if result.success and result.selected_title:
+            self._store_match(result, candidates)
+            print(f"✅ 매칭 성공: {result.selected_title} (신뢰도: {result.confidence_score}%)")
+        else:
+            print(f"❌ 매칭 실패: {result.error_message}")
+        
+        return result
+    
+    def _call_failure(self, user_input: str, candidates: List[SearchCandidate],
+                      error: Exception) -> LLMMatchResult:
+        """호출 예외를 실패 결과로 변환"""
+        error_msg = f"OpenAI Assistant 호출 실패: {str(error)}"
+        print(f"❌ {error_msg}")
+        
+        return LLMMatchResult(
+            user_input=user_input,
+            candidates_count=len(candidates),
+            success=False,
+            error_message=error_msg
+        )
+    
+    def _attach_metrics(self, result: LLMMatchResult, metrics: LLMCallMetrics) -> LLMMatchResult:
+        """예상 요금을 계산해 계측값을 결과에 기록"""
+        metrics.estimated_cost_usd = estimate_cost(metrics)
+        result.metrics = metrics
+        return result
+    
+    def _merge_leftover_metrics(self, result: LLMMatchResult,
+                                leftover: Optional[LLMCallMetrics]) -> None:
+        """묶음 호출에서 쓴 몫을 개별 매칭 결과 계측에 합산"""
+        if leftover is None:
+            return
+        if result.metrics is None:
+            result.metrics = leftover
+        else:
+            result.metrics.merge(leftover)
+    
+    def _pending_for_pack(self, items: List[Tuple[str, List[SearchCandidate]]],
+                          results: List[Optional[LLMMatchResult]]) -> List[List[int]]:
+        """캐시/로컬 매칭으로 해결한 항목은 results에 기록하고, 남은 항목 번호를 openai_pack_size개씩 묶어 반환"""
+        pending = []
+        for position, (user_input, candidates) in enumerate(items):
+            resolved = self._match_without_llm(user_input, candidates) if candidates else None
+            if resolved or not candidates:
+                results[position] = resolved
             else:
-                print(f"❌ 매칭 실패: {result.error_message}")
-            
+                pending.append(position)
+        
+        pack_size = max(1, settings.openai_pack_size)
+        return [pending[start:start + pack_size] for start in range(0, len(pending), pack_size)]
+    
+    def _apply_packed(self, chunk: List[int], packed: Dict[str, Any],
+                      items: List[Tuple[str, List[SearchCandidate]]],
+                      results: List[Optional[LLMMatchResult]],
+                      metrics: LLMCallMetrics) -> Dict[int, LLMCallMetrics]:
+        """
+        묶음 응답을 항목별로 검증해 results에 기록 (누락/검증 실패 항목은 None으로 남김)
+        
+        Returns:
+            {항목 번호: 묶음 호출 계측 몫} (개별 매칭으로 넘어가는 항목의 몫, 개별 결과에 합산)
+        """
+        metrics.estimated_cost_usd = estimate_cost(metrics)
+        shares = metrics.split(len(chunk))
+        leftover = {}
+        
+        for number, position in enumerate(chunk, 1):
+            user_input, candidates = items[position]
+            item_data = packed.get(f"item_{number}")
+            result = self._validate_packed_item(item_data, user_input, candidates)
+            if result:
+                result.metrics = shares[number - 1]
+                results[position] = result
+            else:
+                leftover[position] = shares[number - 1]
+        
+        return leftover
+    
+    def _validate_packed_item(self, item_data: Optional[Dict[str, Any]], user_input: str,
+                              candidates: List[SearchCandidate]) -> Optional[LLMMatchResult]:
+        """묶음 응답 항목 검증 (누락되었거나 후보에 없는 제목을 고르면 None)"""
+        if not isinstance(item_data, dict):
+            return None
+        
+        result = self._result_from_structured(item_data, user_input, candidates)
+        if not result.success:
+            print(f"❌ 매칭 실패: {user_input} - {result.error_message}")
             return result
-            
+        
+        if not self._link_candidate(result, candidates):
+            print(f"⚠️ 후보에 없는 제목 선택 - 개별 매칭으로 재시도: {user_input}")
+            return None
+        
+        self._store_match(result, candidates)
+        print(f"✅ 매칭 성공: {user_input} → {result.selected_title} (신뢰도: {result.confidence_score}%)")
+        return result
+    
+    def build_packed_request(self, group: List[Tuple[str, List[SearchCandidate]]]) -> Dict[str, Any]:
+        """여러 항목을 한 번에 매칭하는 Chat Completions 요청 본문 (응답: {item_N: 매칭 결과})"""
+        sections = []
+        for number, (user_input, candidates) in enumerate(group, 1):
+            sections.append(f"[item_{number}]\n{self._build_user_message(user_input, candidates, instruction=False)}")
+        
+        user_message = (
+            "아래 각 항목(item_N)마다 사용자 입력과 가장 유사한 애니메이션을 해당 항목의 후보 목록에서 "
+            "독립적으로 선택해주세요. 다른 항목의 후보를 선택하면 안 됩니다.\n\n"
+            + "\n\n".join(sections)
+        )
+        
+        schema = {
+            "type": "object",
+            "properties": {
+                f"item_{number}": build_match_schema(candidates)
+                for number, (_, candidates) in enumerate(group, 1)
+            },
+            "required": [f"item_{number}" for number in range(1, len(group) + 1)],
+            "additionalProperties": False
+        }
+        
+        return {
+            "model": self.model,
+            "temperature": self.temperature,
+            "max_tokens": max(self.max_tokens, settings.openai_pack_tokens_per_item * len(group)),
+            "messages": [
+                {"role": "system", "content": load_system_prompt(settings.openai_system_prompt_path)},
+                {"role": "user", "content": user_message}
+            ],
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {"name": "anime_match_batch", "strict": True, "schema": schema}
+            }
+        }
+    
+    def _match_without_llm(self, user_input: str,
+                           candidates: List[SearchCandidate]) -> Optional[LLMMatchResult]:
+        """매칭 캐시 → 로컬 사전 매칭 순서로 LLM 없이 해결 시도"""
+        cached = self._get_cached_match(user_input, candidates)
+        if cached:
+            print(f"💾 매칭 캐시 적중: {cached.selected_title} (신뢰도: {cached.confidence_score}%)")
+            cached.metrics = LLMCallMetrics(source="cache", estimated_cost_usd=0.0)
+            return cached
+        
+        # 정규화 제목/시즌이 확실히 일치하면 LLM 호출 생략
+        if settings.local_match_enabled:
+            local_result = local_match(user_input, candidates)
+            if local_result:
+                print(f"✅ 로컬 매칭 성공: {local_result.selected_title} (신뢰도: {local_result.confidence_score}%)")
+                local_result.metrics = LLMCallMetrics(source="local", estimated_cost_usd=0.0)
+                return local_result
+        
+        return None
+    
+    def _prompt_candidates(self, user_input: str, candidates: List[SearchCandidate]) -> List[SearchCandidate]:
+        """LLM에 보낼 후보 목록 (유사도 기반 가변 top-k, 비활성화시 전체)"""
+        if not settings.llm_candidate_prerank_enabled:
+            return candidates
+        
+        shortlisted = shortlist_candidates(user_input, candidates)
+        if len(shortlisted) < len(candidates):
+            print(f"✂️ 후보 축소: {len(candidates)}개 → {len(shortlisted)}개")
+        return shortlisted
+    
+    def _build_user_message(self, user_input: str, candidates: List[SearchCandidate],
+                            instruction: bool = True) -> str:
+        """매칭 요청 메시지 구성"""
+        message = f"""사용자 입력: "{user_input}"
+
+후보 목록:
+{self._format_candidates_for_prompt(candidates)}"""
+        
+        if instruction:
+            message += "\n\n위 후보 목록에서 사용자 입력과 가장 유사한 애니메이션을 선택해주세요."
+        return message
+    
+    def _get_cached_match(self, user_input: str,
+                          candidates: List[SearchCandidate]) -> Optional[LLMMatchResult]:
+        """캐시된 매칭 결과 조회 (캐시 오류는 미스로 처리)"""
+        if not self.match_cache:
+            return None
+        
+        try:
+            return self.match_cache.get(user_input, candidates)
         except Exception as e:
-            error_msg = f"OpenAI Assistant 호출 실패: {str(e)}"
-            print(f"❌ {error_msg}")
-            
+            print(f"⚠️ 매칭 캐시 조회 실패: {e}")
+            return None
+    
+    def _store_match(self, result: LLMMatchResult, candidates: List[SearchCandidate]) -> None:
+        """매칭 결과 캐시 저장 (실패해도 무시)"""
+        if not self.match_cache:
+            return
+        
+        try:
+            self.match_cache.set(result, [candidate.title for candidate in candidates])
+        except Exception as e:
+            print(f"⚠️ 매칭 캐시 저장 실패: {e}")
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """매칭 캐시 통계"""
+        return {"match_cache": self.match_cache.stats() if self.match_cache else None}
+    
+    def rate_limit_stats(self) -> Dict[str, Any]:
+        """계정 한도 버킷 대기 지표 (requests / tokens)"""
+        return {name: bucket.stats() for name, bucket in self.rate_limiters.items()}
+    
+    def _assistant_request_body(self, user_message: str) -> Dict[str, Any]:
+        """Assistant 실행의 한도 계산용 요청 정보 (지시문은 서버에 있으므로 사용자 메시지 기준)"""
+        return {
+            "messages": [{"role": "user", "content": user_message}],
+            "max_tokens": self.max_tokens
+        }
+    
+    def _assistant_run_error(self, run) -> Exception:
+        """완료되지 않은 실행의 오류 (한도 초과/서버 오류/만료는 일시적인 실패로 보고 재시도)"""
+        error_msg = f"Assistant 실행 실패: {run.status}"
+        last_error = getattr(run, 'last_error', None)
+        if last_error:
+            error_msg += f" - {last_error}"
+        
+        if run.status == 'expired' or (last_error and last_error.code in ('rate_limit_exceeded', 'server_error')):
+            return RetryableError(error_msg)
+        return Exception(error_msg)
+    
+    def _observe_run(self, run, metrics: LLMCallMetrics, started: float,
+                     queued_until: Optional[float]) -> Optional[float]:
+        """
+        조회한 실행 상태 기록 (queued 상태로 머문 시간, 종료시 토큰 사용량)
+        
+        Returns:
+            실행이 queued 상태를 벗어난 시점 (아직 queued면 None)
+        """
+        if queued_until is None and run.status != 'queued':
+            queued_until = time.monotonic()
+            metrics.server_queue_seconds += queued_until - started
+        
+        if run.status not in ('queued', 'in_progress', 'cancelling'):
+            metrics.add_usage(getattr(run, 'usage', None))
+        return queued_until
+    
+    def _assistant_reply(self, messages) -> Optional[str]:
+        """이번 실행이 생성한 메시지 목록에서 Assistant의 마지막 응답 추출"""
+        for message in messages.data:
+            if message.role == "assistant":
+                return message.content[0].text.value
+        return None
+    
+    def _check_deadline(self, deadline: float) -> None:
+        """재시도 전에 이미 대기 시간을 다 썼으면 새 실행을 만들지 않고 실패"""
+        if time.monotonic() >= deadline:
+            raise AssistantRunTimeout("Assistant 응답 시간 초과 (재시도할 시간 없음)")
+    
+    def _next_poll_interval(self, interval: float) -> float:
+        """다음 폴링 간격 (openai_poll_backoff배씩 늘려 openai_poll_max_interval초까지)"""
+        return min(interval * settings.openai_poll_backoff, settings.openai_poll_max_interval)
+    
+    def build_chat_request(self, user_input: str, candidates: List[SearchCandidate]) -> Dict[str, Any]:
+        """단건 매칭 Chat Completions 요청 본문 (chat 백엔드 / Batch API 공용)"""
+        return {
+            "model": self.model,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "messages": [
+                {"role": "system", "content": load_system_prompt(settings.openai_system_prompt_path)},
+                {"role": "user", "content": self._build_user_message(user_input, candidates)}
+            ],
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "anime_match",
+                    "strict": True,
+                    "schema": build_match_schema(candidates)
+                }
+            }
+        }
+    
+    def _completion_content(self, response) -> Optional[str]:
+        """Chat Completions 응답 본문 (거부/잘린 응답은 예외)"""
+        choice = response.choices[0]
+        if getattr(choice.message, 'refusal', None):
+            raise Exception(f"모델이 응답을 거부했습니다: {choice.message.refusal}")
+        if choice.finish_reason == 'length':
+            raise Exception("응답이 max_tokens에서 잘렸습니다.")
+        return choice.message.content
+    
+    def _parse_structured_response(self, response_text: str, user_input: str,
+                                   candidates: List[SearchCandidate]) -> LLMMatchResult:
+        """구조화 출력(status/selected_title/confidence/reason) 응답 파싱"""
+        try:
+            response_data = json.loads(response_text)
+        except json.JSONDecodeError:
+            # 스키마를 벗어난 응답은 기존 텍스트 파서로 처리
+            return self._parse_assistant_response(response_text, user_input, candidates)
+        
+        return self._result_from_structured(response_data, user_input, candidates)
+    
+    def _result_from_structured(self, response_data: Dict[str, Any], user_input: str,
+                                candidates: List[SearchCandidate]) -> LLMMatchResult:
+        """구조화 응답 객체를 LLMMatchResult로 변환 (no_match는 실패 결과)"""
+        selected_title = response_data.get('selected_title')
+        reason = response_data.get('reason', '')
+        
+        if response_data.get('status') != 'match_found' or not selected_title:
             return LLMMatchResult(
                 user_input=user_input,
                 candidates_count=len(candidates),
+                confidence_score=0.0,
+                reasoning=reason,
                 success=False,
-                error_message=error_msg
+                error_message=f"매칭 없음: {reason}"
             )
+        
+        return LLMMatchResult(
+            user_input=user_input,
+            candidates_count=len(candidates),
+            selected_title=selected_title,
+            confidence_score=float(response_data.get('confidence', 0)),
+            reasoning=reason,
+            success=True
+        )
     
     def _parse_assistant_response(self, response_text: str, user_input: str, 
                                 candidates: List[SearchCandidate]) -> LLMMatchResult:
@@ -216,7 +571,7 @@ class OpenAIClient:
                             reasoning=reasoning,
                             success=True
                         )
-                        
+                
                 except (json.JSONDecodeError, KeyError, ValueError) as e:
                     print(f"⚠️ JSON 파싱 실패: {e}")
             
@@ -256,7 +611,7 @@ class OpenAIClient:
                 success=False,
                 error_message=f"Assistant 응답을 파싱할 수 없습니다: {response_text[:100]}..."
             )
-            
+        
         except Exception as e:
             return LLMMatchResult(
                 user_input=user_input,
@@ -264,3 +619,285 @@ class OpenAIClient:
                 success=False,
                 error_message=f"응답 파싱 중 오류: {str(e)}"
             )
+
+class OpenAIClient(OpenAIClientBase):
+    """OpenAI Assistant 클라이언트"""
+    
+    def __init__(self):
+        """클라이언트 초기화"""
+        super().__init__()
+        # SDK 내장 재시도는 끄고 공통 재시도 정책 하나로 관리 (재시도 중첩 방지)
+        self.client = openai.OpenAI(api_key=settings.openai_api_key, max_retries=0)
+    
+    def find_best_match(self, user_input: str, candidates: List[SearchCandidate]) -> LLMMatchResult:
+        """
+        사용자 입력과 후보 목록을 기반으로 최적 매칭 찾기
+        
+        Args:
+            user_input: 사용자가 입력한 애니메이션 제목
+            candidates: 라프텔 검색 결과 후보 목록
+        
+        Returns:
+            LLMMatchResult: LLM 매칭 결과
+        """
+        metrics = LLMCallMetrics(backend=self.backend)
+        
+        try:
+            resolved = self._resolve_without_call(user_input, candidates)
+            if resolved:
+                return resolved
+            
+            # 프롬프트에는 유사도 상위 후보만 전달 (번호 기반 응답 파싱도 같은 목록 기준)
+            prompt_candidates = self._prompt_candidates(user_input, candidates)
+            
+            if self.backend == "chat":
+                print(f"🤖 Chat Completions 호출 중... (모델: {self.model})")
+                
+                # 재시도 정책 적용 단일 호출 (스레드/폴링 없음)
+                response_text = self.retry_policies["chat"].call(
+                    self._run_chat_completion, user_input, prompt_candidates, metrics
+                )
+            else:
+                print(f"🤖 Assistant 호출 중... (ID: {self.assistant_id})")
+                print("⏳ Assistant 처리 중...")
+                
+                # 재시도 정책 적용 Assistant 호출 (대기 시간 한도는 재시도를 포함한 매칭 1건 전체에 적용)
+                user_message = self._build_user_message(user_input, prompt_candidates)
+                deadline = time.monotonic() + settings.openai_run_timeout
+                response_text = self.retry_policies["assistant"].call(
+                    self._run_assistant, user_message, metrics, deadline
+                )
+            
+            result = self._finish_match(response_text, user_input, candidates, prompt_candidates)
+        
+        except Exception as e:
+            result = self._call_failure(user_input, candidates, e)
+        
+        return self._attach_metrics(result, metrics)
+    
+    def find_best_matches(self, items: List[Tuple[str, List[SearchCandidate]]]) -> List[LLMMatchResult]:
+        """
+        여러 제목을 묶어서 매칭 (배치 처리용)
+        
+        캐시/로컬 매칭으로 해결되지 않은 항목을 openai_pack_size개씩 묶어
+        Chat Completions 구조화 요청 한 번으로 처리한다. 각 선택은 해당 항목의
+        후보 목록으로 검증하며, 누락/검증 실패/요청 실패 항목은 find_best_match로 개별 처리한다.
+        
+        Args:
+            items: (사용자 입력, 후보 목록) 목록
+        
+        Returns:
+            items와 같은 순서의 LLMMatchResult 목록
+        """
+        results: List[Optional[LLMMatchResult]] = [None] * len(items)
+        
+        if not settings.openai_api_key:
+            return [self.find_best_match(user_input, candidates) for user_input, candidates in items]
+        
+        leftover: Dict[int, LLMCallMetrics] = {}
+        for chunk in self._pending_for_pack(items, results):
+            print(f"🤖 묶음 매칭 호출 중... ({len(chunk)}개 제목, 모델: {self.model})")
+            metrics = LLMCallMetrics(source="packed", backend="chat")
+            
+            try:
+                packed = self.retry_policies["packed"].call(
+                    self._run_packed_completion,
+                    [(items[position][0], self._prompt_candidates(*items[position])) for position in chunk],
+                    metrics
+                )
+            except Exception as e:
+                print(f"⚠️ 묶음 매칭 실패 - 개별 매칭으로 진행: {e}")
+                packed = {}
+            
+            leftover.update(self._apply_packed(chunk, packed, items, results, metrics))
+        
+        # 묶음에서 해결하지 못한 항목은 기존 단건 경로로 처리 (묶음 호출 몫은 계측에 합산)
+        for position, (user_input, candidates) in enumerate(items):
+            if results[position] is None:
+                results[position] = self.find_best_match(user_input, candidates)
+                self._merge_leftover_metrics(results[position], leftover.get(position))
+        
+        return results
+    
+    def find_best_matches_via_batch(self, items: List[Tuple[str, List[SearchCandidate]]],
+                                    work_dir: str, backend=None) -> List[Optional[LLMMatchResult]]:
+        """
+        OpenAI Batch API로 여러 제목 매칭 (완료까지 대기)
+        
+        캐시/로컬 매칭으로 해결되지 않은 항목의 Chat Completions 요청을 JSONL로 작성해
+        배치 작업 1건으로 제출하고, 결과를 단건 매칭과 같은 방식으로 파싱/검증한다.
+        작업 제출/대기/결과 수집이 실패하면 해당 항목을 find_best_matches로 처리한다.
+        
+        Args:
+            items: (사용자 입력, 후보 목록) 목록
+            work_dir: 입력/출력 JSONL을 저장할 폴더
+            backend: 배치 백엔드 (None이면 OpenAIBatchBackend)
+        
+        Returns:
+            items와 같은 순서의 결과 목록 (응답 없음/검증 실패 항목은 None → 호출측에서 개별 처리)
+        """
+        results: List[Optional[LLMMatchResult]] = [None] * len(items)
+        
+        requests = []
+        for position, (user_input, candidates) in enumerate(items):
+            if not candidates:
+                continue
+            resolved = self._match_without_llm(user_input, candidates)
+            if resolved:
+                results[position] = resolved
+            else:
+                prompt_candidates = self._prompt_candidates(user_input, candidates)
+                requests.append((f"item-{position}", self.build_chat_request(user_input, prompt_candidates)))
+        
+        if not requests:
+            return results
+        
+        os.makedirs(work_dir, exist_ok=True)
+        input_path = os.path.join(work_dir, "llm_batch_input.jsonl")
+        write_batch_requests(input_path, requests)
+        print(f"📝 배치 입력 작성 완료: {input_path} ({len(requests)}개 요청)")
+        
+        try:
+            contents, usage = run_batch_job(backend or OpenAIBatchBackend(self.client), input_path)
+        except BatchJobError as e:
+            # 이미 Step 1이 끝난 상태이므로 배치 전체를 실패시키지 않고 묶음 매칭으로 대체
+            print(f"⚠️ Batch API 매칭 실패 - 묶음 매칭으로 진행 (작업 ID: {e.batch_id or '미제출'}): {e}")
+            pending = [int(custom_id.split("-", 1)[1]) for custom_id, _ in requests]
+            for position, result in zip(pending, self.find_best_matches([items[position] for position in pending])):
+                results[position] = result
+            return results
+        
+        for custom_id, _ in requests:
+            position = int(custom_id.split("-", 1)[1])
+            user_input, candidates = items[position]
+            content = contents.get(custom_id)
+            if not content:
+                print(f"⚠️ 배치 응답 없음 - 개별 매칭으로 진행: {user_input}")
+                continue
+            
+            metrics = LLMCallMetrics(source="batch_api", backend="chat")
+            metrics.add_usage(usage.get(custom_id))
+            
+            result = self._parse_structured_response(content, user_input, candidates)
+            if result.success and not self._link_candidate(result, candidates):
+                print(f"⚠️ 후보에 없는 제목 선택 - 개별 매칭으로 진행: {user_input}")
+                continue
+            
+            if result.success:
+                self._store_match(result, candidates)
+            results[position] = self._attach_metrics(result, metrics)
+        
+        return results
+    
+    def _acquire_quota(self, body: Dict[str, Any], metrics: LLMCallMetrics) -> float:
+        """요청 전 계정 한도 확보 (분당 요청 수/토큰 수를 넘으면 429 대신 대기), 대기한 시간 반환"""
+        waited = self.rate_limiters["requests"].acquire()
+        waited += self.rate_limiters["tokens"].acquire(estimate_request_tokens(body))
+        if waited > 0:
+            print(f"🚦 OpenAI 한도 대기: {waited:.2f}초")
+        
+        metrics.queue_seconds += waited
+        metrics.api_calls += 1
+        return waited
+    
+    def _create_completion(self, body: Dict[str, Any], metrics: LLMCallMetrics) -> Optional[str]:
+        """한도 확보 후 Chat Completions 호출, 응답 본문 반환 (실행 시간/토큰 사용량 기록)"""
+        self._acquire_quota(body, metrics)
+        
+        started = time.monotonic()
+        try:
+            response = self.client.chat.completions.create(**body)
+        finally:
+            metrics.run_seconds += time.monotonic() - started
+        
+        metrics.add_usage(getattr(response, 'usage', None))
+        return self._completion_content(response)
+    
+    def _run_packed_completion(self, group: List[Tuple[str, List[SearchCandidate]]],
+                               metrics: LLMCallMetrics) -> Dict[str, Any]:
+        """여러 항목을 한 번의 구조화 요청으로 매칭하고 {item_N: 응답} 반환 (1회 시도)"""
+        return json.loads(self._create_completion(self.build_packed_request(group), metrics))
+    
+    def _run_assistant(self, user_message: str, metrics: LLMCallMetrics, deadline: float) -> Optional[str]:
+        """스레드 생성 + Assistant 실행 후 응답 텍스트 반환 (1회 시도, 사용한 스레드는 삭제)"""
+        self._acquire_quota(self._assistant_request_body(user_message), metrics)
+        self._check_deadline(deadline)
+        
+        # 스레드 생성/메시지 추가/실행을 한 번의 호출로 처리
+        started = time.monotonic()
+        run = self.client.beta.threads.create_and_run(
+            assistant_id=self.assistant_id,
+            thread={"messages": [{"role": "user", "content": user_message}]}
+        )
+        
+        try:
+            run = self._wait_for_run(run, metrics, started, deadline)
+            
+            if run.status != 'completed':
+                raise self._assistant_run_error(run)
+            
+            # 이번 실행이 생성한 응답 메시지만 조회
+            messages = self.client.beta.threads.messages.list(
+                thread_id=run.thread_id,
+                run_id=run.id
+            )
+            
+            print("✅ Assistant 응답 수신 완료")
+            return self._assistant_reply(messages)
+        
+        finally:
+            metrics.run_seconds += time.monotonic() - started
+            self._delete_thread(run.thread_id)
+    
+    def _wait_for_run(self, run, metrics: LLMCallMetrics, started: float, deadline: float):
+        """
+        실행 완료 대기 (적응형 폴링)
+        
+        openai_poll_initial_interval초부터 openai_poll_backoff배씩 늘려 openai_poll_max_interval초까지 폴링한다.
+        deadline(매칭 1건 기준 monotonic 시각)이 지나면 실행을 취소하고 AssistantRunTimeout을 발생시킨다.
+        """
+        interval = settings.openai_poll_initial_interval
+        queued_until = self._observe_run(run, metrics, started, None)
+        
+        while run.status in ['queued', 'in_progress', 'cancelling']:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._cancel_run(run)
+                raise AssistantRunTimeout("Assistant 응답 시간 초과")
+            
+            time.sleep(min(interval, remaining))
+            interval = self._next_poll_interval(interval)
+            
+            run = self.client.beta.threads.runs.retrieve(
+                thread_id=run.thread_id,
+                run_id=run.id
+            )
+            metrics.poll_count += 1
+            queued_until = self._observe_run(run, metrics, started, queued_until)
+        
+        return run
+    
+    def _cancel_run(self, run) -> None:
+        """시간 초과된 실행 취소 (실패해도 무시)"""
+        try:
+            self.client.beta.threads.runs.cancel(thread_id=run.thread_id, run_id=run.id)
+        except Exception as e:
+            print(f"⚠️ Assistant 실행 취소 실패: {e}")
+    
+    def _delete_thread(self, thread_id: str) -> None:
+        """사용이 끝난 스레드 삭제 (계정에 스레드가 쌓이지 않도록, 실패해도 무시)"""
+        if not settings.openai_delete_threads:
+            return
+        
+        try:
+            self.client.beta.threads.delete(thread_id)
+        except Exception as e:
+            print(f"⚠️ 스레드 삭제 실패: {e}")
+    
+    def _run_chat_completion(self, user_input: str, candidates: List[SearchCandidate],
+                             metrics: LLMCallMetrics) -> Optional[str]:
+        """Chat Completions 구조화 출력 호출 및 응답 JSON 텍스트 반환 (1회 시도)"""
+        content = self._create_completion(self.build_chat_request(user_input, candidates), metrics)
+        
+        print("✅ Chat Completions 응답 수신 완료")
+        return content
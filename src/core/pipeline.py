@@ -7,16 +7,19 @@
 """
 
 import time
-from typing import Optional, Dict, Any
+import asyncio
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime
 
 from .models import (
     ProcessResult, ProcessStatus, SearchResult, 
-    LLMMatchResult, MetadataResult, NotionResult,
+    LLMMatchResult, MetadataResult, NotionResult, AnimeMetadata,
     create_error_result, create_success_result
 )
 from .laftel_client import LaftelClient
+from .async_laftel_client import AsyncLaftelClient, HTTPX_AVAILABLE
 from .openai_client import OpenAIClient
+from .async_openai_client import AsyncOpenAIClient
 from .notion_client import NotionClient
 from .config import settings
 
@@ -31,7 +34,11 @@ class AnimePipeline:
             config_override: 설정 오버라이드 (테스트용)
         """
         self.laftel = LaftelClient()
+        # 비동기 라프텔 클라이언트 (httpx 설치된 API 서버 환경에서만 사용)
+        self.async_laftel = AsyncLaftelClient() if HTTPX_AVAILABLE else None
         self.openai = OpenAIClient()
+        # 비동기 OpenAI 클라이언트 (process_single의 Step 2, 동기 클라이언트와 계정 한도 공유)
+        self.async_openai = AsyncOpenAIClient()
         self.notion = NotionClient()
         
         # 설정 오버라이드 적용 (주로 테스트에서 사용)
@@ -39,169 +46,242 @@ class AnimePipeline:
             # TODO: 필요시 설정 오버라이드 로직 구현
             pass
     
+    def close(self) -> None:
+        """클라이언트 세션/스레드풀 정리 (비동기 클라이언트의 공유 커넥션은 앱 종료시 별도 정리)"""
+        self.laftel.close()
+        self.notion.close()
+        self.openai.client.close()
+    
     def process_single_sync(self, title: str) -> ProcessResult:
         """
         단일 애니메이션 처리 (배치/API 공통 로직)
         
         Args:
             title: 처리할 애니메이션 제목
-            
+        
         Returns:
             ProcessResult: 처리 결과
         """
         start_time = time.time()
-        
-        print(f"\n{'='*80}")
-        print(f"🎯 애니메이션 처리 시작: {title}")
-        print(f"{'='*80}")
+        self._print_start(title)
         
         try:
             # Step 1: 라프텔 검색
             print(f"\n🔍 Step 1: 검색 후보 수집")
             step1_start = time.time()
-            
             search_result = self.laftel.search_anime(title)
             step1_duration = time.time() - step1_start
             
-            if not search_result.success:
-                return self._create_failure_result(
-                    title, "Step 1 실패", search_result.error_message, 0,
-                    search_result=search_result
-                )
-            
-            if not search_result.candidates:
-                # 검색 실패시 빈 노션 페이지만 생성
-                print("⚠️ 검색 결과 없음 - 빈 노션 페이지 생성")
-                notion_result = self.notion.create_or_update_page(title, None)
-                
-                result = ProcessResult(
-                    title=title,
-                    success=notion_result.success,
-                    status=ProcessStatus.PARTIAL_SUCCESS if notion_result.success else ProcessStatus.FAILED,
-                    notion_url=notion_result.page_url if notion_result.success else None,
-                    error="검색 결과가 없어 빈 페이지만 생성됨",
-                    search_result=search_result,
-                    notion_result=notion_result,
-                    processing_time=time.time() - start_time,
-                    steps_completed=1 if notion_result.success else 0
-                )
-                
-                result.add_step_result("search", True, step1_duration)
-                if notion_result.success:
-                    result.add_step_result("notion_fallback", True)
-                    print("✅ 빈 노션 페이지 생성 완료")
-                
-                return result
+            if not search_result.success or not search_result.candidates:
+                notion_result = None
+                if search_result.success:
+                    # 검색 실패시 빈 노션 페이지만 생성
+                    print("⚠️ 검색 결과 없음 - 빈 노션 페이지 생성")
+                    notion_result = self.notion.create_or_update_page(title, None)
+                return self._search_stop_result(title, search_result, notion_result, step1_duration, start_time)
             
             print(f"✅ 1단계 완료: {len(search_result.candidates)}개 후보 수집 성공")
             
             # Step 2: AI 매칭
             print(f"\n🤖 Step 2: LLM 매칭")
             step2_start = time.time()
-            
-            llm_result = self.openai.find_best_match(title, search_result.candidates)
+            llm_result = self._apply_match_fallback(
+                self.openai.find_best_match(title, search_result.candidates), search_result
+            )
             step2_duration = time.time() - step2_start
-            
-            if not llm_result.success or not llm_result.selected_title:
-                # AI 매칭 실패시 첫 번째 후보 선택 또는 빈 페이지
-                if search_result.candidates:
-                    selected_title = search_result.candidates[0].title
-                    print(f"⚠️ AI 매칭 실패 - 첫 번째 후보 선택: {selected_title}")
-                    
-                    # Step 3로 계속 진행
-                    llm_result.selected_title = selected_title
-                    llm_result.success = True
-                    llm_result.confidence_score = 50.0  # 낮은 신뢰도
-                else:
-                    # 완전 실패
-                    notion_result = self.notion.create_or_update_page(title, None)
-                    return self._create_failure_result(
-                        title, "Step 2 실패", llm_result.error_message, 1,
-                        search_result=search_result, llm_result=llm_result,
-                        notion_result=notion_result
-                    )
-            
             print(f"✅ 2단계 완료: 매칭 성공")
             
             # Step 3: 메타데이터 수집
             print(f"\n📊 Step 3: 메타데이터 수집")
             step3_start = time.time()
-            
-            metadata_result = self.laftel.get_metadata(llm_result.selected_title)
+            metadata_result = self.laftel.get_metadata_for_match(llm_result)
             step3_duration = time.time() - step3_start
             
-            if not metadata_result.success:
-                print("⚠️ 메타데이터 수집 실패 - 기본 정보만으로 진행")
-                # 메타데이터 없이도 노션 페이지 생성 시도
-            else:
-                print(f"✅ 3단계 완료: 메타데이터 수집 성공")
-            
             # Step 4: 노션 업로드
             print(f"\n📝 Step 4: 노션 업로드")
             step4_start = time.time()
-            
-            metadata_obj = metadata_result.metadata if metadata_result.success else None
-            notion_result = self.notion.create_or_update_page(title, metadata_obj)
+            notion_result = self.notion.create_or_update_page(title, self._metadata_for_upload(metadata_result))
             step4_duration = time.time() - step4_start
             
-            if not notion_result.success:
-                return self._create_failure_result(
-                    title, "Step 4 실패", notion_result.error_message, 3,
-                    search_result=search_result, 
-                    llm_result=llm_result,
-                    metadata_result=metadata_result,
-                    notion_result=notion_result
-                )
-            
-            print(f"✅ 4단계 완료: 노션 업로드 성공")
-            
-            # 최종 성공 결과 생성
-            total_time = time.time() - start_time
-            
-            result = ProcessResult(
-                title=title,
-                success=True,
-                status=ProcessStatus.SUCCESS,
-                notion_url=notion_result.page_url,
-                search_result=search_result,
-                llm_result=llm_result,
-                metadata_result=metadata_result,
-                notion_result=notion_result,
-                processing_time=total_time,
-                steps_completed=4
+            return self._final_result(
+                title, search_result, llm_result, metadata_result, notion_result,
+                (step1_duration, step2_duration, step3_duration, step4_duration), start_time
             )
-            
-            # 단계별 결과 추가
-            result.add_step_result("search", True, step1_duration)
-            result.add_step_result("llm_matching", True, step2_duration)
-            result.add_step_result("metadata_collection", metadata_result.success, step3_duration,
-                                 error=metadata_result.error_message if not metadata_result.success else None)
-            result.add_step_result("notion_upload", True, step4_duration)
-            
-            print(f"\n✅ 전체 처리 성공!")
-            print(f"📄 노션 URL: {notion_result.page_url}")
-            print(f"⏱️ 총 소요시간: {total_time:.2f}초")
-            
-            return result
-            
+        
         except Exception as e:
-            error_msg = f"파이프라인 처리 중 예상치 못한 오류: {str(e)}"
-            print(f"❌ {error_msg}")
-            
-            return create_error_result(title, error_msg, 0)
+            return self._unexpected_error_result(title, e)
     
     async def process_single(self, title: str) -> ProcessResult:
         """
-        비동기 버전의 단일 애니메이션 처리 (향후 사용)
+        비동기 버전의 단일 애니메이션 처리
+        
+        라프텔 호출(Step 1, 3)과 OpenAI 매칭(Step 2)은 비동기 클라이언트로 이벤트 루프에서 처리하고,
+        동기 클라이언트인 노션 호출(Step 4)만 스레드로 위임
+        단계 사이의 판단과 결과 생성은 process_single_sync와 같은 헬퍼를 사용
         
         Args:
             title: 처리할 애니메이션 제목
-            
+        
         Returns:
             ProcessResult: 처리 결과
         """
-        # 현재는 동기 버전을 호출
-        return self.process_single_sync(title)
+        if self.async_laftel is None:
+            # httpx 미설치 환경: 동기 버전을 스레드에서 실행
+            return await asyncio.to_thread(self.process_single_sync, title)
+        
+        start_time = time.time()
+        self._print_start(title, " (async)")
+        
+        try:
+            # Step 1: 라프텔 검색
+            step1_start = time.time()
+            search_result = await self.async_laftel.search_anime(title)
+            step1_duration = time.time() - step1_start
+            
+            if not search_result.success or not search_result.candidates:
+                notion_result = None
+                if search_result.success:
+                    # 검색 실패시 빈 노션 페이지만 생성
+                    print("⚠️ 검색 결과 없음 - 빈 노션 페이지 생성")
+                    notion_result = await asyncio.to_thread(self.notion.create_or_update_page, title, None)
+                return self._search_stop_result(title, search_result, notion_result, step1_duration, start_time)
+            
+            # Step 2: AI 매칭
+            step2_start = time.time()
+            llm_result = self._apply_match_fallback(
+                await self.async_openai.find_best_match(title, search_result.candidates), search_result
+            )
+            step2_duration = time.time() - step2_start
+            
+            # Step 3: 메타데이터 수집
+            step3_start = time.time()
+            metadata_result = await self.async_laftel.get_metadata_for_match(llm_result)
+            step3_duration = time.time() - step3_start
+            
+            # Step 4: 노션 업로드
+            step4_start = time.time()
+            notion_result = await asyncio.to_thread(
+                self.notion.create_or_update_page, title, self._metadata_for_upload(metadata_result)
+            )
+            step4_duration = time.time() - step4_start
+            
+            return self._final_result(
+                title, search_result, llm_result, metadata_result, notion_result,
+                (step1_duration, step2_duration, step3_duration, step4_duration), start_time
+            )
+        
+        except Exception as e:
+            return self._unexpected_error_result(title, e)
+    
+    def _print_start(self, title: str, suffix: str = "") -> None:
+        """처리 시작 로그"""
+        print(f"\n{'='*80}")
+        print(f"🎯 애니메이션 처리 시작{suffix}: {title}")
+        print(f"{'='*80}")
+    
+    def _search_stop_result(self, title: str, search_result: SearchResult,
+                            notion_result: Optional[NotionResult], step1_duration: float,
+                            start_time: float) -> ProcessResult:
+        """Step 1에서 끝나는 경우의 결과 (검색 실패 또는 결과 없음 → 빈 페이지)"""
+        if not search_result.success:
+            return self._create_failure_result(
+                title, "Step 1 실패", search_result.error_message, 0,
+                search_result=search_result
+            )
+        
+        result = ProcessResult(
+            title=title,
+            success=notion_result.success,
+            status=ProcessStatus.PARTIAL_SUCCESS if notion_result.success else ProcessStatus.FAILED,
+            notion_url=notion_result.page_url if notion_result.success else None,
+            error="검색 결과가 없어 빈 페이지만 생성됨",
+            search_result=search_result,
+            notion_result=notion_result,
+            processing_time=time.time() - start_time,
+            steps_completed=1 if notion_result.success else 0
+        )
+        
+        result.add_step_result("search", True, step1_duration)
+        if notion_result.success:
+            result.add_step_result("notion_fallback", True)
+            print("✅ 빈 노션 페이지 생성 완료")
+        
+        return result
+    
+    def _apply_match_fallback(self, llm_result: LLMMatchResult, search_result: SearchResult) -> LLMMatchResult:
+        """AI 매칭 실패시 첫 번째 후보를 낮은 신뢰도로 선택 (Step 3로 계속 진행)"""
+        if llm_result.success and llm_result.selected_title:
+            return llm_result
+        
+        first_candidate = search_result.candidates[0]
+        print(f"⚠️ AI 매칭 실패 - 첫 번째 후보 선택: {first_candidate.title}")
+        
+        llm_result.selected_title = first_candidate.title
+        llm_result.laftel_id = first_candidate.laftel_id
+        llm_result.success = True
+        llm_result.confidence_score = 50.0  # 낮은 신뢰도
+        return llm_result
+    
+    def _metadata_for_upload(self, metadata_result: MetadataResult) -> Optional[AnimeMetadata]:
+        """노션 업로드에 쓸 메타데이터 (수집 실패시 None으로 기본 정보만 업로드)"""
+        if not metadata_result.success:
+            print("⚠️ 메타데이터 수집 실패 - 기본 정보만으로 진행")
+            return None
+        
+        print(f"✅ 3단계 완료: 메타데이터 수집 성공")
+        return metadata_result.metadata
+    
+    def _final_result(self, title: str, search_result: SearchResult, llm_result: LLMMatchResult,
+                      metadata_result: MetadataResult, notion_result: NotionResult,
+                      durations: Tuple[float, float, float, float], start_time: float) -> ProcessResult:
+        """Step 4까지 진행한 경우의 결과 (노션 업로드 실패는 실패 결과)"""
+        if not notion_result.success:
+            return self._create_failure_result(
+                title, "Step 4 실패", notion_result.error_message, 3,
+                search_result=search_result, 
+                llm_result=llm_result,
+                metadata_result=metadata_result,
+                notion_result=notion_result
+            )
+        
+        print(f"✅ 4단계 완료: 노션 업로드 성공")
+        
+        step1_duration, step2_duration, step3_duration, step4_duration = durations
+        total_time = time.time() - start_time
+        
+        result = ProcessResult(
+            title=title,
+            success=True,
+            status=ProcessStatus.SUCCESS,
+            notion_url=notion_result.page_url,
+            search_result=search_result,
+            llm_result=llm_result,
+            metadata_result=metadata_result,
+            notion_result=notion_result,
+            processing_time=total_time,
+            steps_completed=4
+        )
+        
+        # 단계별 결과 추가
+        result.add_step_result("search", True, step1_duration)
+        result.add_step_result("llm_matching", True, step2_duration,
+                             data=llm_result.metrics.dict() if llm_result.metrics else None)
+        result.add_step_result("metadata_collection", metadata_result.success, step3_duration,
+                             error=metadata_result.error_message if not metadata_result.success else None)
+        result.add_step_result("notion_upload", True, step4_duration)
+        
+        print(f"\n✅ 전체 처리 성공!")
+        print(f"📄 노션 URL: {notion_result.page_url}")
+        print(f"⏱️ 총 소요시간: {total_time:.2f}초")
+        
+        return result
+    
+    def _unexpected_error_result(self, title: str, error: Exception) -> ProcessResult:
+        """처리 중 예상치 못한 예외를 실패 결과로 변환"""
+        error_msg = f"파이프라인 처리 중 예상치 못한 오류: {str(error)}"
+        print(f"❌ {error_msg}")
+        
+        return create_error_result(title, error_msg, 0)
     
     def _create_failure_result(self, title: str, step_name: str, error_message: str, 
                               steps_completed: int, **step_results) -> ProcessResult:
@@ -241,14 +321,14 @@ class AnimePipeline:
                 status["services"]["openai"] = "error - API key missing"
             else:
                 status["services"]["openai"] = "ready"
-                
+            
             if not settings.notion_token:
                 status["services"]["notion"] = "error - token missing"
             else:
                 status["services"]["notion"] = "ready"
-                
-            status["services"]["laftel"] = "ready"  # 라프텔은 별도 인증 불필요
             
+            status["services"]["laftel"] = "ready"  # 라프텔은 별도 인증 불필요
+        
         except Exception as e:
             status["pipeline"] = "error"
             status["error"] = str(e)
@@ -262,5 +342,12 @@ class AnimePipeline:
             "supported_steps": ["search", "llm_matching", "metadata_collection", "notion_upload"],
             "max_search_candidates": settings.max_search_candidates,
             "openai_model": settings.openai_model,
-            "environment": "production" if settings.is_production else "development"
+            "environment": "production" if settings.is_production else "development",
+            "laftel_cache": self.laftel.cache_stats(),
+            "laftel_rate_limit": self.laftel.rate_limit_stats(),
+            "laftel_routes": self.laftel.route_stats(),
+            "llm_cache": self.openai.cache_stats(),
+            "openai_rate_limit": self.openai.rate_limit_stats(),
+            "openai_concurrency": self.async_openai.concurrency_stats(),
+            "notion_index": self.notion.index_stats()
         }
@@ -0,0 +1,147 @@
+# 🚦 토큰 버킷 요청 속도 제한
+"""
+외부 API 호출 속도 제한
+- 토큰 버킷: 초당 rate개 충전, 최대 burst개까지 몰아서 호출 가능
+- 예약 방식으로 대기 순서를 정하므로 스레드와 이벤트 루프 태스크가 같은 버킷 공유 가능
+- 대기 횟수/누적 대기 시간 등 지표 제공
+- OpenAI 분당 요청 수(RPM) / 분당 토큰 수(TPM) 거버너: 한도 초과 요청은 429 대신 대기열에서 대기
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict
+
+from .config import settings
+
+class TokenBucket:
+    """스레드/비동기 공용 토큰 버킷"""
+    
+    def __init__(self, name: str, rate: float, burst: float):
+        """
+        버킷 초기화
+        
+        Args:
+            name: 지표 표시용 이름
+            rate: 초당 허용 요청 수 (0 이하이면 제한 없음)
+            burst: 한 번에 허용하는 최대 토큰 수 (요청 수 또는 OpenAI 토큰 수)
+        """
+        self.name = name
+        self.rate = rate
+        self.burst = max(1, burst)
+        
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+        
+        self.acquired = 0
+        self.rejected = 0  # try_acquire에서 토큰이 없어 거절된 횟수
+        self.waited = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+    
+    def _reserve(self, amount: float = 1.0) -> float:
+        """토큰 amount개 예약 후 사용 가능 시점까지 남은 대기 시간 반환"""
+        if self.rate <= 0:
+            with self._lock:
+                self.acquired += 1
+            return 0.0
+        
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            
+            # 토큰이 부족하면 음수로 빌려 쓰고, 빚을 갚을 때까지 대기 (선착순 보장)
+            self._tokens -= amount
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            
+            self.acquired += 1
+            if wait > 0:
+                self.waited += 1
+                self.total_wait += wait
+                self.max_wait = max(self.max_wait, wait)
+        
+        return wait
+    
+    def acquire(self, amount: float = 1.0) -> float:
+        """토큰 획득 (필요하면 스레드 대기), 대기한 시간 반환"""
+        wait = self._reserve(amount)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+    
+    def try_acquire(self, amount: float = 1.0) -> bool:
+        """대기 없이 토큰 획득 시도 (남은 토큰이 부족하면 소모하지 않고 False)"""
+        with self._lock:
+            if self.rate > 0:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                
+                if self._tokens < amount:
+                    self.rejected += 1
+                    return False
+                self._tokens -= amount
+            
+            self.acquired += 1
+            return True
+    
+    async def acquire_async(self, amount: float = 1.0) -> float:
+        """토큰 획득 (필요하면 이벤트 루프에 양보하며 대기), 대기한 시간 반환"""
+        wait = self._reserve(amount)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "burst": self.burst,
+                "acquired": self.acquired,
+                "rejected": self.rejected,
+                "waited": self.waited,
+                "total_wait": round(self.total_wait, 3),
+                "avg_wait": round(self.total_wait / self.waited, 3) if self.waited else 0.0,
+                "max_wait": round(self.max_wait, 3)
+            }
+
+# 프로세스 전역 버킷 레지스트리 (모든 클라이언트 인스턴스가 공유)
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+def get_rate_limiter(name: str, rate: float, burst: float) -> TokenBucket:
+    """이름별 공유 토큰 버킷 반환 (최초 생성시 설정값 적용)"""
+    with _buckets_lock:
+        bucket = _buckets.get(name)
+        if bucket is None:
+            bucket = TokenBucket(name, rate, burst)
+            _buckets[name] = bucket
+        return bucket
+
+def get_laftel_limiters() -> Dict[str, TokenBucket]:
+    """라프텔 엔드포인트별 공유 버킷 (검색 / 상세 정보 / 에피소드)"""
+    return {
+        "search": get_rate_limiter(
+            "laftel_search", settings.laftel_search_rate, settings.laftel_search_burst
+        ),
+        "item": get_rate_limiter(
+            "laftel_item", settings.laftel_item_rate, settings.laftel_item_burst
+        ),
+        "episodes": get_rate_limiter(
+            "laftel_episodes", settings.laftel_episodes_rate, settings.laftel_episodes_burst
+        )
+    }
+
+def _per_minute_bucket(name: str, limit: float) -> TokenBucket:
+    """분당 한도 버킷 (초당 limit/60 충전, 최대 openai_burst_seconds초 분량까지 몰아서 사용)"""
+    rate = limit / 60.0 if limit > 0 else 0.0
+    return get_rate_limiter(name, rate, max(1.0, rate * settings.openai_burst_seconds))
+
+def get_openai_limiters() -> Dict[str, TokenBucket]:
+    """OpenAI 계정 한도 공유 버킷 (requests: 분당 요청 수 / tokens: 분당 토큰 수)"""
+    return {
+        "requests": _per_minute_bucket("openai_requests", settings.openai_rpm_limit),
+        "tokens": _per_minute_bucket("openai_tokens", settings.openai_tpm_limit)
+    }
@@ -0,0 +1,240 @@
+# 🔁 공통 재시도 정책
+"""
+외부 API 클라이언트 공통 재시도 정책
+- 지수 백오프 + decorrelated jitter로 동시 재시도 폭주 방지
+- 서비스별 재시도 가능 오류 분류 함수 주입
+- 서버가 보낸 Retry-After 헤더 우선 적용
+- 프로세스 전역 재시도 예산으로 장애 시 재시도 트래픽 상한 제한
+"""
+
+import asyncio
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Optional
+
+from .config import settings
+
+# 일반적으로 재시도해도 되는 HTTP 상태 코드 (5xx는 별도 처리)
+RETRYABLE_STATUS_CODES = {408, 425, 429}
+
+class RetryableError(Exception):
+    """명시적으로 재시도 가능한 오류"""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class HTTPStatusError(Exception):
+    """HTTP 오류 응답 (상태 코드 및 Retry-After 포함)"""
+    
+    def __init__(self, status_code: int, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+    
+    @property
+    def retryable(self) -> bool:
+        return self.status_code in RETRYABLE_STATUS_CODES or self.status_code >= 500
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 값(초 또는 HTTP 날짜)을 대기 초로 변환"""
+    if not value:
+        return None
+    
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """예외에서 서버가 요청한 대기 시간 추출"""
+    retry_after = getattr(error, 'retry_after', None)
+    if retry_after is not None:
+        return retry_after
+    
+    # requests / httpx / openai 예외는 response.headers를 가짐
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if headers is not None:
+        return parse_retry_after(headers.get('Retry-After'))
+    
+    return None
+
+def default_is_retryable(error: Exception) -> bool:
+    """서비스 공통 재시도 가능 오류 판단"""
+    if isinstance(error, RetryableError):
+        return True
+    if isinstance(error, HTTPStatusError):
+        return error.retryable
+    return isinstance(error, (ConnectionError, TimeoutError))
+
+class RetryBudget:
+    """
+    프로세스 전역 재시도 예산
+    - 최초 요청마다 ratio 만큼 토큰 적립, 재시도마다 토큰 1개 소모
+    - 초당 min_per_second 만큼 자동 충전 (트래픽이 적을 때도 최소 재시도 보장)
+    - 장애 상황에서 재시도가 전체 트래픽의 일정 비율을 넘지 않도록 제한
+    """
+    
+    def __init__(self, ratio: float, min_per_second: float, max_tokens: float):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        
+        self._tokens = max_tokens
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+        
+        self.retries_allowed = 0
+        self.retries_rejected = 0
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.max_tokens, self._tokens + (now - self._updated_at) * self.min_per_second)
+        self._updated_at = now
+    
+    def record_request(self) -> None:
+        """최초 요청 기록 (예산 적립)"""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+    
+    def try_acquire(self) -> bool:
+        """재시도 1회 예산 사용 (부족하면 False)"""
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                self.retries_allowed += 1
+                return True
+            
+            self.retries_rejected += 1
+            return False
+    
+    def stats(self) -> dict:
+        with self._lock:
+            self._refill()
+            return {
+                "tokens": round(self._tokens, 2),
+                "retries_allowed": self.retries_allowed,
+                "retries_rejected": self.retries_rejected
+            }
+
+# 모든 클라이언트가 공유하는 재시도 예산
+retry_budget = RetryBudget(
+    ratio=settings.retry_budget_ratio,
+    min_per_second=settings.retry_budget_min_per_second,
+    max_tokens=settings.retry_budget_max_tokens
+)
+
+class RetryPolicy:
+    """지수 백오프 + decorrelated jitter 재시도 정책"""
+    
+    def __init__(self, name: str,
+                 max_attempts: Optional[int] = None,
+                 base_delay: Optional[float] = None,
+                 max_delay: Optional[float] = None,
+                 is_retryable: Callable[[Exception], bool] = default_is_retryable,
+                 budget: Optional[RetryBudget] = None,
+                 max_retry_after: Optional[float] = None):
+        """
+        정책 초기화
+        
+        Args:
+            name: 로그용 서비스 이름
+            max_attempts: 최초 요청 포함 최대 시도 횟수 (기본값: 설정값)
+            base_delay: 최소 대기 시간 (초, 기본값: 설정값)
+            max_delay: 최대 대기 시간 (초, 기본값: 설정값)
+            is_retryable: 서비스별 재시도 가능 오류 판단 함수
+            budget: 재시도 예산 (기본값: 프로세스 전역 예산)
+            max_retry_after: Retry-After 최대 대기 시간 (초, 기본값: 설정값, 더 길게 요청하면 재시도 없이 실패)
+        """
+        self.name = name
+        self.max_attempts = max_attempts or settings.retry_max_attempts
+        self.base_delay = settings.retry_base_delay if base_delay is None else base_delay
+        self.max_delay = settings.retry_max_delay if max_delay is None else max_delay
+        self.is_retryable = is_retryable
+        self.budget = budget or retry_budget
+        self.max_retry_after = settings.retry_after_max if max_retry_after is None else max_retry_after
+    
+    def next_delay(self, previous_delay: float) -> float:
+        """decorrelated jitter: min(cap, uniform(base, 이전 대기 * 3))"""
+        upper = max(self.base_delay, previous_delay * 3)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+    
+    def _wait_time(self, error: Exception, attempt: int, previous_delay: float) -> Optional[float]:
+        """
+        다음 시도까지 대기 시간 계산
+        
+        Returns:
+            대기 초 (재시도하지 않아야 하면 None)
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(error):
+            return None
+        
+        retry_after = get_retry_after(error)
+        if retry_after is not None and retry_after > self.max_retry_after:
+            # 요청한 시간보다 일찍 재시도하면 다시 거절되므로 줄여서 기다리지 않고 바로 실패 처리
+            print(f"⚠️ {self.name} Retry-After {retry_after:.0f}초가 최대 대기 시간 "
+                  f"{self.max_retry_after:.0f}초를 초과 - 재시도 생략")
+            return None
+        
+        if not self.budget.try_acquire():
+            print(f"⚠️ {self.name} 재시도 예산 소진 - 재시도 생략")
+            return None
+        
+        if retry_after is not None:
+            # 서버가 요청한 시간만큼 정확히 대기
+            return retry_after
+        
+        return self.next_delay(previous_delay)
+    
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """재시도 정책을 적용하여 함수 실행"""
+        self.budget.record_request()
+        delay = self.base_delay
+        attempt = 0
+        
+        while True:
+            attempt += 1
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                wait = self._wait_time(e, attempt, delay)
+                if wait is None:
+                    raise
+                
+                print(f"⚠️ {self.name} 시도 {attempt} 실패: {e} - {wait:.2f}초 후 재시도")
+                delay = max(wait, self.base_delay)
+                time.sleep(wait)
+    
+    async def acall(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """재시도 정책을 적용하여 코루틴 함수 실행"""
+        self.budget.record_request()
+        delay = self.base_delay
+        attempt = 0
+        
+        while True:
+            attempt += 1
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                wait = self._wait_time(e, attempt, delay)
+                if wait is None:
+                    raise
+                
+                print(f"⚠️ {self.name} 시도 {attempt} 실패: {e} - {wait:.2f}초 후 재시도")
+                delay = max(wait, self.base_delay)
+                await asyncio.sleep(wait)
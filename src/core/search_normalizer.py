@@ -0,0 +1,112 @@
+# 🔧 라프텔 검색어 정규화
+"""
+라프텔 검색어 정규화 엔진
+- 미리 컴파일한 규칙 표로 시즌/파트 표기, 전각/반각 문자, ×/x, 괄호를 처리
+- 기본 검색어 1개와 우선순위가 매겨진 대체 검색어 목록 생성
+- 입력별 결과 메모이제이션 (lru_cache)
+
+설정 모듈을 import하지 않으므로 레거시 step1 모듈에서도 그대로 사용할 수 있다.
+"""
+
+import re
+from functools import lru_cache
+from typing import List, Tuple
+
+# 제목 끝의 시즌/파트 표기 (반복 적용: "애니 2기 Part 2" → "애니")
+SEASON_SUFFIX_RULES = [
+    re.compile(r'(?:\s+제\s*|\s*)\d+\s*기\s*$'),                     # "무직전생 2기", "애니 제2기" ("축제 2기"의 제는 유지)
+    re.compile(r'\s*시즌\s*\d+\s*$'),                              # "애니 시즌 2"
+    re.compile(r'\s*season\s*\d+\s*$', re.IGNORECASE),             # "애니 Season 2"
+    re.compile(r'\s*\d+(?:st|nd|rd|th)\s*season\s*$', re.IGNORECASE),  # "애니 2nd Season"
+    re.compile(r'\s*(?:part|파트)\s*\d+\s*$', re.IGNORECASE),       # "애니 Part 2", "애니 파트 2"
+    re.compile(r'\s*\d+\s*쿨\s*$'),                                # "애니 2쿨"
+]
+
+# 전각 ASCII(！～) / 전각 공백 → 반각 (NFKC는 ∬ 같은 제목 기호까지 바꾸므로 사용하지 않음)
+FULLWIDTH_TABLE = {code: code - 0xFEE0 for code in range(0xFF01, 0xFF5F)}
+FULLWIDTH_TABLE[0x3000] = ord(' ')
+
+# 부가 정보 괄호 (내용까지 제거): "귀멸의 칼날 (극장판)", "[자막]"
+ANNOTATION_BRACKETS = re.compile(r'\s*[\(\[【（［][^\)\]】）］]*[\)\]】）］]\s*')
+
+# 제목 괄호 (기호만 제거): 「」『』〈〉《》
+TITLE_BRACKETS = re.compile(r'[「」『』〈〉《》]')
+
+# 곱하기 기호 / 단어 사이 x: "SPY×FAMILY", "HUNTER x HUNTER"
+CROSS_MARK = re.compile(r'\s*×\s*')
+CROSS_LETTER = re.compile(r'(?<=\S)\s+[xX]\s+(?=\S)')
+
+# 검색에 방해가 되는 문장 부호
+PUNCTUATION = re.compile(r'[:\-–—~!?.,·・/\\\'"]+')
+
+# 부제 구분자: "진격의 거인: 파이널 시즌" → "진격의 거인" ("Re:제로"처럼 붙어 있으면 제목 일부)
+SUBTITLE_SEPARATOR = re.compile(r'\s*:\s+|\s+[\-–—~]\s+')
+
+WHITESPACE = re.compile(r'\s+')
+
+def _clean(text: str) -> str:
+    return WHITESPACE.sub(' ', text).strip()
+
+def _strip_season_suffix(text: str) -> str:
+    """시즌/파트 표기가 더 이상 없을 때까지 제거 (전부 지워지면 원문 유지)"""
+    changed = True
+    while changed:
+        changed = False
+        for rule in SEASON_SUFFIX_RULES:
+            stripped = rule.sub('', text)
+            if stripped != text and stripped.strip():
+                text = stripped
+                changed = True
+    return text.strip()
+
+@lru_cache(maxsize=4096)
+def query_variants(user_input: str) -> Tuple[str, ...]:
+    """
+    검색어 후보 생성 (우선순위 순, 중복 제거)
+    
+    1. 기본 검색어: 전각/반각 통일 + 시즌/파트 표기 제거
+    2. 부가 정보 괄호 제거
+    3. ×/x 표기 변형
+    4. 문장 부호 제거
+    5. 부제 앞 본제목
+    6. 공백 제거
+    
+    Returns:
+        검색어 튜플 (첫 번째가 기본 검색어)
+    """
+    normalized = _clean(user_input.translate(FULLWIDTH_TABLE))
+    if not normalized:
+        return (user_input,)
+    
+    primary = _strip_season_suffix(normalized)
+    candidates: List[str] = [primary]
+    
+    without_brackets = _strip_season_suffix(_clean(TITLE_BRACKETS.sub(' ', ANNOTATION_BRACKETS.sub(' ', primary))))
+    candidates.append(without_brackets)
+    
+    if '×' in without_brackets:
+        candidates.append(_clean(CROSS_MARK.sub(' x ', without_brackets)))
+        candidates.append(_clean(CROSS_MARK.sub(' ', without_brackets)))
+    elif CROSS_LETTER.search(without_brackets):
+        candidates.append(CROSS_LETTER.sub('×', without_brackets))
+    
+    candidates.append(_clean(PUNCTUATION.sub(' ', without_brackets)))
+    
+    main_title = SUBTITLE_SEPARATOR.split(without_brackets, maxsplit=1)[0]
+    candidates.append(_strip_season_suffix(_clean(main_title)))
+    
+    candidates.append(without_brackets.replace(' ', ''))
+    
+    variants = []
+    seen = set()
+    for candidate in candidates:
+        key = candidate.casefold()
+        if candidate and key not in seen:
+            seen.add(key)
+            variants.append(candidate)
+    
+    return tuple(variants)
+
+def primary_query(user_input: str) -> str:
+    """기본 검색어 (라프텔에 가장 먼저 보낼 검색어)"""
+    return query_variants(user_input)[0]
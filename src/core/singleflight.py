@@ -0,0 +1,95 @@
+# 🛬 동일 요청 합치기 (singleflight)
+"""
+동일 키로 동시에 들어온 호출을 한 번의 실행으로 합치는 유틸리티
+- 먼저 들어온 호출(리더)만 실제로 실행하고 나머지는 결과를 공유
+- 실행이 끝나면 키를 비워 다음 호출은 새로 실행 (결과 캐싱 아님)
+- 스레드용 SingleFlight / 이벤트 루프용 AsyncSingleFlight
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable
+
+class SingleFlight:
+    """스레드 간 동일 키 호출 합치기"""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.coalesced = 0  # 다른 호출의 결과를 공유한 횟수
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+    
+    def do(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        key에 대해 진행 중인 호출이 있으면 그 결과를 기다리고, 없으면 func 실행
+        
+        Returns:
+            func 실행 결과 (예외도 대기 중인 모든 호출에 전달)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = Future()
+                self._calls[key] = call
+            else:
+                self.coalesced += 1
+        
+        if not is_leader:
+            print(f"🛬 진행 중인 {self.name} 요청에 합류: {key}")
+            return call.result()
+        
+        try:
+            result = func(*args, **kwargs)
+            call.set_result(result)
+            return result
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"in_flight": len(self._calls), "coalesced": self.coalesced}
+
+class AsyncSingleFlight:
+    """이벤트 루프 내 동일 키 코루틴 호출 합치기"""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.coalesced = 0
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+    
+    async def do(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        key에 대해 진행 중인 코루틴이 있으면 그 결과를 기다리고, 없으면 func 실행
+        
+        대기하던 호출 하나가 취소되어도 공유 작업은 취소되지 않는다.
+        """
+        loop = asyncio.get_running_loop()
+        task = self._calls.get(key)
+        
+        # 다른 이벤트 루프에서 만든 작업은 공유할 수 없음
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = loop.create_task(func(*args, **kwargs))
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._release(key, done))
+        else:
+            self.coalesced += 1
+            print(f"🛬 진행 중인 {self.name} 요청에 합류: {key}")
+        
+        return await asyncio.shield(task)
+    
+    def _release(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        
+        # 모든 대기자가 취소된 경우 예외 미조회 경고 방지
+        if not task.cancelled():
+            task.exception()
+    
+    def stats(self) -> Dict[str, Any]:
+        return {"in_flight": len(self._calls), "coalesced": self.coalesced}
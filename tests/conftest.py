@@ -0,0 +1,17 @@
+# 🧪 pytest 공통 설정
+"""
+테스트 공통 설정
+- 프로젝트 루트를 import 경로에 추가 (src.core.* 사용)
+- 설정 모듈이 요구하는 필수 환경변수를 테스트용 값으로 채움 (실제 API 호출 없음)
+"""
+
+import os
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
+os.environ.setdefault("NOTION_TOKEN", "test-notion-token")
+os.environ.setdefault("NOTION_DATABASE_ID", "test-database-id")
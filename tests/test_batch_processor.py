@@ -0,0 +1,13 @@
+# 🧪 배치 처리기 설정 검증 테스트
+
+import pytest
+
+from src.batch.processor import BatchProcessor
+
+def test_rejects_unknown_matching_mode(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(ValueError):
+        BatchProcessor("anime.csv", matching_mode="bacth_api")
+    
+    # 결과 폴더를 만들기 전에 거부
+    assert not (tmp_path / "productions").exists()
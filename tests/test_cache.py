@@ -0,0 +1,114 @@
+# 🧪 SQLite 캐시 테스트
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.core import cache as cache_module
+from src.core.cache import SqliteCache, normalize_cache_key
+
+@pytest.fixture
+def clock(monkeypatch):
+    """cache 모듈이 보는 time.time을 수동으로 진행하는 가짜 시계로 교체"""
+    state = SimpleNamespace(now=1_700_000_000.0)
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(time=lambda: state.now))
+    return state
+
+@pytest.fixture
+def make_cache(tmp_path):
+    caches = []
+    
+    def factory(ttl_seconds=60, max_entries=100):
+        cache = SqliteCache(str(tmp_path / "cache.sqlite3"), "test_table", ttl_seconds, max_entries)
+        caches.append(cache)
+        return cache
+    
+    yield factory
+    for cache in caches:
+        cache.close()
+
+def test_normalize_cache_key():
+    assert normalize_cache_key("  ＳＰＹ×FAMILY   2기 ") == "spy×family 2기"
+    assert normalize_cache_key("Re:제로") == normalize_cache_key("re:제로")
+
+def test_rejects_invalid_table_name(tmp_path):
+    with pytest.raises(ValueError):
+        SqliteCache(str(tmp_path / "cache.sqlite3"), "bad-name; DROP", 60, 10)
+
+def test_set_and_get_round_trip(clock, make_cache):
+    cache = make_cache()
+    cache.set("key", {"items": [1, 2], "name": "진격의 거인"})
+    assert cache.get("key") == {"items": [1, 2], "name": "진격의 거인"}
+    assert cache.get("missing") is None
+    
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+
+def test_entries_expire_after_ttl(clock, make_cache):
+    cache = make_cache(ttl_seconds=60)
+    cache.set("default", "a")
+    cache.set("short", "b", ttl_seconds=10)
+    
+    clock.now += 30
+    assert cache.get("default") == "a"
+    assert cache.get("short") is None
+    
+    clock.now += 30
+    assert cache.get("default") is None
+
+def test_get_entry_returns_stale_values(clock, make_cache):
+    cache = make_cache(ttl_seconds=10)
+    cache.set("key", "value")
+    assert cache.get_entry("key") == ("value", True)
+    
+    clock.now += 11
+    assert cache.get_entry("key") == ("value", False)
+    assert cache.get_entry("missing") is None
+    assert cache.stats()["stale_hits"] == 1
+
+def test_lru_eviction_keeps_recently_used(clock, make_cache):
+    cache = make_cache(max_entries=2)
+    cache.set("a", 1)
+    clock.now += 1
+    cache.set("b", 2)
+    clock.now += 1
+    
+    # a를 최근에 사용했으므로 c 저장시 b가 정리됨
+    assert cache.get("a") == 1
+    clock.now += 1
+    cache.set("c", 3)
+    
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["size"] == 2
+
+def test_reads_do_not_write(clock, make_cache):
+    cache = make_cache()
+    cache.set("key", "value")
+    writes = cache._conn.total_changes
+    
+    for _ in range(cache_module.TOUCH_FLUSH_SIZE - 1):
+        cache.get("key")
+        cache.get_entry("key")
+    assert cache._conn.total_changes == writes
+
+def test_eviction_runs_every_n_sets(clock, make_cache):
+    cache = make_cache(max_entries=50)
+    assert cache._evict_interval == 5
+    for index in range(54):
+        clock.now += 1
+        cache.set(f"key{index}", index)
+    # 54번째 저장은 아직 정리 주기가 아니므로 잠시 초과 허용
+    assert cache.stats()["size"] == 54
+    
+    clock.now += 1
+    cache.set("key54", 54)
+    assert cache.stats()["size"] == 50
+    assert cache.get("key0") is None
+
+def test_delete(clock, make_cache):
+    cache = make_cache()
+    cache.set("key", "value")
+    cache.delete("key")
+    assert cache.get("key") is None
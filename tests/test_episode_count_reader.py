@@ -0,0 +1,52 @@
+# 🧪 에피소드 수 스트리밍 파서 테스트
+
+import json
+
+import pytest
+
+from src.core.laftel_client import EpisodeCountReader
+
+def read(payload: bytes, chunk_size: int):
+    reader = EpisodeCountReader()
+    for start in range(0, len(payload), chunk_size):
+        reader.feed(payload[start:start + chunk_size])
+    return reader.result()
+
+EPISODES = [
+    {"id": 1, "title": "1화 \"시작\" [특별편]", "tags": ["a", "b"]},
+    {"id": 2, "title": "2화, 그리고 {중괄호}", "extra": {"nested": [1, 2, {"x": "]"}]}},
+    {"id": 3, "title": "역슬래시 \\ 포함"},
+]
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 4096])
+def test_top_level_array_counts_elements(chunk_size):
+    payload = json.dumps(EPISODES, ensure_ascii=False).encode("utf-8")
+    assert read(payload, chunk_size) == 3
+
+def test_empty_array():
+    assert read(b"  [ ]  ", 1) == 0
+
+@pytest.mark.parametrize("payload, expected", [
+    (b'["a"]', 1),
+    (b'[ 5 ]', 1),
+    (b'[[], [1, 2], {}]', 3),
+    (b'["\\\\", "\\"]", "]"]', 3),
+    (b'["a, b", "[", "{"]', 3),
+])
+@pytest.mark.parametrize("chunk_size", [1, 2, 4096])
+def test_scalars_and_escapes_at_chunk_boundaries(payload, expected, chunk_size):
+    assert len(json.loads(payload)) == expected
+    assert read(payload, chunk_size) == expected
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 4096])
+def test_paginated_object_uses_count(chunk_size):
+    payload = json.dumps({"count": 24, "results": EPISODES}, ensure_ascii=False).encode("utf-8")
+    assert read(payload, chunk_size) == 24
+
+def test_paginated_object_without_count_uses_results():
+    payload = json.dumps({"results": EPISODES}, ensure_ascii=False).encode("utf-8")
+    assert read(payload, 16) == 3
+
+def test_no_data():
+    assert read(b"", 16) is None
+    assert read(b'"unexpected"', 16) is None
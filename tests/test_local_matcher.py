@@ -0,0 +1,48 @@
+# 🧪 로컬 사전 매칭 테스트
+
+import pytest
+
+from src.core.local_matcher import bigram_similarity, parse_title, score_candidates, shortlist_candidates
+from src.core.models import SearchCandidate
+
+@pytest.mark.parametrize("title, expected", [
+    ("진격의 거인 시즌2", ("진격의거인", 2, None)),
+    ("빈란드 사가 제2기", ("빈란드사가", 2, None)),
+    ("Fate/Zero 2nd Season", ("fatezero", 2, None)),
+    ("무직전생 2기 2쿨", ("무직전생", 2, 2)),
+    ("진격의 거인 The Final Season Part 2", ("진격의거인thefinalseason", None, 2)),
+    ("오버로드 IV", ("오버로드", 4, None)),
+    ("스파이 패밀리 (자막)", ("스파이패밀리", None, None)),
+])
+def test_parse_title(title, expected):
+    assert parse_title(title) == expected
+
+@pytest.mark.parametrize("title", ["HUNTER X HUNTER", "록맨 X", "울트라맨 V"])
+def test_title_x_and_v_are_not_seasons(title):
+    assert parse_title(title)[1] is None
+
+def test_roman_numeral_only_at_end():
+    assert parse_title("IX 스타")[1] is None
+    assert parse_title("기동전사 건담 II")[1] == 2
+
+def test_bigram_similarity():
+    assert bigram_similarity("진격의거인", "진격의거인") == 1.0
+    assert bigram_similarity("진격", "진격의거인") == pytest.approx(0.4)
+    assert bigram_similarity("", "abc") == 0.0
+
+def candidates(*titles):
+    return [SearchCandidate(title=title, laftel_id=str(number), rank=number) for number, title in enumerate(titles, 1)]
+
+def test_score_candidates_does_not_mutate_candidates():
+    items = candidates("진격의 거인", "진격의 거인 시즌2")
+    before = [candidate.similarity_score for candidate in items]
+    scored = score_candidates("진격의 거인", items)
+    assert [candidate.similarity_score for candidate in items] == before
+    assert scored[0].candidate.title == "진격의 거인"
+    assert scored[0].score >= scored[1].score
+
+def test_shortlist_keeps_best_raw_similarity_candidate():
+    # 입력의 시즌 표기가 틀려도 원래 유사도가 가장 높은 후보는 남아야 함
+    items = candidates(*[f"다른 작품 {number}" for number in range(10)], "진격의 거인")
+    shortlist = shortlist_candidates("진격의 거인 3기", items)
+    assert any(candidate.title == "진격의 거인" for candidate in shortlist)
@@ -0,0 +1,102 @@
+# 🧪 노션 제목 인덱스 테스트
+
+import pytest
+
+from src.core import notion_index
+from src.core.notion_index import NotionTitleIndex, page_title
+
+def page(page_id, title, edited="2026-01-01T00:00:00.000Z", **extra):
+    return {
+        "id": page_id,
+        "last_edited_time": edited,
+        "properties": {"이름": {"type": "title", "title": [{"plain_text": title}]}},
+        **extra
+    }
+
+class FakeDatabase:
+    """databases/{id}/query 응답 흉내 (page_size 단위 페이지네이션, last_edited_time 필터)"""
+    
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.bodies = []
+    
+    def query(self, body):
+        self.bodies.append(dict(body))
+        pages = self.pages
+        since = body.get("filter", {}).get("last_edited_time", {}).get("on_or_after")
+        if since:
+            pages = [item for item in pages if item["last_edited_time"] >= since]
+        
+        start = int(body.get("start_cursor") or 0)
+        end = start + body["page_size"]
+        has_more = end < len(pages)
+        return {"results": pages[start:end], "has_more": has_more, "next_cursor": str(end) if has_more else None}
+
+@pytest.fixture(autouse=True)
+def index_settings(monkeypatch):
+    monkeypatch.setattr(notion_index.settings, "notion_query_page_size", 2)
+    monkeypatch.setattr(notion_index.settings, "notion_index_refresh_interval", 0.0)
+    monkeypatch.setattr(notion_index.settings, "notion_index_rebuild_interval", 3600.0)
+
+def test_page_title():
+    assert page_title(page("p1", "진격의 거인")) == "진격의 거인"
+    assert page_title({"properties": {}}) is None
+
+def test_full_build_paginates():
+    database = FakeDatabase([page(f"p{number}", f"제목 {number}") for number in range(5)])
+    index = NotionTitleIndex("db")
+    
+    assert index.ensure_fresh(database.query)
+    assert [body.get("start_cursor") for body in database.bodies] == [None, "2", "4"]
+    assert index.lookup("제목 3") == "p3"
+    assert index.lookup("없는 제목") is None
+    assert index.stats()["size"] == 5
+
+def test_incremental_refresh_applies_renames_and_archives():
+    database = FakeDatabase([page("p1", "원래 제목"), page("p2", "보관될 페이지")])
+    index = NotionTitleIndex("db")
+    index.ensure_fresh(database.query)
+    
+    database.pages = [
+        page("p1", "바뀐 제목", edited="2026-01-02T00:00:00.000Z"),
+        page("p2", "보관될 페이지", edited="2026-01-02T00:00:00.000Z", archived=True),
+        page("p3", "새 페이지", edited="2026-01-02T00:00:00.000Z")
+    ]
+    index.ensure_fresh(database.query)
+    
+    assert database.bodies[-1]["filter"]["last_edited_time"] == {"on_or_after": "2026-01-01T00:00:00.000Z"}
+    assert index.lookup("원래 제목") is None
+    assert index.lookup("바뀐 제목") == "p1"
+    assert index.lookup("보관될 페이지") is None
+    assert index.lookup("새 페이지") == "p3"
+
+def test_added_pages_survive_full_rebuild(monkeypatch):
+    database = FakeDatabase([page("p1", "기존 페이지")])
+    index = NotionTitleIndex("db")
+    index.ensure_fresh(database.query)
+    
+    # 직접 생성한 페이지가 다음 전체 조회 결과에 아직 없더라도 유지
+    index.add("직접 생성", "p9")
+    monkeypatch.setattr(notion_index.settings, "notion_index_rebuild_interval", 0.0)
+    index.ensure_fresh(database.query)
+    
+    assert index.lookup("직접 생성") == "p9"
+    assert index.lookup("기존 페이지") == "p1"
+
+def test_discard_removes_stale_page():
+    index = NotionTitleIndex("db")
+    index.ensure_fresh(FakeDatabase([page("p1", "삭제된 페이지")]).query)
+    index.discard("p1")
+    assert index.lookup("삭제된 페이지") is None
+
+def test_duplicate_titles_keep_first_page():
+    index = NotionTitleIndex("db")
+    index.ensure_fresh(FakeDatabase([page("p1", "같은 제목"), page("p2", "같은 제목")]).query)
+    assert index.lookup("같은 제목") == "p1"
+
+def test_failed_build_is_not_trusted():
+    def broken(body):
+        raise ConnectionError("노션 연결 실패")
+    
+    index = NotionTitleIndex("db")
+    assert not index.ensure_fresh(broken)
@@ -0,0 +1,111 @@
+# 🧪 OpenAI Batch API 결과 처리 테스트
+
+import json
+
+import pytest
+
+from src.core.openai_batch import (
+    BatchJobError, LocalFileBatchBackend, parse_batch_output, parse_batch_usage,
+    run_batch_job, write_batch_requests
+)
+
+def output_line(custom_id, content=None, status_code=200, finish_reason="stop",
+                refusal=None, error=None, usage=None):
+    body = {
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content, "refusal": refusal},
+            "finish_reason": finish_reason
+        }]
+    }
+    if usage:
+        body["usage"] = usage
+    return json.dumps({
+        "custom_id": custom_id,
+        "response": {"status_code": status_code, "body": body} if not error else None,
+        "error": error
+    })
+
+def test_parse_batch_output():
+    text = "\n".join([
+        output_line("item-0", '{"status": "match_found"}'),
+        output_line("item-1", "잘린 응답", finish_reason="length"),
+        output_line("item-2", None, refusal="거부"),
+        output_line("item-3", error={"code": "server_error"}),
+        output_line("item-4", "오류", status_code=500),
+        ""
+    ])
+    assert parse_batch_output(text) == {
+        "item-0": '{"status": "match_found"}',
+        "item-1": None,
+        "item-2": None,
+        "item-3": None,
+        "item-4": None
+    }
+
+def test_parse_batch_usage():
+    usage = {"prompt_tokens": 120, "completion_tokens": 30, "total_tokens": 150}
+    text = "\n".join([
+        output_line("item-0", "{}", usage=usage),
+        output_line("item-1", "{}"),
+        output_line("item-2", error={"code": "server_error"})
+    ])
+    assert parse_batch_usage(text) == {"item-0": usage}
+
+def match_request(titles):
+    schema = {"properties": {"selected_title": {"enum": [*titles, None]}}}
+    return {"response_format": {"json_schema": {"schema": schema}}}
+
+def test_run_batch_job_with_local_backend(tmp_path):
+    input_path = str(tmp_path / "requests.jsonl")
+    write_batch_requests(input_path, [
+        ("item-0", match_request(["진격의 거인", "진격의 거인 시즌2"])),
+        ("item-1", match_request([]))
+    ])
+    
+    backend = LocalFileBatchBackend(str(tmp_path / "work"))
+    contents, usage = run_batch_job(backend, input_path, poll_interval=0, timeout=5)
+    
+    assert json.loads(contents["item-0"])["selected_title"] == "진격의 거인"
+    assert json.loads(contents["item-1"])["status"] == "no_match"
+    assert usage == {}
+    
+    # 제출한 작업 ID는 입력 파일 옆에 기록
+    job = json.loads((tmp_path / "requests_job.json").read_text(encoding="utf-8"))
+    assert job["batch_id"].startswith("batch_local_")
+
+class StuckBackend:
+    """완료되지 않는 작업 (시간 초과 처리 확인용)"""
+    name = "stuck"
+    
+    def __init__(self):
+        self.cancelled = []
+    
+    def submit(self, input_path):
+        return "batch_stuck"
+    
+    def status(self, batch_id):
+        return {"status": "in_progress", "completed": 0, "failed": 0, "total": 1}
+    
+    def cancel(self, batch_id):
+        self.cancelled.append(batch_id)
+
+def test_run_batch_job_timeout_cancels_and_reports_id(tmp_path):
+    input_path = str(tmp_path / "requests.jsonl")
+    write_batch_requests(input_path, [("item-0", match_request(["A"]))])
+    
+    backend = StuckBackend()
+    with pytest.raises(BatchJobError) as info:
+        run_batch_job(backend, input_path, poll_interval=0, timeout=0)
+    
+    assert info.value.batch_id == "batch_stuck"
+    assert backend.cancelled == ["batch_stuck"]
+
+def test_run_batch_job_submit_failure(tmp_path):
+    class FailingBackend(StuckBackend):
+        def submit(self, input_path):
+            raise ConnectionError("네트워크 오류")
+    
+    with pytest.raises(BatchJobError) as info:
+        run_batch_job(FailingBackend(), str(tmp_path / "requests.jsonl"), poll_interval=0, timeout=0)
+    assert info.value.batch_id is None
@@ -0,0 +1,88 @@
+# 🧪 토큰 버킷 속도 제한 테스트
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.core import rate_limit
+from src.core.rate_limit import TokenBucket
+
+@pytest.fixture
+def clock(monkeypatch):
+    """rate_limit 모듈이 보는 시계를 수동으로 진행하는 가짜 시계로 교체"""
+    state = SimpleNamespace(now=1000.0, slept=[])
+    
+    def sleep(seconds):
+        state.slept.append(seconds)
+        state.now += seconds
+    
+    monkeypatch.setattr(rate_limit, "time", SimpleNamespace(monotonic=lambda: state.now, sleep=sleep))
+    return state
+
+def test_burst_is_available_immediately(clock):
+    bucket = TokenBucket("test", rate=2.0, burst=3)
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.stats()["waited"] == 0
+
+def test_reservations_queue_in_order(clock):
+    bucket = TokenBucket("test", rate=2.0, burst=1)
+    assert bucket._reserve() == 0.0
+    # 초당 2개 충전: 다음 예약은 0.5초, 그다음은 1.0초 대기
+    assert bucket._reserve() == pytest.approx(0.5)
+    assert bucket._reserve() == pytest.approx(1.0)
+    
+    stats = bucket.stats()
+    assert stats["acquired"] == 3
+    assert stats["waited"] == 2
+    assert stats["max_wait"] == pytest.approx(1.0)
+
+def test_tokens_refill_over_time(clock):
+    bucket = TokenBucket("test", rate=1.0, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+    
+    clock.now += 1.5
+    assert bucket._reserve() == 0.0
+    # 남은 0.5개 → 다음 1개는 0.5초 뒤
+    assert bucket._reserve() == pytest.approx(0.5)
+
+def test_refill_is_capped_at_burst(clock):
+    bucket = TokenBucket("test", rate=10.0, burst=2)
+    clock.now += 60
+    assert bucket._reserve(2) == 0.0
+    assert bucket._reserve() == pytest.approx(0.1)
+
+def test_acquire_sleeps_for_wait(clock):
+    bucket = TokenBucket("test", rate=4.0, burst=1)
+    bucket.acquire()
+    assert bucket.acquire() == pytest.approx(0.25)
+    assert clock.slept == [pytest.approx(0.25)]
+
+def test_amount_larger_than_one(clock):
+    bucket = TokenBucket("tokens", rate=100.0, burst=1000)
+    assert bucket._reserve(800) == 0.0
+    assert bucket._reserve(400) == pytest.approx(2.0)
+
+def test_try_acquire_does_not_borrow(clock):
+    bucket = TokenBucket("test", rate=1.0, burst=1)
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+    
+    # 거절된 시도는 토큰을 빌리지 않으므로 1초 뒤 바로 사용 가능
+    clock.now += 1.0
+    assert bucket.try_acquire()
+    
+    stats = bucket.stats()
+    assert stats["acquired"] == 2
+    assert stats["rejected"] == 1
+
+def test_zero_rate_is_unlimited(clock):
+    bucket = TokenBucket("test", rate=0, burst=1)
+    assert all(bucket._reserve() == 0.0 for _ in range(100))
+    assert all(bucket.try_acquire() for _ in range(100))
+
+def test_per_minute_bucket(monkeypatch):
+    monkeypatch.setattr(rate_limit.settings, "openai_burst_seconds", 10.0)
+    bucket = rate_limit._per_minute_bucket("test_per_minute", 600)
+    assert bucket.rate == pytest.approx(10.0)
+    assert bucket.burst == pytest.approx(100.0)
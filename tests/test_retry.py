@@ -0,0 +1,155 @@
+# 🧪 공통 재시도 정책 테스트
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from src.core import retry
+from src.core.retry import (
+    HTTPStatusError, RetryBudget, RetryPolicy, RetryableError,
+    default_is_retryable, get_retry_after, parse_retry_after
+)
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """time.sleep 대신 대기 시간만 기록"""
+    recorded = []
+    monkeypatch.setattr(retry.time, "sleep", recorded.append)
+    return recorded
+
+def make_policy(**kwargs) -> RetryPolicy:
+    """예산 제한이 사실상 없는 테스트용 정책"""
+    kwargs.setdefault("budget", RetryBudget(ratio=1.0, min_per_second=0.0, max_tokens=100.0))
+    kwargs.setdefault("base_delay", 0.1)
+    kwargs.setdefault("max_delay", 2.0)
+    return RetryPolicy("테스트", **kwargs)
+
+def failing(errors, result="ok"):
+    """errors를 순서대로 발생시킨 뒤 result를 반환하는 함수"""
+    errors = list(errors)
+    calls = []
+    
+    def func():
+        calls.append(1)
+        if errors:
+            raise errors.pop(0)
+        return result
+    
+    func.calls = calls
+    return func
+
+def test_parse_retry_after_seconds():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(" 1.5 ") == 1.5
+    assert parse_retry_after("-2") == 0.0
+
+def test_parse_retry_after_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    wait = parse_retry_after(format_datetime(retry_at, usegmt=True))
+    assert 28 <= wait <= 30
+
+def test_parse_retry_after_invalid():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("soon") is None
+
+def test_get_retry_after_from_error():
+    assert get_retry_after(HTTPStatusError(429, "limited", retry_after=4.0)) == 4.0
+    assert get_retry_after(ValueError("x")) is None
+
+def test_default_is_retryable():
+    assert default_is_retryable(HTTPStatusError(429, "limited"))
+    assert default_is_retryable(HTTPStatusError(503, "unavailable"))
+    assert not default_is_retryable(HTTPStatusError(404, "not found"))
+    assert default_is_retryable(RetryableError("again"))
+    assert default_is_retryable(ConnectionError())
+    assert not default_is_retryable(ValueError())
+
+def test_next_delay_within_bounds():
+    policy = make_policy(base_delay=0.5, max_delay=4.0)
+    delay = policy.base_delay
+    for _ in range(50):
+        delay = policy.next_delay(delay)
+        assert 0.5 <= delay <= 4.0
+
+def test_call_retries_until_success(sleeps):
+    func = failing([HTTPStatusError(503, "down"), HTTPStatusError(502, "down")])
+    assert make_policy(max_attempts=3).call(func) == "ok"
+    assert len(func.calls) == 3
+    assert len(sleeps) == 2
+
+def test_call_stops_after_max_attempts(sleeps):
+    func = failing([HTTPStatusError(503, "down")] * 5)
+    with pytest.raises(HTTPStatusError):
+        make_policy(max_attempts=3).call(func)
+    assert len(func.calls) == 3
+
+def test_call_does_not_retry_non_retryable(sleeps):
+    func = failing([HTTPStatusError(400, "bad request")])
+    with pytest.raises(HTTPStatusError):
+        make_policy().call(func)
+    assert len(func.calls) == 1
+    assert sleeps == []
+
+def test_retry_after_is_honoured(sleeps):
+    func = failing([HTTPStatusError(429, "limited", retry_after=1.25)])
+    make_policy().call(func)
+    assert sleeps == [1.25]
+
+def test_retry_after_longer_than_backoff_cap_is_honoured(sleeps):
+    # Retry-After는 백오프 상한(max_delay)과 별도로 그대로 대기
+    func = failing([HTTPStatusError(429, "limited", retry_after=10.0)])
+    make_policy(max_delay=2.0, max_retry_after=30.0).call(func)
+    assert sleeps == [10.0]
+
+def test_retry_after_over_limit_fails_instead_of_capping(sleeps):
+    budget = RetryBudget(ratio=1.0, min_per_second=0.0, max_tokens=100.0)
+    func = failing([HTTPStatusError(429, "limited", retry_after=30.0)])
+    with pytest.raises(HTTPStatusError):
+        make_policy(max_retry_after=5.0, budget=budget).call(func)
+    assert len(func.calls) == 1
+    assert sleeps == []
+    # 재시도하지 않았으므로 예산도 쓰지 않음
+    assert budget.stats()["retries_allowed"] == 0
+
+def test_budget_exhaustion_stops_retries(sleeps):
+    budget = RetryBudget(ratio=0.0, min_per_second=0.0, max_tokens=1.0)
+    policy = make_policy(max_attempts=5, budget=budget)
+    
+    func = failing([HTTPStatusError(503, "down")] * 5)
+    with pytest.raises(HTTPStatusError):
+        policy.call(func)
+    
+    # 예산 1개로 재시도 1회만 허용
+    assert len(func.calls) == 2
+    assert budget.stats()["retries_rejected"] == 1
+
+def test_budget_accrues_per_request():
+    budget = RetryBudget(ratio=0.5, min_per_second=0.0, max_tokens=2.0)
+    assert budget.try_acquire()
+    assert budget.try_acquire()
+    assert not budget.try_acquire()
+    
+    budget.record_request()
+    budget.record_request()
+    assert budget.try_acquire()
+
+def test_acall_retries(monkeypatch):
+    import asyncio
+    
+    waits = []
+    
+    async def fake_sleep(seconds):
+        waits.append(seconds)
+    
+    monkeypatch.setattr(retry.asyncio, "sleep", fake_sleep)
+    errors = [HTTPStatusError(429, "limited", retry_after=0.5)]
+    
+    async def func():
+        if errors:
+            raise errors.pop()
+        return "ok"
+    
+    assert asyncio.run(make_policy().acall(func)) == "ok"
+    assert waits == [0.5]
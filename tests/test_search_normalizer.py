@@ -0,0 +1,46 @@
+# 🧪 라프텔 검색어 정규화 테스트
+
+import pytest
+
+from src.core.search_normalizer import primary_query, query_variants
+
+@pytest.mark.parametrize("user_input, expected", [
+    ("무직전생 2기", "무직전생"),
+    ("빈란드 사가 제2기", "빈란드 사가"),
+    ("축제 2기", "축제"),
+    ("스파이 패밀리 시즌 2 Part 2", "스파이 패밀리"),
+    ("Fate/Zero 2nd Season", "Fate/Zero"),
+    ("ＳＰＹ×ＦＡＭＩＬＹ", "SPY×FAMILY"),
+    ("  타코피의   원죄 ", "타코피의 원죄"),
+])
+def test_primary_query_strips_season_and_normalizes_width(user_input, expected):
+    assert primary_query(user_input) == expected
+
+def test_season_only_input_is_kept():
+    assert query_variants("2기") == ("2기",)
+
+def test_cross_mark_variants():
+    assert query_variants("SPY×FAMILY") == ("SPY×FAMILY", "SPY x FAMILY", "SPY FAMILY")
+    assert query_variants("HUNTER x HUNTER")[:2] == ("HUNTER x HUNTER", "HUNTER×HUNTER")
+
+def test_annotation_brackets_are_removed():
+    assert query_variants("귀멸의 칼날 (극장판)") == ("귀멸의 칼날 (극장판)", "귀멸의 칼날", "귀멸의칼날")
+    assert "최애의 아이" in query_variants("『최애의 아이』")
+
+def test_subtitle_and_punctuation_variants():
+    variants = query_variants("진격의 거인: 파이널 시즌")
+    assert variants[0] == "진격의 거인: 파이널 시즌"
+    assert "진격의 거인 파이널 시즌" in variants
+    assert "진격의 거인" in variants
+
+def test_title_colon_without_space_is_not_a_subtitle():
+    variants = query_variants("Re:제로부터 시작하는 이세계 생활 2기")
+    assert variants[0] == "Re:제로부터 시작하는 이세계 생활"
+    assert "Re" not in variants
+
+def test_variants_are_unique_case_insensitively():
+    variants = query_variants("Spy Family")
+    assert len({variant.casefold() for variant in variants}) == len(variants)
+
+def test_empty_input():
+    assert query_variants("   ") == ("   ",)
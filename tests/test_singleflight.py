@@ -0,0 +1,93 @@
+# 🧪 동일 요청 합치기 테스트
+
+import asyncio
+import threading
+
+import pytest
+
+from src.core.singleflight import AsyncSingleFlight, SingleFlight
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight("test")
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+    
+    def slow(value):
+        calls.append(value)
+        started.set()
+        release.wait(5)
+        return value * 2
+    
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("key", slow, 21)))
+    leader.start()
+    started.wait(5)
+    
+    followers = [threading.Thread(target=lambda: results.append(flight.do("key", slow, 21))) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    
+    # 대기자가 합류할 때까지 기다린 뒤 리더 실행 완료
+    while flight.stats()["coalesced"] < 3:
+        threading.Event().wait(0.01)
+    release.set()
+    
+    for thread in [leader, *followers]:
+        thread.join(5)
+    
+    assert calls == [21]
+    assert results == [42] * 4
+    assert flight.stats() == {"in_flight": 0, "coalesced": 3}
+
+def test_exception_is_shared_and_key_released():
+    flight = SingleFlight("test")
+    
+    def boom():
+        raise ValueError("실패")
+    
+    with pytest.raises(ValueError):
+        flight.do("key", boom)
+    
+    # 실패 후에는 새로 실행
+    assert flight.do("key", lambda: "ok") == "ok"
+    assert flight.stats()["in_flight"] == 0
+
+def test_sequential_calls_are_not_cached():
+    flight = SingleFlight("test")
+    calls = []
+    flight.do("key", calls.append, 1)
+    flight.do("key", calls.append, 2)
+    assert calls == [1, 2]
+
+def test_async_calls_share_one_task():
+    flight = AsyncSingleFlight("test")
+    calls = []
+    
+    async def fetch(value):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return value
+    
+    async def main():
+        return await asyncio.gather(*(flight.do("key", fetch, 7) for _ in range(5)))
+    
+    assert asyncio.run(main()) == [7] * 5
+    assert calls == [7]
+    assert flight.stats() == {"in_flight": 0, "coalesced": 4}
+
+def test_async_cancelled_waiter_does_not_cancel_shared_task():
+    flight = AsyncSingleFlight("test")
+    
+    async def fetch():
+        await asyncio.sleep(0.02)
+        return "done"
+    
+    async def main():
+        first = asyncio.ensure_future(flight.do("key", fetch))
+        second = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+    
+    assert asyncio.run(main()) == "done"